@@ -16,6 +16,7 @@ Run from the repository root:
 
 from __future__ import annotations
 
+import logging
 import sys
 from pathlib import Path
 
@@ -30,6 +31,9 @@ from pytlwall import MultipleChamber  # noqa: E402  (import after sys.path tweak
 
 def main() -> None:
     """Run the multiple chamber example workflow."""
+    # MultipleChamber reports progress through the logging module.
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
+
     script_dir = Path(__file__).resolve().parent
     input_dir = script_dir / "ex_multiple"
     output_dir = script_dir / "output_multiple"
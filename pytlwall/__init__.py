@@ -7,7 +7,7 @@ Main package initialization.
 from .beam import Beam, BeamValidationError, M_PROTON_MEV
 from .frequencies import Frequencies
 from .times import Times
-from .layer import Layer
+from .layer import Layer, LayerArray
 from .chamber import Chamber
 from .cfg_io import CfgIo
 from .tlwall import TlWall
@@ -27,6 +27,7 @@ __all__ = [
     'Frequencies',
     'Times',
     'Layer',
+    'LayerArray',
     'Chamber',
     'TlWall',
     'TLWallWake',
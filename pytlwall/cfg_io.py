@@ -10,9 +10,14 @@ Revised: December 2025
 Copyright: CERN
 """
 
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
 import configparser
+import functools
+import io
+import os
+import re
+import sys
 
 from pytlwall.chamber import Chamber
 from pytlwall.beam import Beam
@@ -22,6 +27,9 @@ from pytlwall.layer import Layer
 from pytlwall.tlwall import TlWall
 from pytlwall.tlwall_wake import TLWallWake
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # Allowed values for the CalcWake flag.
 # - 'impedance': calculate only the impedance (frequency-domain). Default.
@@ -32,6 +40,196 @@ CALC_WAKE = 'wake'
 CALC_BOTH = 'both'
 _VALID_CALC_FLAGS = (CALC_IMPEDANCE, CALC_WAKE, CALC_BOTH)
 
+# Chamber shape aliases accepted in [base_info] chamber_shape.
+# Valid shapes: CIRCULAR, ELLIPTICAL, RECTANGULAR
+_SHAPE_ALIASES = {
+    'ROUND': 'CIRCULAR',
+    'ELLIPTIC': 'ELLIPTICAL',
+    'RECT': 'RECTANGULAR',
+    'RECTANGLE': 'RECTANGULAR',
+}
+
+# Impedance flags recognised in the [output] section.
+_OUTPUT_IMPEDANCES = (
+    'ZLong', 'ZTrans', 'ZDipX', 'ZDipY',
+    'ZQuadX', 'ZQuadY', 'ZLongSurf', 'ZTransSurf',
+    'ZLongDSC', 'ZLongISC', 'ZTransDSC', 'ZTransISC',
+)
+
+# Layer types that carry Cole-Cole/resistive-wall material parameters.
+_CW_TYPES = frozenset({'CW', 'RW'})
+
+# Numbered output sections: [output1], [output2], ... and [img_output1], ...
+_OUTPUT_RE = re.compile(r'^output(\d+)$')
+_IMG_OUTPUT_RE = re.compile(r'^img_output(\d+)$')
+
+# Separator for impedance lists, absorbing the surrounding whitespace.
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Beam energy parameters in order of priority (first one found wins).
+_BEAM_ENERGY_KEYS = ('betarel', 'gammarel', 'Ekin_MeV', 'p_MeV_c')
+
+# Spellings of zero that mean "infinite" for k_Hz.
+_ZERO_STRS = frozenset({'0', '0.0', '0.00', '0e0'})
+
+# Separator values (lowercased) meaning "split on whitespace".
+_WHITESPACE_SEPARATORS = frozenset({'', 'whitespace'})
+
+# Cache of columns loaded from external frequency/time files, keyed by
+# (resolved path, mtime, size, separator, column, skip_rows). Files are
+# re-read only when they change on disk.
+_COLUMN_CACHE: Dict[Tuple[Any, ...], Any] = {}
+_COLUMN_CACHE_MAXSIZE = 32
+
+# Absolute paths found to exist by resolve_path (missing ones are not cached)
+_EXISTING_PATHS: Set[str] = set()
+_EXISTING_PATHS_MAXSIZE = 512
+
+# pandas module, False if not installed, None if not looked up yet.
+_PANDAS: Any = None
+
+
+def _optional_pandas() -> Any:
+    """
+    Import pandas on first use and remember the outcome.
+    
+    pandas is optional and slow to import, so it is never imported at
+    module load time. A failed import is also remembered, so that
+    sys.path is not searched again on every file read.
+    """
+    global _PANDAS
+    if _PANDAS is None:
+        try:
+            import pandas  # type: ignore
+            _PANDAS = pandas
+        except ImportError:  # pragma: no cover
+            _PANDAS = False
+    return _PANDAS or None
+
+
+def _load_table(file_path: Path, sep: Optional[str],
+                skip_rows: int) -> 'np.ndarray':
+    """
+    Load a numeric table from a text file as a float64 array.
+    
+    Uses the pandas C parser when pandas is installed and falls back to
+    numpy.loadtxt otherwise. The returned array has the same shape that
+    numpy.loadtxt would produce (1D for single-column or single-row files).
+    """
+    import numpy as np
+    
+    pd = _optional_pandas()
+    if pd is not None:
+        try:
+            data = pd.read_csv(
+                file_path,
+                sep=r'\s+' if sep is None else sep,
+                skiprows=skip_rows,
+                header=None,
+                comment='#',
+                dtype=np.float64,
+            ).to_numpy()
+            if data.ndim == 2 and 1 in data.shape:
+                data = data.ravel()
+            return data
+        except ValueError:
+            pass  # Fall back to numpy for unusual layouts
+    
+    return np.loadtxt(file_path, skiprows=skip_rows, delimiter=sep,
+                      dtype=np.float64)
+
+
+def _load_column(file_path: Path, sep: Optional[str], column: int,
+                 skip_rows: int) -> 'np.ndarray':
+    """
+    Load one column of a numeric text file, caching the result.
+    
+    Args:
+        file_path: File to read
+        sep: Column separator (None for whitespace)
+        column: 0-based column index (ignored for 1D data)
+        skip_rows: Number of header rows to skip
+    
+    Returns:
+        1D float64 numpy array (a fresh copy on every call)
+    """
+    stat = file_path.stat()
+    key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size,
+           sep, column, skip_rows)
+    values = _COLUMN_CACHE.get(key)
+    if values is None:
+        data = _load_table(file_path, sep, skip_rows)
+        values = data if data.ndim == 1 else data[:, column]
+        if len(_COLUMN_CACHE) >= _COLUMN_CACHE_MAXSIZE:
+            _COLUMN_CACHE.clear()
+        _COLUMN_CACHE[key] = values
+    return values.copy()
+
+
+def _path_exists(path: str) -> bool:
+    """
+    os.path.exists used by CfgIo.resolve_path, remembering found paths.
+    
+    Only paths that exist are cached, keyed by their absolute form, so a
+    later working-directory change or a newly created file is always seen.
+    Call CfgIo.invalidate_fs_cache() if resolved files are moved or deleted
+    while the same CfgIo workflow is running.
+    """
+    abs_path = os.path.abspath(path)
+    if abs_path in _EXISTING_PATHS:
+        return True
+    if not os.path.exists(abs_path):
+        return False
+    if len(_EXISTING_PATHS) >= _EXISTING_PATHS_MAXSIZE:
+        _EXISTING_PATHS.clear()
+    _EXISTING_PATHS.add(abs_path)
+    return True
+
+
+def _parse_float_or_inf(value: str, zero_is_inf: bool = False) -> float:
+    """
+    Parse a float option value that may denote infinity.
+    
+    float() already accepts 'inf'/'Inf'/'INF', so no lowercased copy of
+    the value is needed.
+    
+    Args:
+        value: Option value as read from the configuration
+        zero_is_inf: If True, a literal zero (e.g. '0', '0.0') means inf
+    
+    Returns:
+        Parsed float value
+    """
+    if zero_is_inf and value in _ZERO_STRS:
+        return float('inf')
+    return float(value)
+
+
+class _SectionValues(dict):
+    """
+    Raw options of one configuration section, interpolated on lookup.
+    
+    Only the options that are actually looked up are interpolated, so a
+    '%' in an unrelated option cannot break a read. Values without an
+    interpolation marker are returned as stored.
+    """
+    
+    def __init__(self, config: configparser.ConfigParser, section: str):
+        super().__init__(config.items(section, raw=True))
+        self._config = config
+        self._section = section
+    
+    def __getitem__(self, option: str) -> str:
+        value = super().__getitem__(option)
+        if '%' in value or '$' in value:
+            return self._config.get(self._section, option)
+        return value
+    
+    def get(self, option: str, default: Any = None) -> Any:
+        if option in self:
+            return self[option]
+        return default
+
 
 class ConfigurationError(Exception):
     """Exception raised for configuration-related errors."""
@@ -66,6 +264,8 @@ class CfgIo:
         >>> ZLong = wall.calc_ZLong()
     """
     
+    __slots__ = ('config', 'list_output', 'file_output', 'img_output')
+    
     def __init__(self, cfg_file: Optional[str] = None):
         """
         Initialize configuration handler.
@@ -115,20 +315,32 @@ class CfgIo:
         Returns:
             Resolved Path object
         """
-        file_path = Path(filename)
+        filename = os.fspath(filename)
         
         # If absolute or exists as-is, return it
-        if file_path.is_absolute() or file_path.exists():
-            return file_path
+        if os.path.isabs(filename) or _path_exists(filename):
+            return Path(filename)
         
-        # Try with main_path
-        if self.main_path is not None:
-            resolved = self.main_path / filename
-            if resolved.exists():
-                return resolved
+        # Try with main_path (string join, Path only built for the result)
+        main_path = self.main_path
+        if main_path is not None:
+            resolved = os.path.join(main_path, filename)
+            if _path_exists(resolved):
+                return Path(resolved)
         
         # Return original (will likely fail later with better error message)
-        return file_path
+        return Path(filename)
+    
+    @staticmethod
+    def invalidate_fs_cache() -> None:
+        """
+        Clear the cached file-existence checks used by resolve_path.
+        
+        Only files found to exist are cached, so this is needed when files
+        referenced by a configuration are moved or deleted after they have
+        already been resolved once.
+        """
+        _EXISTING_PATHS.clear()
     
     # =========================================================================
     # Core I/O Methods
@@ -152,6 +364,53 @@ class CfgIo:
         
         self.config.read(cfg_file)
     
+    # =========================================================================
+    # Section Snapshots
+    # =========================================================================
+    
+    def _section_values(self, section: str) -> _SectionValues:
+        """
+        Snapshot one section as a dictionary.
+        
+        Keys are normalised by config.optionxform (lowercase by default),
+        so the read_* methods can do dict lookups instead of repeated
+        ConfigParser calls. Values are interpolated only when looked up
+        (see _SectionValues).
+        The snapshot is taken on each read, so direct changes to
+        self.config are always seen.
+        
+        Args:
+            section: Configuration section name
+        
+        Returns:
+            Dictionary mapping option names to values
+        
+        Raises:
+            configparser.NoSectionError: If the section does not exist
+        """
+        return _SectionValues(self.config, section)
+    
+    def _required(self, values: Dict[str, str], section: str,
+                  option: str) -> str:
+        """
+        Look up a mandatory option in a section snapshot.
+        
+        Args:
+            values: Snapshot returned by _section_values
+            section: Section name (for the error message)
+            option: Option name (any case)
+        
+        Returns:
+            Option value
+        
+        Raises:
+            configparser.NoOptionError: If the option is missing
+        """
+        try:
+            return values[self.config.optionxform(option)]
+        except KeyError:
+            raise configparser.NoOptionError(option, section) from None
+    
     # =========================================================================
     # Chamber Reading
     # =========================================================================
@@ -178,40 +437,31 @@ class CfgIo:
             return None
         
         # Read base chamber parameters
-        pipe_len_m = self.config.getfloat('base_info', 'pipe_len_m')
-        chamber_shape_raw = self.config.get('base_info', 'chamber_shape')
+        base = self._section_values('base_info')
+        pipe_len_m = float(self._required(base, 'base_info', 'pipe_len_m'))
+        chamber_shape_raw = self._required(base, 'base_info', 'chamber_shape')
         
         # Normalize chamber shape names (support common aliases)
-        # Valid shapes: CIRCULAR, ELLIPTICAL, RECTANGULAR
-        # Aliases: ROUND -> CIRCULAR, ELLIPTIC -> ELLIPTICAL, RECT -> RECTANGULAR
-        SHAPE_ALIASES = {
-            'ROUND': 'CIRCULAR',
-            'ELLIPTIC': 'ELLIPTICAL',
-            'RECT': 'RECTANGULAR',
-            'RECTANGLE': 'RECTANGULAR'
-        }
-        chamber_shape = SHAPE_ALIASES.get(chamber_shape_raw, chamber_shape_raw)
+        chamber_shape = sys.intern(
+            _SHAPE_ALIASES.get(chamber_shape_raw, chamber_shape_raw)
+        )
         
-        betax = self.config.getfloat('base_info', 'betax')
-        betay = self.config.getfloat('base_info', 'betay')
+        betax = float(self._required(base, 'base_info', 'betax'))
+        betay = float(self._required(base, 'base_info', 'betay'))
         
         # Component name (optional)
-        component_name = self.config.get(
-            'base_info', 'component_name', fallback='chamber'
-        )
+        component_name = sys.intern(base.get('component_name', 'chamber'))
         
         # Pipe dimensions
-        if self.config.has_option('base_info', 'pipe_radius_m'):
-            pipe_rad_m = self.config.getfloat('base_info', 'pipe_radius_m')
+        if 'pipe_radius_m' in base:
+            pipe_rad_m = float(base['pipe_radius_m'])
             pipe_hor_m = pipe_rad_m
             pipe_ver_m = pipe_rad_m
         else:
             # For non-circular chambers, read hor and ver separately
-            pipe_ver_m = self.config.getfloat('base_info', 'pipe_ver_m')
-            pipe_hor_m = pipe_ver_m  # default, will be overwritten if pipe_hor_m exists
-            
-            if self.config.has_option('base_info', 'pipe_hor_m'):
-                pipe_hor_m = self.config.getfloat('base_info', 'pipe_hor_m')
+            pipe_ver_m = float(self._required(base, 'base_info', 'pipe_ver_m'))
+            # pipe_hor_m defaults to pipe_ver_m
+            pipe_hor_m = float(base.get('pipe_hor_m', pipe_ver_m))
             
             # For non-circular, use smaller dimension as radius for calculations
             pipe_rad_m = min(pipe_hor_m, pipe_ver_m)
@@ -242,18 +492,30 @@ class CfgIo:
             List of Layer objects
         
         Raises:
-            ConfigurationError: If layers_info section not found
+            ConfigurationError: If layers_info section or one of the
+                nbr_layers layer sections is not found
         """
         if not self.config.has_section('layers_info'):
             raise ConfigurationError("Section 'layers_info' not found")
         
         nbr_layers = self.config.getint('layers_info', 'nbr_layers')
-        layers = []
         
-        # Read regular layers
+        # Collect the layerN sections in one pass over the parsed sections
+        layer_sections: Dict[int, str] = {}
+        for name in self.config.sections():
+            if name.startswith('layer') and name[5:].isdigit():
+                layer_sections[int(name[5:])] = name
+        
+        # Read regular layers (nbr_layers is the authoritative count)
+        layers: List[Layer] = []
         for i in range(nbr_layers):
-            layer = self._read_single_layer(f'layer{i}', boundary=False)
-            layers.append(layer)
+            section = layer_sections.get(i)
+            if section is None:
+                raise ConfigurationError(
+                    f"Section 'layer{i}' not found "
+                    f"(nbr_layers = {nbr_layers})"
+                )
+            layers.append(self._read_single_layer(section, boundary=False))
         
         # Read boundary layer
         boundary_layer = self._read_single_layer('boundary', boundary=True)
@@ -276,78 +538,45 @@ class CfgIo:
             Supports thick_m = inf for semi-infinite layers
             Boundary layers NEVER have thickness regardless of type
         """
-        layer_type = self.config.get(section, 'type')
+        values = self._section_values(section)
+        
+        # Layer types repeat across sections and sweeps: intern them
+        layer_type = sys.intern(self._required(values, section, 'type'))
         
         # CRITICAL: Boundaries NEVER have thickness, regardless of type
         if boundary:
             # CW and RW boundaries need CW parameters but NO thickness
-            if layer_type in ('CW', 'RW'):
-                # Handle k_Hz = 0 (should be inf)
-                k_Hz_str = self.config.get(section, 'k_Hz')
-                if k_Hz_str == '0' or k_Hz_str == '0.0':
-                    k_Hz = float('inf')
-                else:
-                    k_Hz = self.config.getfloat(section, 'k_Hz')
-                
+            if layer_type in _CW_TYPES:
                 # For RW, Layer class expects 'CW' as type
-                effective_type = 'CW'
-                
                 return Layer(
-                    layer_type=effective_type,
-                    muinf_Hz=self.config.getfloat(section, 'muinf_Hz'),
-                    epsr=self.config.getfloat(section, 'epsr'),
-                    sigmaDC=self.config.getfloat(section, 'sigmaDC'),
-                    k_Hz=k_Hz,
-                    tau=self.config.getfloat(section, 'tau'),
-                    RQ=self.config.getfloat(section, 'RQ'),
-                    boundary=True
+                    layer_type='CW',
+                    boundary=True,
+                    **self._read_cw_params(values, section)
                 )
             else:
                 # PEC, PMC, V boundaries - just type
                 return Layer(layer_type=layer_type, boundary=True)
         
-        # Regular layers (non-boundary) MUST have thickness
-        # Support both thick_m and thick_M (case variations in config files)
-        if self.config.has_option(section, 'thick_m'):
-            thick_str = self.config.get(section, 'thick_m')
-            # Handle 'inf' as infinite thickness
-            if thick_str.lower() == 'inf':
-                thick_m = float('inf')
-            else:
-                thick_m = float(thick_str)
-        elif self.config.has_option(section, 'thick_M'):
-            thick_str = self.config.get(section, 'thick_M')
-            if thick_str.lower() == 'inf':
-                thick_m = float('inf')
-            else:
-                thick_m = float(thick_str)
-        else:
+        # Regular layers (non-boundary) MUST have thickness.
+        # Option names are case-insensitive, so this also matches thick_M.
+        thick_m: float
+        thick_str = values.get('thick_m')
+        if thick_str is None:
             thick_m = 0.001  # Default 1mm if not specified
+        else:
+            # Handle 'inf' as infinite thickness
+            thick_m = _parse_float_or_inf(thick_str)
         
         # CW and RW have the same parameters
-        if layer_type in ('CW', 'RW'):
-            # Cole-Cole-Wideband or Resistive-Wall material
-            # Handle k_Hz = 0 (should be inf)
-            k_Hz_str = self.config.get(section, 'k_Hz')
-            if k_Hz_str == '0' or k_Hz_str == '0.0':
-                k_Hz = float('inf')
-            else:
-                k_Hz = self.config.getfloat(section, 'k_Hz')
-            
-            # For RW, Layer class expects 'CW' as type
+        if layer_type in _CW_TYPES:
+            # Cole-Cole-Wideband or Resistive-Wall material.
+            # Layer class uses 'CW' for both CW and RW
             # (RW is handled internally by Layer as a variant of CW)
-            effective_type = 'CW'  # Layer class uses 'CW' for both CW and RW
-            
             layer = Layer(
-                layer_type=effective_type,
+                layer_type='CW',
                 thick_m=thick_m,
-                muinf_Hz=self.config.getfloat(section, 'muinf_Hz'),
-                epsr=self.config.getfloat(section, 'epsr'),
-                sigmaDC=self.config.getfloat(section, 'sigmaDC'),
-                k_Hz=k_Hz,
-                tau=self.config.getfloat(section, 'tau'),
-                RQ=self.config.getfloat(section, 'RQ'),
-                boundary=False
+                boundary=False,
+                **self._read_cw_params(values, section)
             )
         else:
             # Simple material (V, PEC, PMC)
@@ -359,6 +588,31 @@ class CfgIo:
         
         return layer
     
+    def _read_cw_params(self, values: Dict[str, str],
+                        section: str) -> Dict[str, float]:
+        """
+        Read the material parameters of a CW/RW layer.
+        
+        Args:
+            values: Snapshot of the section (see _section_values)
+            section: Configuration section name
+        
+        Returns:
+            Dictionary of Layer keyword arguments
+        
+        Note:
+            k_Hz = 0 is interpreted as k_Hz = inf
+        """
+        get = functools.partial(self._required, values, section)
+        return {
+            'muinf_Hz': float(get('muinf_Hz')),
+            'epsr': float(get('epsr')),
+            'sigmaDC': float(get('sigmaDC')),
+            'k_Hz': _parse_float_or_inf(get('k_Hz'), zero_is_inf=True),
+            'tau': float(get('tau')),
+            'RQ': float(get('RQ')),
+        }
+    
     # =========================================================================
     # Beam Reading
     # =========================================================================
@@ -384,65 +638,32 @@ class CfgIo:
         if not self.config.has_section('beam_info'):
             return None
         
-        # Read test beam shift
-        test_beam_shift = self.config.getfloat('beam_info', 'test_beam_shift')
+        beam = self._section_values('beam_info')
         
-        # Read mass (optional)
-        mass_MeV_c2 = self.config.getfloat(
-            'beam_info', 'mass_MeV_c2', fallback=None
+        # Read test beam shift
+        test_beam_shift = float(
+            self._required(beam, 'beam_info', 'test_beam_shift')
         )
         
-        # Priority order: betarel > gammarel > Ekin_MeV > p_MeV_c
-        if self.config.has_option('beam_info', 'betarel'):
-            betarel = self.config.getfloat('beam_info', 'betarel')
-            beam = Beam(
-                betarel=betarel,
-                test_beam_shift=test_beam_shift,
-                mass_MeV_c2=mass_MeV_c2
-            ) if mass_MeV_c2 else Beam(
-                betarel=betarel,
-                test_beam_shift=test_beam_shift
-            )
-        
-        elif self.config.has_option('beam_info', 'gammarel'):
-            gammarel = self.config.getfloat('beam_info', 'gammarel')
-            beam = Beam(
-                gammarel=gammarel,
-                test_beam_shift=test_beam_shift,
-                mass_MeV_c2=mass_MeV_c2
-            ) if mass_MeV_c2 else Beam(
-                gammarel=gammarel,
-                test_beam_shift=test_beam_shift
-            )
-        
-        elif self.config.has_option('beam_info', 'Ekin_MeV'):
-            Ekin_MeV = self.config.getfloat('beam_info', 'Ekin_MeV')
-            beam = Beam(
-                Ekin_MeV=Ekin_MeV,
-                test_beam_shift=test_beam_shift,
-                mass_MeV_c2=mass_MeV_c2
-            ) if mass_MeV_c2 else Beam(
-                Ekin_MeV=Ekin_MeV,
-                test_beam_shift=test_beam_shift
-            )
+        beam_kwargs: Dict[str, float] = {'test_beam_shift': test_beam_shift}
         
-        elif self.config.has_option('beam_info', 'p_MeV_c'):
-            p_MeV_c = self.config.getfloat('beam_info', 'p_MeV_c')
-            beam = Beam(
-                p_MeV_c=p_MeV_c,
-                test_beam_shift=test_beam_shift,
-                mass_MeV_c2=mass_MeV_c2
-            ) if mass_MeV_c2 else Beam(
-                p_MeV_c=p_MeV_c,
-                test_beam_shift=test_beam_shift
-            )
+        # Read mass (optional)
+        mass_str = beam.get(self.config.optionxform('mass_MeV_c2'))
+        if mass_str is not None and float(mass_str):
+            beam_kwargs['mass_MeV_c2'] = float(mass_str)
         
+        # Priority order: betarel > gammarel > Ekin_MeV > p_MeV_c
+        for key in _BEAM_ENERGY_KEYS:
+            value = beam.get(self.config.optionxform(key))
+            if value is not None:
+                beam_kwargs[key] = float(value)
+                break
         else:
             raise ConfigurationError(
                 "No valid beam parameter found in beam_info section"
             )
         
-        return beam
+        return Beam(**beam_kwargs)
     
     # =========================================================================
     # Frequency Reading
@@ -476,13 +697,11 @@ class CfgIo:
         
         # Priority 1: frequency_file section (read from file)
         if self.config.has_section('frequency_file'):
-            import numpy as np
-            
             filename = self.config.get('frequency_file', 'filename')
             
             # Handle separator
             sep = self.config.get('frequency_file', 'separator', fallback='')
-            if sep == '' or sep.lower() == 'whitespace':
+            if sep.lower() in _WHITESPACE_SEPARATORS:
                 sep = None  # Use whitespace delimiter
             
             freq_col = self.config.getint('frequency_file', 'freq_col', fallback=0)
@@ -494,21 +713,13 @@ class CfgIo:
             if not file_path.exists():
                 raise ConfigurationError(f"Frequency file not found: {filename}")
             
-            # Load data
-            if sep is None:
-                data = np.loadtxt(file_path, skiprows=skip_rows)
-            else:
-                data = np.loadtxt(file_path, skiprows=skip_rows, delimiter=sep)
-            
-            # Extract frequency column
-            if data.ndim == 1:
-                freqs = data
-            else:
-                freqs = data[:, freq_col]
+            # Load frequency column
+            freqs = _load_column(file_path, sep, freq_col, skip_rows)
             
             # Create Frequencies object with custom array
             freq = Frequencies()
             freq._freq = freqs  # Use private attribute since freq is read-only property
+            freqs.setflags(write=False)  # Same contract as Frequencies.freq
             
             # Store metadata for potential saving
             if not hasattr(freq, 'filename'):
@@ -626,13 +837,11 @@ class CfgIo:
         
         # Priority 1: time_file section (read from file)
         if self.config.has_section('time_file'):
-            import numpy as np
-            
             filename = self.config.get('time_file', 'filename')
             
             # Handle separator
             sep = self.config.get('time_file', 'separator', fallback='')
-            if sep == '' or sep.lower() == 'whitespace':
+            if sep.lower() in _WHITESPACE_SEPARATORS:
                 sep = None  # Use whitespace delimiter
             
             time_col = self.config.getint('time_file', 'time_col', fallback=0)
@@ -644,17 +853,8 @@ class CfgIo:
             if not file_path.exists():
                 raise ConfigurationError(f"Time file not found: {filename}")
             
-            # Load data
-            if sep is None:
-                data = np.loadtxt(file_path, skiprows=skip_rows)
-            else:
-                data = np.loadtxt(file_path, skiprows=skip_rows, delimiter=sep)
-            
-            # Extract time column
-            if data.ndim == 1:
-                time_array = data
-            else:
-                time_array = data[:, time_col]
+            # Load time column
+            time_array = _load_column(file_path, sep, time_col, skip_rows)
             
             # Create Times object from the explicit array
             times = Times(time_list=time_array)
@@ -686,6 +886,22 @@ class CfgIo:
     # Chamber Writing
     # =========================================================================
     
+    def _set_options(self, section: str, options: Dict[str, Any]) -> None:
+        """
+        Store several options of one section in a single call.
+        
+        The section is created if needed and existing options with the
+        same names are overwritten.
+        
+        Args:
+            section: Configuration section name
+            options: Mapping of option names to values (converted with str)
+        """
+        self.config.read_dict(
+            {section: {key: str(value) for key, value in options.items()}}
+        )
+    
+    
     def save_chamber(self, chamber: Chamber) -> None:
         """
         Save chamber configuration to config object.
@@ -693,21 +909,22 @@ class CfgIo:
         Args:
             chamber: Chamber object to save
         """
-        if not self.config.has_section('base_info'):
-            self.config.add_section('base_info')
-        
-        self.config.set('base_info', 'component_name', chamber.component_name)
-        self.config.set('base_info', 'chamber_shape', chamber.chamber_shape)
-        self.config.set('base_info', 'pipe_len_m', str(chamber.pipe_len_m))
-        self.config.set('base_info', 'betax', str(chamber.betax))
-        self.config.set('base_info', 'betay', str(chamber.betay))
+        options = {
+            'component_name': chamber.component_name,
+            'chamber_shape': chamber.chamber_shape,
+            'pipe_len_m': chamber.pipe_len_m,
+            'betax': chamber.betax,
+            'betay': chamber.betay,
+        }
         
         # Save dimensions based on shape
         if chamber.chamber_shape == 'CIRCULAR':
-            self.config.set('base_info', 'pipe_radius_m', str(chamber.pipe_rad_m))
+            options['pipe_radius_m'] = chamber.pipe_rad_m
         else:
-            self.config.set('base_info', 'pipe_hor_m', str(chamber.pipe_hor_m))
-            self.config.set('base_info', 'pipe_ver_m', str(chamber.pipe_ver_m))
+            options['pipe_hor_m'] = chamber.pipe_hor_m
+            options['pipe_ver_m'] = chamber.pipe_ver_m
+        
+        self._set_options('base_info', options)
     
     def save_layer(self, layers: List[Layer]) -> None:
         """
@@ -716,23 +933,14 @@ class CfgIo:
         Args:
             layers: List of Layer objects to save
         """
-        if not self.config.has_section('layers_info'):
-            self.config.add_section('layers_info')
-        
         # Save number of regular layers (excluding boundary)
-        self.config.set('layers_info', 'nbr_layers', str(len(layers) - 1))
+        self._set_options('layers_info', {'nbr_layers': len(layers) - 1})
         
         # Save regular layers
         for i in range(len(layers) - 1):
-            section = f'layer{i}'
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            
-            self._save_single_layer(section, layers[i])
+            self._save_single_layer(f'layer{i}', layers[i])
         
         # Save boundary layer
-        if not self.config.has_section('boundary'):
-            self.config.add_section('boundary')
         self._save_single_layer('boundary', layers[-1])
     
     def _save_single_layer(self, section: str, layer: Layer) -> None:
@@ -743,25 +951,25 @@ class CfgIo:
             section: Configuration section name
             layer: Layer object to save
         """
-        self.config.set(section, 'type', layer.layer_type)
+        options: Dict[str, Any] = {'type': layer.layer_type}
         
         # Only save thickness for non-boundary layers
         # Check if boundary attribute exists (for backward compatibility)
         is_boundary = getattr(layer, 'boundary', False)
         if not is_boundary and layer.thick_m is not None:
-            if layer.thick_m == float('inf'):
-                self.config.set(section, 'thick_m', 'inf')
-            else:
-                self.config.set(section, 'thick_m', str(layer.thick_m))
+            # str(float('inf')) is already 'inf'
+            options['thick_m'] = layer.thick_m
         
         # Save CW parameters if applicable
         if layer.layer_type == 'CW':
-            self.config.set(section, 'muinf_Hz', str(layer.muinf_Hz))
-            self.config.set(section, 'k_Hz', str(layer.k_Hz))
-            self.config.set(section, 'sigmaDC', str(layer.sigmaDC))
-            self.config.set(section, 'epsr', str(layer.epsr))
-            self.config.set(section, 'tau', str(layer.tau))
-            self.config.set(section, 'RQ', str(layer.RQ))
+            options['muinf_Hz'] = layer.muinf_Hz
+            options['k_Hz'] = layer.k_Hz
+            options['sigmaDC'] = layer.sigmaDC
+            options['epsr'] = layer.epsr
+            options['tau'] = layer.tau
+            options['RQ'] = layer.RQ
+        
+        self._set_options(section, options)
     
     # =========================================================================
     # Beam Writing
@@ -774,15 +982,14 @@ class CfgIo:
         Args:
             beam: Beam object to save
         """
-        if not self.config.has_section('beam_info'):
-            self.config.add_section('beam_info')
-        
-        self.config.set('beam_info', 'test_beam_shift', str(beam.test_beam_shift))
-        self.config.set('beam_info', 'betarel', str(beam.betarel))
-        self.config.set('beam_info', 'gammarel', str(beam.gammarel))
-        self.config.set('beam_info', 'mass_MeV_c2', str(beam.mass_MeV_c2))
-        self.config.set('beam_info', 'Ekin_MeV', str(beam.Ekin_MeV))
-        self.config.set('beam_info', 'p_MeV_c', str(beam.p_MeV_c))
+        self._set_options('beam_info', {
+            'test_beam_shift': beam.test_beam_shift,
+            'betarel': beam.betarel,
+            'gammarel': beam.gammarel,
+            'mass_MeV_c2': beam.mass_MeV_c2,
+            'Ekin_MeV': beam.Ekin_MeV,
+            'p_MeV_c': beam.p_MeV_c,
+        })
     
     # =========================================================================
     # Frequency Writing
@@ -798,17 +1005,17 @@ class CfgIo:
         
         # Check if frequencies from file or range
         if hasattr(freq, 'filename'):
-            if not self.config.has_section('frequency_file'):
-                self.config.add_section('frequency_file')
-            self.config.set('frequency_file', 'filename', freq.filename)
-            self.config.set('frequency_file', 'freq_column', str(freq.freq_column))
-            self.config.set('frequency_file', 'skipped_rows', str(freq.skipped_rows))
+            self._set_options('frequency_file', {
+                'filename': freq.filename,
+                'freq_column': freq.freq_column,
+                'skipped_rows': freq.skipped_rows,
+            })
         else:
-            if not self.config.has_section('frequency_info'):
-                self.config.add_section('frequency_info')
-            self.config.set('frequency_info', 'fmin', str(int(freq.fmin)))
-            self.config.set('frequency_info', 'fmax', str(int(freq.fmax)))
-            self.config.set('frequency_info', 'fstep', str(int(freq.fstep)))
+            self._set_options('frequency_info', {
+                'fmin': int(freq.fmin),
+                'fmax': int(freq.fmax),
+                'fstep': int(freq.fstep),
+            })
     
     # =========================================================================
     # Times Writing
@@ -823,19 +1030,17 @@ class CfgIo:
         """
         # Times read from a file expose a 'filename' attribute.
         if hasattr(times, 'filename'):
-            if not self.config.has_section('time_file'):
-                self.config.add_section('time_file')
-            self.config.set('time_file', 'filename', times.filename)
-            self.config.set('time_file', 'time_col',
-                            str(getattr(times, 'time_column', 0)))
-            self.config.set('time_file', 'skip_rows',
-                            str(getattr(times, 'skipped_rows', 0)))
+            self._set_options('time_file', {
+                'filename': times.filename,
+                'time_col': getattr(times, 'time_column', 0),
+                'skip_rows': getattr(times, 'skipped_rows', 0),
+            })
         else:
-            if not self.config.has_section('time_info'):
-                self.config.add_section('time_info')
-            self.config.set('time_info', 'tmin_exp', str(times.tmin_exp))
-            self.config.set('time_info', 'tmax_exp', str(times.tmax_exp))
-            self.config.set('time_info', 'n_points', str(int(times.n_points)))
+            self._set_options('time_info', {
+                'tmin_exp': times.tmin_exp,
+                'tmax_exp': times.tmax_exp,
+                'n_points': int(times.n_points),
+            })
     
     def save_calc_flag(self, flag: str) -> None:
         """
@@ -854,9 +1059,7 @@ class CfgIo:
                 f"Allowed values are: {', '.join(_VALID_CALC_FLAGS)}."
             )
         
-        if not self.config.has_section('calc_info'):
-            self.config.add_section('calc_info')
-        self.config.set('calc_info', 'CalcWake', flag)
+        self._set_options('calc_info', {'CalcWake': flag})
     
     # =========================================================================
     # Output Configuration
@@ -908,19 +1111,12 @@ class CfgIo:
         if cfg_file is not None:
             self.read_cfg(cfg_file)
         
-        # List of available impedance types
-        output_list = [
-            'ZLong', 'ZTrans', 'ZDipX', 'ZDipY',
-            'ZQuadX', 'ZQuadY', 'ZLongSurf', 'ZTransSurf',
-            'ZLongDSC', 'ZLongISC', 'ZTransDSC', 'ZTransISC'
-        ]
-        
         # Read which impedances to calculate
-        self.list_output = []
-        for imped in output_list:
-            if (self.config.has_option('output', imped) and
-                self.config.getboolean('output', imped)):
-                self.list_output.append(imped)
+        getboolean = self.config.getboolean
+        self.list_output = [
+            imped for imped in _OUTPUT_IMPEDANCES
+            if getboolean('output', imped, fallback=False)
+        ]
         
         # Read file output specifications
         self._read_file_outputs()
@@ -928,81 +1124,111 @@ class CfgIo:
         # Read image output specifications
         self._read_image_outputs()
     
+    def _numbered_sections(self, pattern: re.Pattern) -> List[str]:
+        """
+        Return the numbered sections matching pattern, in index order.
+        
+        Sections are scanned in a single pass. Numbering starts at 1 and
+        stops at the first missing index.
+        
+        Args:
+            pattern: Compiled regex with the section index as group 1
+        
+        Returns:
+            List of section names
+        """
+        found: Dict[int, str] = {}
+        for name in self.config.sections():
+            match = pattern.match(name)
+            if match:
+                found[int(match.group(1))] = name
+        
+        sections: List[str] = []
+        i = 1
+        while i in found:
+            sections.append(found[i])
+            i += 1
+        return sections
+    
+    def _parse_imped_field(self, section: str, option: str) -> List[str]:
+        """
+        Parse a comma-separated impedance list option.
+        
+        Args:
+            section: Configuration section name
+            option: Option holding the list (e.g. 'output_list')
+        
+        Returns:
+            List of impedance names with surrounding whitespace removed
+            (empty items are kept, so they reach the validation)
+        """
+        raw = self.config.get(section, option).strip()
+        return _COMMA_SPLIT_RE.split(raw)
+    
+    def _resolve_prefix(self, section: str,
+                        component_name: Optional[str]) -> str:
+        """
+        Return the output prefix for a section.
+        
+        Args:
+            section: Configuration section name
+            component_name: Component name read once by the caller, or
+                None if it is not set
+        
+        Returns:
+            component_name when use_name_flag is True, otherwise ''
+        
+        Raises:
+            configparser.NoSectionError: If use_name_flag is True and there
+                is no [base_info] section
+            configparser.NoOptionError: If use_name_flag is True and
+                component_name is not set
+        """
+        if not self.config.getboolean(section, 'use_name_flag', fallback=False):
+            return ''
+        if component_name is None:
+            # Raises the error for the missing section or option
+            return self.config.get('base_info', 'component_name')
+        return component_name
+    
+    def _component_name(self) -> Optional[str]:
+        """Return [base_info] component_name, or None if not set."""
+        return self.config.get('base_info', 'component_name', fallback=None)
+    
     def _read_file_outputs(self) -> None:
         """Read file output specifications from config."""
         self.file_output = {}
-        i = 1
+        component_name = self._component_name()
         
-        while self.config.has_section(f'output{i}'):
-            section = f'output{i}'
+        for section in self._numbered_sections(_OUTPUT_RE):
             filename = self.config.get(section, 'output_name')
-            
             self.file_output[filename] = {
-                'imped': [],
-                'prefix': ''
+                'imped': self._parse_imped_field(section, 'output_list'),
+                'prefix': self._resolve_prefix(section, component_name)
             }
-            
-            # Check if using component name as prefix
-            if (self.config.has_option(section, 'use_name_flag') and
-                self.config.getboolean(section, 'use_name_flag')):
-                self.file_output[filename]['prefix'] = self.config.get(
-                    'base_info', 'component_name'
-                )
-            
-            # Parse impedance list
-            imped_list = self.config.get(section, 'output_list').split(',')
-            for imped in imped_list:
-                self.file_output[filename]['imped'].append(imped.strip())
-            
-            i += 1
     
     def _read_image_outputs(self) -> None:
         """Read image output specifications from config."""
         self.img_output = {}
-        i = 1
+        get = self.config.get
+        component_name = self._component_name()
         
-        while self.config.has_section(f'img_output{i}'):
-            section = f'img_output{i}'
-            filename = self.config.get(section, 'img_name')
-            
-            self.img_output[filename] = {
-                'imped': [],
-                'prefix': '',
-                'real_imag': 'both',
-                'title': None,
-                'xscale': 'lin',
-                'yscale': 'lin'
-            }
-            
-            # Check if using component name as prefix
-            if (self.config.has_option(section, 'use_name_flag') and
-                self.config.getboolean(section, 'use_name_flag')):
-                self.img_output[filename]['prefix'] = self.config.get(
-                    'base_info', 'component_name'
-                )
+        for section in self._numbered_sections(_IMG_OUTPUT_RE):
+            filename = get(section, 'img_name')
             
             # Parse real/imag flag
-            if self.config.has_option(section, 're_im_flag'):
-                re_im = self.config.get(section, 're_im_flag').lower()
-                if re_im in ['real', 'imag', 'both']:
-                    self.img_output[filename]['real_imag'] = re_im
-            
-            # Parse optional parameters
-            if self.config.has_option(section, 'title'):
-                self.img_output[filename]['title'] = self.config.get(section, 'title')
-            
-            if self.config.has_option(section, 'xscale'):
-                self.img_output[filename]['xscale'] = self.config.get(section, 'xscale')
+            re_im = get(section, 're_im_flag', fallback='both').lower()
+            if re_im not in ('real', 'imag', 'both'):
+                re_im = 'both'
             
-            if self.config.has_option(section, 'yscale'):
-                self.img_output[filename]['yscale'] = self.config.get(section, 'yscale')
-            
-            # Parse impedance list
-            imped_list = self.config.get(section, 'imped_list').split(',')
-            for imped in imped_list:
-                self.img_output[filename]['imped'].append(imped.strip())
-            
-            i += 1
+            self.img_output[filename] = {
+                'imped': self._parse_imped_field(section, 'imped_list'),
+                'prefix': self._resolve_prefix(section, component_name),
+                'real_imag': re_im,
+                'title': get(section, 'title', fallback=None),
+                'xscale': get(section, 'xscale', fallback='lin'),
+                'yscale': get(section, 'yscale', fallback='lin')
+            }
     
     def save_calc(self, list_calc: Dict[str, bool]) -> None:
         """
@@ -1011,15 +1237,8 @@ class CfgIo:
         Args:
             list_calc: Dictionary mapping impedance names to boolean flags
         """
-        self.list_output = []
-        
-        if not self.config.has_section('output'):
-            self.config.add_section('output')
-        
-        for imped, calc in list_calc.items():
-            self.config.set('output', imped, str(calc))
-            if calc:
-                self.list_output.append(imped)
+        self._set_options('output', list_calc)
+        self.list_output = [imped for imped, calc in list_calc.items() if calc]
     
     # =========================================================================
     # High-Level Operations
@@ -1152,18 +1371,26 @@ class CfgIo:
         
         Args:
             filename: Output file path
+        
+        Note:
+            The configuration is serialised in memory first and written
+            with a single call, so a failure while formatting leaves any
+            existing file untouched.
         """
+        buffer = io.StringIO()
+        self.config.write(buffer)
         with open(filename, 'w') as f:
-            self.config.write(f)
+            f.write(buffer.getvalue())
     
     def __repr__(self) -> str:
         """String representation of CfgIo object."""
-        sections = list(self.config.sections())
-        return f"CfgIo(sections={sections})"
+        # sections() already returns a fresh list; no cache is kept because
+        # callers (e.g. the GUI) mutate self.config directly.
+        return f"CfgIo(sections={self.config.sections()})"
     
     def __str__(self) -> str:
         """Human-readable string representation."""
-        sections = list(self.config.sections())
+        sections = self.config.sections()
         return f"CfgIo with {len(sections)} sections: {', '.join(sections)}"
 
 
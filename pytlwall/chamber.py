@@ -11,22 +11,13 @@ their associated Yokoya factors for impedance calculations.
 @copyright: CERN
 """
 
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+import importlib
 from dataclasses import dataclass, field
 import numpy as np
 import numpy.typing as npt
 
 from .yokoya_factors.yokoya_q_factor import yoko_q
-from .yokoya_factors.ellipt_long import ellipt_long
-from .yokoya_factors.ellipt_drivx import ellipt_drivx
-from .yokoya_factors.ellipt_drivy import ellipt_drivy
-from .yokoya_factors.ellipt_detx import ellipt_detx
-from .yokoya_factors.ellipt_dety import ellipt_dety
-from .yokoya_factors.rect_long import rect_long
-from .yokoya_factors.rect_drivx import rect_drivx
-from .yokoya_factors.rect_drivy import rect_drivy
-from .yokoya_factors.rect_detx import rect_detx
-from .yokoya_factors.rect_dety import rect_dety
 
 
 # Constants with descriptive names and type hints
@@ -39,6 +30,92 @@ DEFAULT_BETA_X: float = 1.0
 DEFAULT_BETA_Y: float = 1.0
 DEFAULT_COMPONENT_NAME: str = 'el'
 
+# Searched on every yokoya_q_idx call: make sure it is a contiguous float64
+# array (a no-op for the shipped table) and protect it from writes
+yoko_q = np.ascontiguousarray(yoko_q, dtype=np.float64)
+yoko_q.setflags(write=False)
+
+# The Yokoya q table is sorted, which allows a binary search in yokoya_q_idx
+if not np.all(np.diff(yoko_q) > 0):
+    raise ValueError("Yokoya q table must be strictly increasing")
+_N_YOKO = len(yoko_q)
+
+# Rows of the per-shape Yokoya factor tables. The tables are float64, so a
+# single element is an np.float64 (a float subclass) and needs no float().
+_ROW_LONG, _ROW_DRIVX, _ROW_DRIVY, _ROW_DETX, _ROW_DETY = range(5)
+
+# Table rows used for (drivx, drivy, detx, dety), depending on whether the
+# chamber is taller than wide (pipe_ver_m > pipe_hor_m, x and y swapped)
+_XY_ROWS = (_ROW_DRIVX, _ROW_DRIVY, _ROW_DETX, _ROW_DETY)
+_XY_ROWS_SWAPPED = (_ROW_DRIVY, _ROW_DRIVX, _ROW_DETY, _ROW_DETX)
+
+# Layout of Chamber.summary(), filled in with a single str.format call.
+# The Yokoya fields use the keys returned by Chamber.get_yokoya_factors().
+_SUMMARY_TEMPLATE = "\n".join([
+    "=" * 60,
+    "Chamber: {name}",
+    "=" * 60,
+    "Shape:              {shape}",
+    "Length:             {length:.3f} m",
+    "Horizontal aperture: {hor_mm:.2f} mm",
+    "Vertical aperture:   {ver_mm:.2f} mm",
+    "Beta_x:             {betax:.2f} m",
+    "Beta_y:             {betay:.2f} m",
+    "Number of layers:   {n_layers}",
+    "",
+    "Yokoya Factors:",
+    "  Asymmetry (q):    {q:.4f}",
+    "  Longitudinal:     {longitudinal:.4f}",
+    "  Driv_x:           {drivx:.4f}",
+    "  Driv_y:           {drivy:.4f}",
+    "  Det_x:            {detx:.4f}",
+    "  Det_y:            {dety:.4f}",
+    "=" * 60,
+])
+
+# Modules of pytlwall.yokoya_factors holding the (long, drivx, drivy, detx,
+# dety) tables of each non-circular shape, imported on first use
+_YOKO_TABLE_MODULES = {
+    'ELLIPTICAL': ('ellipt_long', 'ellipt_drivx', 'ellipt_drivy',
+                   'ellipt_detx', 'ellipt_dety'),
+    'RECTANGULAR': ('rect_long', 'rect_drivx', 'rect_drivy',
+                    'rect_detx', 'rect_dety'),
+}
+
+# Per-shape Yokoya factor tables, shape (5, len(yoko_q)), one row per factor.
+# Circular chambers have unity Yokoya factors (no geometric correction).
+# Other shapes are added by _get_yoko_table when first requested.
+_YOKO_TABLES = {
+    'CIRCULAR': np.vstack([np.ones((3, _N_YOKO)), np.zeros((2, _N_YOKO))]),
+}
+_YOKO_TABLES['CIRCULAR'].setflags(write=False)
+
+
+def _get_yoko_table(shape: str) -> np.ndarray:
+    """
+    Return the (5, N) Yokoya factor table of a shape, loading it if needed.
+    
+    Args:
+        shape: Upper-case chamber shape.
+    
+    Returns:
+        np.ndarray: Read-only table shared by all chambers of that shape.
+    
+    Raises:
+        KeyError: If shape is not a known chamber shape.
+    """
+    table = _YOKO_TABLES.get(shape)
+    if table is None:
+        rows = [
+            getattr(importlib.import_module(f'.yokoya_factors.{name}', __package__), name)
+            for name in _YOKO_TABLE_MODULES[shape]
+        ]
+        table = np.vstack(rows).astype(np.float64, order='C')
+        # Tables are shared by all Chamber instances: protect them from writes
+        table.setflags(write=False)
+        _YOKO_TABLES[shape] = table
+    return table
+
 
 class ChamberShapeError(ValueError):
     """Exception raised for invalid chamber shape specifications."""
@@ -50,6 +127,35 @@ class ChamberDimensionError(ValueError):
     pass
 
 
+def _validate_positive(value: float, label: str) -> float:
+    """
+    Convert value to float and check that it is strictly positive.
+    
+    Args:
+        value: Value to validate.
+        label: Human-readable name used in error messages.
+    
+    Returns:
+        float: The validated value.
+    
+    Raises:
+        ChamberDimensionError: If value is not numeric or not positive.
+    """
+    try:
+        value_float = float(value)
+    except (ValueError, TypeError) as e:
+        raise ChamberDimensionError(
+            f"{label} must be a numeric value, got {value}"
+        ) from e
+    
+    if value_float <= 0:
+        raise ChamberDimensionError(
+            f"{label} must be positive, got {value_float}"
+        )
+    
+    return value_float
+
+
 class Chamber:
     """
     Represents a vacuum chamber with specified geometry and optical parameters.
@@ -105,6 +211,13 @@ class Chamber:
         - Beta functions are used for transverse impedance calculations
     """
     
+    __slots__ = (
+        '_pipe_len_m', '_pipe_rad_m', '_pipe_hor_m', '_pipe_ver_m',
+        '_chamber_shape', '_betax', '_betay', '_component_name', 'layers',
+        '_yoko_table', '_yokoya_q_cache', '_yokoya_q_idx_cache',
+        '_xy_rows_cache',
+    )
+    
     def __init__(
         self,
         pipe_len_m: float = DEFAULT_PIPE_LENGTH_M,
@@ -135,34 +248,93 @@ class Chamber:
             ChamberDimensionError: If dimensions are invalid (negative or zero).
             ChamberShapeError: If chamber_shape is not recognized.
         """
-        # Initialize layers first
+        # Yokoya asymmetry cache, reset whenever the aperture changes
+        self._yokoya_q_cache: Optional[float] = None
+        self._yokoya_q_idx_cache: Optional[int] = None
+        self._xy_rows_cache: Optional[Tuple[int, int, int, int]] = None
+        
+        # Bound by the chamber_shape setter below; the pipe_rad_m setter
+        # relies on the slot always being set
+        self._chamber_shape: Optional[str] = None
+        
         self.layers = layers if layers is not None else []
         
-        # Set dimensions through properties (includes validation)
-        self.pipe_len_m = pipe_len_m
-        self.pipe_rad_m = pipe_rad_m
+        # Validate each value once and fill the slots directly: on a fresh
+        # object the setters would only add cache invalidation on top
+        self._pipe_len_m = _validate_positive(pipe_len_m, "Pipe length")
+        self._pipe_rad_m = _validate_positive(pipe_rad_m, "Pipe radius")
         
-        # Handle horizontal and vertical dimensions
-        if pipe_hor_m is not None:
-            self.pipe_hor_m = pipe_hor_m
-        else:
-            self._pipe_hor_m = pipe_rad_m
-            
-        if pipe_ver_m is not None:
-            self.pipe_ver_m = pipe_ver_m
-        else:
-            self._pipe_ver_m = pipe_rad_m
+        # Horizontal and vertical dimensions default to the radius
+        self._pipe_hor_m = (
+            self._pipe_rad_m if pipe_hor_m is None
+            else _validate_positive(pipe_hor_m, "Horizontal dimension")
+        )
+        self._pipe_ver_m = (
+            self._pipe_rad_m if pipe_ver_m is None
+            else _validate_positive(pipe_ver_m, "Vertical dimension")
+        )
         
-        # Set shape (must be after dimensions for Yokoya factor initialization)
+        # Shape goes through its setter, which binds the Yokoya table
         self.chamber_shape = chamber_shape
         
-        # Set optical parameters
-        self.betax = betax
-        self.betay = betay
+        self._betax = _validate_positive(betax, "Beta_x")
+        self._betay = _validate_positive(betay, "Beta_y")
+        self._component_name = str(component_name)
+    
+    @classmethod
+    def circular(
+        cls,
+        pipe_rad_m: float = DEFAULT_PIPE_RADIUS_M,
+        pipe_len_m: float = DEFAULT_PIPE_LENGTH_M,
+        betax: float = DEFAULT_BETA_X,
+        betay: float = DEFAULT_BETA_Y,
+        layers: Optional[List] = None,
+        component_name: str = DEFAULT_COMPONENT_NAME
+    ) -> 'Chamber':
+        """
+        Build a circular chamber without going through the generic setters.
+        
+        Equivalent to Chamber(pipe_rad_m=..., chamber_shape='CIRCULAR', ...)
+        but skips the shape dispatch and fills the Yokoya caches directly
+        (q = 0, unity factors), which matters when building many elements.
+        
+        Args:
+            pipe_rad_m: Pipe radius in meters. Default is 0.01 m.
+            pipe_len_m: Pipe length in meters. Default is 1.0 m.
+            betax: Horizontal beta function in meters. Default is 1.0 m.
+            betay: Vertical beta function in meters. Default is 1.0 m.
+            layers: List of Layer objects. Default is empty list.
+            component_name: Name identifier for the component. Default is 'el'.
+        
+        Returns:
+            Chamber: New circular chamber.
         
-        # Set component name
-        self.component_name = component_name
+        Raises:
+            ChamberDimensionError: If a dimension or beta is not positive.
         
+        Example:
+            >>> chamber = Chamber.circular(0.02, pipe_len_m=2.0)
+            >>> print(chamber.long_yokoya_factor)
+            1.0
+        """
+        radius = _validate_positive(pipe_rad_m, "Pipe radius")
+        self = cls.__new__(cls)
+        self.layers = layers if layers is not None else []
+        self._pipe_len_m = _validate_positive(pipe_len_m, "Pipe length")
+        self._pipe_rad_m = radius
+        self._pipe_hor_m = radius
+        self._pipe_ver_m = radius
+        self._chamber_shape = 'CIRCULAR'
+        self._yoko_table = _YOKO_TABLES['CIRCULAR']
+        self._betax = _validate_positive(betax, "Beta_x")
+        self._betay = _validate_positive(betay, "Beta_y")
+        self._component_name = str(component_name)
+        # Equal apertures: q = 0 is the first entry of yoko_q, no x/y swap
+        self._yokoya_q_cache = 0.0
+        self._yokoya_q_idx_cache = 0
+        self._xy_rows_cache = _XY_ROWS
+        return self
+    
     # Property definitions with validation
     
     @property
@@ -181,19 +353,7 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Pipe length must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Pipe length must be positive, got {value_float}"
-            )
-        
-        self._pipe_len_m = value_float
+        self._pipe_len_m = _validate_positive(value, "Pipe length")
     
     @property
     def pipe_rad_m(self) -> float:
@@ -213,25 +373,15 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Pipe radius must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Pipe radius must be positive, got {value_float}"
-            )
-        
+        value_float = _validate_positive(value, "Pipe radius")
         self._pipe_rad_m = value_float
         
         # For circular chambers, also update horizontal and vertical dimensions
-        # Check if chamber_shape attribute exists (it won't during __init__)
-        if hasattr(self, '_chamber_shape') and self._chamber_shape == 'CIRCULAR':
+        # (_chamber_shape is None while __init__ is still running)
+        if self._chamber_shape == 'CIRCULAR':
             self._pipe_hor_m = value_float
             self._pipe_ver_m = value_float
+            self._invalidate_yokoya_cache()
     
     @property
     def pipe_hor_m(self) -> float:
@@ -249,19 +399,8 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Horizontal dimension must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Horizontal dimension must be positive, got {value_float}"
-            )
-        
-        self._pipe_hor_m = value_float
+        self._pipe_hor_m = _validate_positive(value, "Horizontal dimension")
+        self._invalidate_yokoya_cache()
     
     @property
     def pipe_ver_m(self) -> float:
@@ -279,19 +418,8 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Vertical dimension must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Vertical dimension must be positive, got {value_float}"
-            )
-        
-        self._pipe_ver_m = value_float
+        self._pipe_ver_m = _validate_positive(value, "Vertical dimension")
+        self._invalidate_yokoya_cache()
     
     @property
     def betax(self) -> float:
@@ -309,19 +437,7 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Beta_x must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Beta_x must be positive, got {value_float}"
-            )
-        
-        self._betax = value_float
+        self._betax = _validate_positive(value, "Beta_x")
     
     @property
     def betay(self) -> float:
@@ -339,19 +455,7 @@ class Chamber:
         Raises:
             ChamberDimensionError: If value is not positive.
         """
-        try:
-            value_float = float(value)
-        except (ValueError, TypeError) as e:
-            raise ChamberDimensionError(
-                f"Beta_y must be a numeric value, got {value}"
-            ) from e
-        
-        if value_float <= 0:
-            raise ChamberDimensionError(
-                f"Beta_y must be positive, got {value_float}"
-            )
-        
-        self._betay = value_float
+        self._betay = _validate_positive(value, "Beta_y")
     
     @property
     def chamber_shape(self) -> str:
@@ -371,37 +475,17 @@ class Chamber:
         """
         shape_upper = value.upper()
         
-        if shape_upper == 'ELLIPTICAL':
-            self._chamber_shape = shape_upper
-            self._long_yoko_list = ellipt_long
-            self._drivx_yoko_list = ellipt_drivx
-            self._drivy_yoko_list = ellipt_drivy
-            self._detx_yoko_list = ellipt_detx
-            self._dety_yoko_list = ellipt_dety
-            
-        elif shape_upper == 'RECTANGULAR':
-            self._chamber_shape = shape_upper
-            self._long_yoko_list = rect_long
-            self._drivx_yoko_list = rect_drivx
-            self._drivy_yoko_list = rect_drivy
-            self._detx_yoko_list = rect_detx
-            self._dety_yoko_list = rect_dety
-            
-        elif shape_upper == 'CIRCULAR':
-            self._chamber_shape = shape_upper
-            # Circular chamber has unity Yokoya factors (no geometric correction)
-            n_points = len(yoko_q)
-            self._long_yoko_list = np.ones(n_points)
-            self._drivx_yoko_list = np.ones(n_points)
-            self._drivy_yoko_list = np.ones(n_points)
-            self._detx_yoko_list = np.zeros(n_points)
-            self._dety_yoko_list = np.zeros(n_points)
-            
-        else:
+        # The table registry doubles as the list of valid shapes
+        try:
+            table = _get_yoko_table(shape_upper)
+        except KeyError:
             raise ChamberShapeError(
                 f"Unknown chamber shape '{value}'. "
                 f"Must be one of: 'CIRCULAR', 'ELLIPTICAL', 'RECTANGULAR'"
-            )
+            ) from None
+        
+        self._chamber_shape = shape_upper
+        self._yoko_table = table
     
     @property
     def component_name(self) -> str:
@@ -431,10 +515,13 @@ class Chamber:
             - q = 0 for circular chambers
             - q > 0 for elliptical or rectangular chambers
             - Used to interpolate Yokoya correction factors
+            - Cached until pipe_hor_m, pipe_ver_m or pipe_rad_m changes
         """
-        return abs(self.pipe_hor_m - self.pipe_ver_m) / (
-            self.pipe_hor_m + self.pipe_ver_m
-        )
+        if self._yokoya_q_cache is None:
+            self._yokoya_q_cache = abs(self._pipe_hor_m - self._pipe_ver_m) / (
+                self._pipe_hor_m + self._pipe_ver_m
+            )
+        return self._yokoya_q_cache
     
     @property
     def yokoya_q_idx(self) -> int:
@@ -443,8 +530,42 @@ class Chamber:
         
         Returns:
             int: Index in yoko_q array closest to current yokoya_q value.
+        
+        Note:
+            Cached until pipe_hor_m, pipe_ver_m or pipe_rad_m changes.
+        """
+        if self._yokoya_q_idx_cache is None:
+            # Binary search, then pick the closer of the two neighbours
+            # (the lower one on ties, as argmin of |yoko_q - q| would)
+            q = self.yokoya_q
+            idx = int(np.searchsorted(yoko_q, q))
+            if idx == _N_YOKO:
+                idx -= 1
+            elif idx > 0 and (yoko_q[idx] - q) >= (q - yoko_q[idx - 1]):
+                idx -= 1
+            self._yokoya_q_idx_cache = idx
+        return self._yokoya_q_idx_cache
+    
+    @property
+    def _xy_rows(self) -> Tuple[int, int, int, int]:
         """
-        return int(np.argmin(np.abs(yoko_q - self.yokoya_q)))
+        Table rows for the (drivx, drivy, detx, dety) factors.
+        
+        x and y are swapped when pipe_ver_m > pipe_hor_m (chamber taller
+        than wide) to account for chamber orientation.
+        """
+        if self._xy_rows_cache is None:
+            if self._pipe_ver_m > self._pipe_hor_m:
+                self._xy_rows_cache = _XY_ROWS_SWAPPED
+            else:
+                self._xy_rows_cache = _XY_ROWS
+        return self._xy_rows_cache
+    
+    def _invalidate_yokoya_cache(self) -> None:
+        """Forget the cached Yokoya q, table index and x/y orientation."""
+        self._yokoya_q_cache = None
+        self._yokoya_q_idx_cache = None
+        self._xy_rows_cache = None
     
     @property
     def long_yokoya_factor(self) -> float:
@@ -454,7 +575,7 @@ class Chamber:
         Returns:
             float: Yokoya factor for longitudinal impedance.
         """
-        return float(self._long_yoko_list[self.yokoya_q_idx])
+        return self._yoko_table[_ROW_LONG, self.yokoya_q_idx]
     
     @property
     def drivx_yokoya_factor(self) -> float:
@@ -468,11 +589,7 @@ class Chamber:
             Swaps x/y factors when pipe_ver_m > pipe_hor_m to account
             for chamber orientation.
         """
-        if self.pipe_ver_m > self.pipe_hor_m:
-            # Chamber is taller than wide - swap x and y
-            return float(self._drivy_yoko_list[self.yokoya_q_idx])
-        else:
-            return float(self._drivx_yoko_list[self.yokoya_q_idx])
+        return self._yoko_table[self._xy_rows[0], self.yokoya_q_idx]
     
     @property
     def drivy_yokoya_factor(self) -> float:
@@ -486,11 +603,7 @@ class Chamber:
             Swaps x/y factors when pipe_ver_m > pipe_hor_m to account
             for chamber orientation.
         """
-        if self.pipe_ver_m > self.pipe_hor_m:
-            # Chamber is taller than wide - swap x and y
-            return float(self._drivx_yoko_list[self.yokoya_q_idx])
-        else:
-            return float(self._drivy_yoko_list[self.yokoya_q_idx])
+        return self._yoko_table[self._xy_rows[1], self.yokoya_q_idx]
     
     @property
     def detx_yokoya_factor(self) -> float:
@@ -504,11 +617,7 @@ class Chamber:
             Swaps x/y factors when pipe_ver_m > pipe_hor_m to account
             for chamber orientation.
         """
-        if self.pipe_ver_m > self.pipe_hor_m:
-            # Chamber is taller than wide - swap x and y
-            return float(self._dety_yoko_list[self.yokoya_q_idx])
-        else:
-            return float(self._detx_yoko_list[self.yokoya_q_idx])
+        return self._yoko_table[self._xy_rows[2], self.yokoya_q_idx]
     
     @property
     def dety_yokoya_factor(self) -> float:
@@ -522,11 +631,7 @@ class Chamber:
             Swaps x/y factors when pipe_ver_m > pipe_hor_m to account
             for chamber orientation.
         """
-        if self.pipe_ver_m > self.pipe_hor_m:
-            # Chamber is taller than wide - swap x and y
-            return float(self._detx_yoko_list[self.yokoya_q_idx])
-        else:
-            return float(self._dety_yoko_list[self.yokoya_q_idx])
+        return self._yoko_table[self._xy_rows[3], self.yokoya_q_idx]
     
     # Utility methods
     
@@ -553,6 +658,23 @@ class Chamber:
         
         return f"{self.chamber_shape} chamber ({geom})"
     
+    def yokoya_snapshot(self) -> Tuple[float, int, np.ndarray]:
+        """
+        Get the Yokoya q, its table index and the factor column in one call.
+        
+        Callers that need several factors, e.g. inside an impedance sweep,
+        can take the snapshot once instead of going through the individual
+        factor properties.
+        
+        Returns:
+            tuple: (q, idx, column) where column is a read-only view of shape
+            (5,) with rows (long, drivx, drivy, detx, dety) of the table.
+            The rows are not swapped for chambers taller than wide; use
+            get_yokoya_factors() for orientation-aware values.
+        """
+        idx = self.yokoya_q_idx
+        return self.yokoya_q, idx, self._yoko_table[:, idx]
+    
     def get_yokoya_factors(self) -> dict:
         """
         Get all Yokoya factors as a dictionary.
@@ -572,13 +694,15 @@ class Chamber:
             >>> factors = chamber.get_yokoya_factors()
             >>> print(f"Longitudinal factor: {factors['longitudinal']:.3f}")
         """
+        q, _, column = self.yokoya_snapshot()
+        drivx, drivy, detx, dety = self._xy_rows
         return {
-            'q': self.yokoya_q,
-            'longitudinal': self.long_yokoya_factor,
-            'drivx': self.drivx_yokoya_factor,
-            'drivy': self.drivy_yokoya_factor,
-            'detx': self.detx_yokoya_factor,
-            'dety': self.dety_yokoya_factor
+            'q': q,
+            'longitudinal': column[_ROW_LONG],
+            'drivx': column[drivx],
+            'drivy': column[drivy],
+            'detx': column[detx],
+            'dety': column[dety]
         }
     
     def get_dimensions(self) -> dict:
@@ -616,25 +740,14 @@ class Chamber:
             ...                   chamber_shape='ELLIPTICAL')
             >>> print(chamber.summary())
         """
-        lines = [
-            "=" * 60,
-            f"Chamber: {self.component_name}",
-            "=" * 60,
-            f"Shape:              {self.chamber_shape}",
-            f"Length:             {self.pipe_len_m:.3f} m",
-            f"Horizontal aperture: {self.pipe_hor_m*1000:.2f} mm",
-            f"Vertical aperture:   {self.pipe_ver_m*1000:.2f} mm",
-            f"Beta_x:             {self.betax:.2f} m",
-            f"Beta_y:             {self.betay:.2f} m",
-            f"Number of layers:   {len(self.layers)}",
-            "",
-            "Yokoya Factors:",
-            f"  Asymmetry (q):    {self.yokoya_q:.4f}",
-            f"  Longitudinal:     {self.long_yokoya_factor:.4f}",
-            f"  Driv_x:           {self.drivx_yokoya_factor:.4f}",
-            f"  Driv_y:           {self.drivy_yokoya_factor:.4f}",
-            f"  Det_x:            {self.detx_yokoya_factor:.4f}",
-            f"  Det_y:            {self.dety_yokoya_factor:.4f}",
-            "=" * 60
-        ]
-        return "\n".join(lines)
+        return _SUMMARY_TEMPLATE.format(
+            name=self.component_name,
+            shape=self.chamber_shape,
+            length=self.pipe_len_m,
+            hor_mm=self.pipe_hor_m * 1000,
+            ver_mm=self.pipe_ver_m * 1000,
+            betax=self.betax,
+            betay=self.betay,
+            n_layers=len(self.layers),
+            **self.get_yokoya_factors()
+        )
@@ -12,6 +12,8 @@ Updated: December 2025
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 from typing import Optional, Union, Sequence
 import warnings
@@ -24,6 +26,67 @@ DEFAULT_FREQ_UNIT = "Hz"
 DEFAULT_SEP = " "
 
 
+@functools.lru_cache(maxsize=32)
+def _freq_array_cached(fmin: float, fmax: float, fstep: float) -> np.ndarray:
+    """
+    Generate the logarithmic frequency array for validated exponents.
+    
+    Results are cached, so building several Frequencies objects with the
+    same exponents (e.g. from the GUI) does not regenerate the array.
+    
+    The points are evenly spaced *within* each decade (e.g. 1.1, 1.2, ...,
+    10 for fstep=2), not evenly spaced in log10(f), so np.logspace or
+    np.geomspace would produce a different grid.
+    
+    Parameters
+    ----------
+    fmin : float
+        Minimum frequency exponent (base 10).
+    fmax : float
+        Maximum frequency exponent (base 10), not less than fmin.
+    fstep : float
+        Step exponent, strictly positive.
+    
+    Returns
+    -------
+    np.ndarray
+        Read-only array of frequencies in Hz, shared between callers.
+    """
+    # Decade bounds (start v1, end v2, step v3), one row per decade.
+    # They are computed with scalar arithmetic: the vectorised power
+    # can differ in the last bit, which may change a decade's count.
+    bounds = np.array([
+        ((1 + (10 ** (1 - fstep))) * 10.0 ** (fmin - 1 + p),
+         10.0 ** (fmin + p),
+         10.0 ** (fmin - 1 + p - (fstep - 1)))
+        for p in np.arange(1, fmax - fmin + 1)
+    ])
+    if bounds.size == 0:
+        freq = np.array([])
+    else:
+        v1, v2, v3 = bounds.T
+        
+        # All decades are filled at once: row p of the grid holds the
+        # points of decade p. Start, step and point count follow np.arange
+        # exactly (start + i * ((start + step) - start), ceil((stop - start)
+        # / step) points) so the result matches a per-decade arange.
+        counts = np.maximum(np.ceil((v2 + v3 - v1) / v3), 0).astype(np.intp)
+        delta = (v1 + v3) - v1
+        
+        k = np.arange(counts.max())
+        grid = v1[:, np.newaxis] + k * delta[:, np.newaxis]
+        if np.all(counts == k.size):
+            # Usual case: every decade has the same number of points
+            freq = grid.ravel()
+        else:
+            # Rounding gave some decades an extra point: keep the first
+            # counts[p] points of each row (row-major, decades in order)
+            freq = grid[k < counts[:, np.newaxis]]
+    
+    freq.setflags(write=False)
+    return freq
+
+
 class Frequencies:
     """
     Frequency array manager for impedance calculations.
@@ -113,18 +176,21 @@ class Frequencies:
             List of frequencies in Hz.
         """
         try:
-            self._freq = np.array(freq_list, dtype=float)
+            # np.array always copies, so the list can be sorted in place
+            freq = np.array(freq_list, dtype=float)
+            freq.sort()
             
-            # Validate frequencies are positive
-            if np.any(self._freq <= 0):
+            # Validate frequencies are positive: once sorted, only the
+            # smallest one needs checking
+            if freq[0] <= 0:
                 raise ValueError("All frequencies must be positive")
             
-            # Sort frequencies
-            self._freq = np.sort(self._freq)
+            freq.setflags(write=False)
+            self._freq = freq
             
-            # Update min/max from the list
-            self._fmin = float(np.min(self._freq))
-            self._fmax = float(np.max(self._freq))
+            # Update min/max from the list (the sorted endpoints)
+            self._fmin = float(freq[0])
+            self._fmax = float(freq[-1])
             self._fstep = 0.0  # Step not applicable for explicit list
             
         except (ValueError, TypeError) as e:
@@ -147,6 +213,7 @@ class Frequencies:
         self.fmax = fmax
         self.fstep = fstep
         self._freq = self._calc_freq_array(self._fmin, self._fmax, self._fstep)
+        self._freq.setflags(write=False)
     
     @property
     def freq(self) -> np.ndarray:
@@ -156,7 +223,8 @@ class Frequencies:
         Returns
         -------
         np.ndarray
-            Array of frequencies in Hz.
+            Read-only array of frequencies in Hz (no copy is made). Use
+            ``freq.copy()`` to get a modifiable array.
         """
         return self._freq
     
@@ -308,7 +376,8 @@ class Frequencies:
         Returns
         -------
         np.ndarray
-            Array of frequencies in Hz.
+            Array of frequencies in Hz. Generated arrays are cached and
+            read-only; copy them before modifying in place.
         
         Notes
         -----
@@ -330,15 +399,7 @@ class Frequencies:
             )
             fstep = DEFAULT_FSTEP
         
-        f = np.array([])
-        
-        for p in np.arange(1, fmax - fmin + 1):
-            v1 = (1 + (10 ** (1 - fstep))) * 10.0 ** (fmin - 1 + p)
-            v2 = 10.0 ** (fmin + p)
-            v3 = 10.0 ** (fmin - 1 + p - (fstep - 1))
-            f = np.append(f, np.arange(v1, v2 + v3, v3))
-        
-        return f
+        return _freq_array_cached(fmin, fmax, fstep)
     
     def update_from_exponents(self, fmin: float, fmax: float, fstep: float) -> None:
         """
@@ -7,8 +7,8 @@ Notes:
 - Text-based formats are tab-separated to keep a consistent, easy-to-parse
   structure across .txt/.dat/.csv exports.
 - Optional dependencies:
-    * pandas: used for convenient DataFrame-based export when available.
-    * openpyxl: required to write .xlsx files via pandas.
+    * pandas: fast C parser for reading numeric text tables when available.
+    * openpyxl: required to write .xlsx files.
 """
 
 from __future__ import annotations
@@ -27,14 +27,33 @@ except Exception:  # pragma: no cover
     PANDAS_AVAILABLE = False
 
 try:
-    import openpyxl  # noqa: F401  # type: ignore
+    from openpyxl import Workbook  # type: ignore
     OPENPYXL_AVAILABLE = True
 except Exception:  # pragma: no cover
+    Workbook = None  # type: ignore
     OPENPYXL_AVAILABLE = False
 
 
 _SUPPORTED_FORMATS = (".csv", ".txt", ".dat", ".xlsx")
 
+# Buffer size used when writing text exports (1 MiB).
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number format of text exports (np.savetxt's default, full float64 precision).
+_TEXT_FORMAT = "%.18e"
+
+# Key of the frequency vector in impedance .npz files
+_NPZ_FREQ_KEY = "freqs"
+
+
+# Frequency unit -> factor to Hz (keys are lower case).
+_UNIT_SCALES: Mapping[str, float] = {
+    "hz": 1.0,
+    "khz": 1.0e3,
+    "mhz": 1.0e6,
+    "ghz": 1.0e9,
+}
+
 
 _STANDARD_LABELS: Mapping[str, str] = {
     "ZLong": "Longitudinal Impedance",
@@ -45,6 +64,11 @@ _STANDARD_LABELS: Mapping[str, str] = {
     "ZQuadY": "Quadrupolar Y Impedance",
 }
 
+# (Re, Im) export column headers for the standard labels.
+_STANDARD_HEADERS: Mapping[str, Tuple[str, str]] = {
+    key: (f"Re({label})", f"Im({label})") for key, label in _STANDARD_LABELS.items()
+}
+
 
 def list_supported_formats() -> List[str]:
     """Return the list of supported export file extensions."""
@@ -61,16 +85,105 @@ def _unit_scale(unit: str | None) -> float:
     if unit is None:
         return 1.0
 
-    unit_norm = unit.strip().lower()
-    scales = {
-        "hz": 1.0,
-        "khz": 1.0e3,
-        "mhz": 1.0e6,
-        "ghz": 1.0e9,
-    }
-    if unit_norm not in scales:
-        raise ValueError(f"Unsupported unit: {unit}")
-    return scales[unit_norm]
+    try:
+        return _UNIT_SCALES[unit.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported unit: {unit}") from None
+
+
+def _fast_loadtxt(
+    filepath: str | Path,
+    separator: str | None = None,
+    skipped_rows: int = 0,
+) -> np.ndarray:
+    """Load a numeric text table as a 2D float64 array.
+
+    Uses the pandas C parser when pandas is available, which is much faster
+    than ``np.loadtxt`` on large impedance files, and falls back to
+    ``np.loadtxt`` otherwise or when pandas cannot parse the file.
+
+    Args:
+        filepath: Input file.
+        separator: Column separator. If None, any whitespace is used.
+        skipped_rows: Number of header rows to skip.
+
+    Returns:
+        Writeable 2D float64 array (rows x columns), as
+        ``np.loadtxt(..., ndmin=2)``.
+    """
+    if PANDAS_AVAILABLE:
+        try:
+            data = pd.read_csv(  # type: ignore[union-attr]
+                Path(filepath),
+                sep=r"\s+" if separator is None else separator,
+                skiprows=skipped_rows,
+                header=None,
+                comment="#",
+                engine="c",
+                dtype=np.float64,
+            ).to_numpy()
+        except ValueError:
+            pass  # Empty or irregular file: let numpy handle/report it
+        else:
+            # With copy-on-write (pandas >= 3) the array is a read-only
+            # view; callers get a writeable array, as from np.loadtxt
+            if not data.flags.writeable:
+                data = data.copy()
+            return data
+
+    return np.loadtxt(
+        Path(filepath),
+        delimiter=separator,
+        skiprows=skipped_rows,
+        ndmin=2,
+    )
+
+
+def _scaled_column(data: np.ndarray, column: int, unit: str | None) -> np.ndarray:
+    """Return a column of a loaded table converted to Hz.
+
+    The result is a standalone contiguous array, so it does not keep the
+    other columns of the table alive. A one-column table is not needed
+    afterwards, so its column is returned as a view and scaled in place.
+    """
+    col = data[:, column]
+    if data.shape[1] > 1:
+        col = col.copy()
+    scale = _unit_scale(unit)
+    if scale != 1.0:
+        col *= scale
+    return col
+
+
+def _complex_column(data: np.ndarray, re_column: int, im_column: int) -> np.ndarray:
+    """Combine two columns of a loaded table into a complex array."""
+    z = np.empty(data.shape[0], dtype=np.complex128)
+    z.real = data[:, re_column]
+    z.imag = data[:, im_column]
+    return z
+
+
+def _impedance_columns(
+    data: np.ndarray,
+    freq_column: int,
+    re_column: int,
+    im_column: int,
+    unit: str | None,
+    return_complex: bool,
+) -> Tuple[np.ndarray, ...]:
+    """Split a loaded impedance table into frequency and impedance arrays."""
+    if return_complex:
+        z = _complex_column(data, re_column, im_column)
+        return _scaled_column(data, freq_column, unit), z
+
+    # Re/Im are returned as views of the table. A one-column table has its
+    # frequency column scaled in place, so copy them if one of them is
+    # that same column.
+    re_ = data[:, re_column]
+    im_ = data[:, im_column]
+    if freq_column in (re_column, im_column):
+        re_, im_ = re_.copy(), im_.copy()
+    return _scaled_column(data, freq_column, unit), re_, im_
 
 
 def read_frequency_txt(
@@ -93,20 +206,14 @@ def read_frequency_txt(
     Returns:
         1D numpy array of frequencies in Hz.
     """
-    data = np.loadtxt(
-        Path(filepath),
-        delimiter=separator,
-        skiprows=skipped_rows,
-        ndmin=2,
-    )
+    data = _fast_loadtxt(filepath, separator, skipped_rows)
     if data.size == 0:
         return np.array([], dtype=float)
 
     if column < 0 or column >= data.shape[1]:
         raise ValueError(f"Invalid column index {column} for file with {data.shape[1]} columns.")
 
-    freqs = np.asarray(data[:, column], dtype=float)
-    return freqs * _unit_scale(unit)
+    return _scaled_column(data, column, unit)
 
 
 def read_surface_impedance_txt(
@@ -118,24 +225,22 @@ def read_surface_impedance_txt(
     freq_column: int = 0,
     re_column: int = 1,
     im_column: int = 2,
-) -> Tuple[np.ndarray, np.ndarray]:
+    return_complex: bool = True,
+) -> Tuple[np.ndarray, ...]:
     """Read surface impedance file.
 
     Expected columns: f, Re(Zs), Im(Zs)
 
+    Args:
+        return_complex: If False, return the real and imaginary parts as
+            two float arrays instead of building a complex array.
+
     Returns:
-        (freqs, Zs) where Zs is a complex numpy array.
+        (freqs, Zs) where Zs is a complex numpy array, or
+        (freqs, Re(Zs), Im(Zs)) when return_complex is False.
     """
-    data = np.loadtxt(
-        Path(filepath),
-        delimiter=separator,
-        skiprows=skipped_rows,
-        ndmin=2,
-    )
-    freqs = np.asarray(data[:, freq_column], dtype=float) * _unit_scale(unit)
-    re_ = np.asarray(data[:, re_column], dtype=float)
-    im_ = np.asarray(data[:, im_column], dtype=float)
-    return freqs, re_ + 1j * im_
+    data = _fast_loadtxt(filepath, separator, skipped_rows)
+    return _impedance_columns(data, freq_column, re_column, im_column, unit, return_complex)
 
 
 def read_impedance_file(
@@ -147,74 +252,259 @@ def read_impedance_file(
     re_column: int = 1,
     im_column: int = 2,
     unit: str | None = None,
-) -> Tuple[np.ndarray, np.ndarray]:
-    """Read a generic impedance file with columns (f, Re(Z), Im(Z))."""
-    data = np.loadtxt(
-        Path(filepath),
-        delimiter=separator if separator is not None else None,
-        skiprows=skipped_rows,
-        ndmin=2,
-    )
-    freqs = np.asarray(data[:, freq_column], dtype=float) * _unit_scale(unit)
-    re_ = np.asarray(data[:, re_column], dtype=float)
-    im_ = np.asarray(data[:, im_column], dtype=float)
-    return freqs, re_ + 1j * im_
+    return_complex: bool = True,
+) -> Tuple[np.ndarray, ...]:
+    """Read a generic impedance file with columns (f, Re(Z), Im(Z)).
+
+    Returns (freqs, Z), or (freqs, Re(Z), Im(Z)) when return_complex is False
+    (see :func:`read_surface_impedance_txt`).
+    """
+    data = _fast_loadtxt(filepath, separator, skipped_rows)
+    return _impedance_columns(data, freq_column, re_column, im_column, unit, return_complex)
+
+
+def write_impedance_file_npy(
+    filepath: str | Path,
+    freqs: np.ndarray,
+    impedance: np.ndarray,
+) -> Path:
+    """Write an impedance as a binary .npy file with columns (f, Re(Z), Im(Z)).
+
+    The binary format is exact (no float formatting) and much faster to
+    read back than text; see :func:`read_impedance_file_npy`.
+
+    Args:
+        filepath: Output file. It is written as given (no suffix is added).
+        freqs: Frequency vector.
+        impedance: Complex impedance vector of the same length.
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        ValueError: If freqs and impedance have different lengths.
+    """
+    freqs = np.asarray(freqs).reshape(-1)
+    z = np.asarray(impedance).reshape(-1)
+    if z.size != freqs.size:
+        raise ValueError(f"Length mismatch: freqs={freqs.size}, Z={z.size}")
+
+    data = np.empty((freqs.size, 3), dtype=np.float64)
+    data[:, 0] = freqs
+    data[:, 1] = z.real
+    data[:, 2] = z.imag
+
+    path = Path(filepath)
+    with open(path, "wb") as fh:
+        np.save(fh, data)
+    return path
+
+
+def read_impedance_file_npy(filepath: str | Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Read an impedance written by :func:`write_impedance_file_npy`.
+
+    The file is memory-mapped, so only the copied columns are read.
+
+    Args:
+        filepath: Input .npy file with an (N, 3) float64 array.
+
+    Returns:
+        (freqs, Z) where Z is a complex numpy array.
+
+    Raises:
+        ValueError: If the stored array does not have three columns.
+    """
+    data = np.load(Path(filepath), mmap_mode="r")
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError(f"Expected an (N, 3) array, got shape {data.shape}.")
+    return np.array(data[:, 0]), _complex_column(data, 1, 2)
+
+
+def save_impedance_sheets_xlsx(
+    output_path: str | Path,
+    sheets: Iterable[Tuple[str, np.ndarray, Mapping[str, np.ndarray]]],
+    *,
+    use_standard_labels: bool = False,
+) -> Path:
+    """Write several impedance tables to one .xlsx workbook.
+
+    Each ``(sheet_name, freqs, imped_dict)`` item becomes one sheet with the
+    same columns as :func:`export_impedance`. Items are consumed lazily, so
+    passing a generator keeps only one table in memory.
+
+    Args:
+        output_path: Output .xlsx file.
+        sheets: Iterable of (sheet_name, freqs, imped_dict).
+        use_standard_labels: Use the standard column labels where known.
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        ValueError: If openpyxl is not installed or a table is invalid.
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise ValueError("openpyxl is required for .xlsx export.")
+
+    def tables():
+        for sheet_name, freqs, imped_dict in sheets:
+            _validate_export_inputs(freqs, imped_dict)
+            header, data = _build_table(
+                freqs, imped_dict, use_standard_labels=use_standard_labels
+            )
+            yield sheet_name, header, data
+
+    path = Path(output_path)
+    _write_xlsx_sheets(path, tables())
+    return path
+
+
+def save_impedances_npz(
+    output_path: str | Path,
+    freqs: np.ndarray,
+    imped_dict: Mapping[str, np.ndarray],
+) -> Path:
+    """Write several impedances sharing one frequency vector to a .npz file.
+
+    Arrays are stored uncompressed in their native dtype, so complex values
+    round-trip exactly; see :func:`load_impedances_npz`.
+
+    Args:
+        output_path: Output file. A ``.npz`` suffix is added if missing.
+        freqs: Frequency vector, stored under the key ``"freqs"``.
+        imped_dict: Mapping impedance name -> complex array.
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        ValueError: If the inputs are empty or have inconsistent lengths,
+            or an impedance is named ``"freqs"``.
+    """
+    _validate_export_inputs(freqs, imped_dict)
+    if _NPZ_FREQ_KEY in imped_dict:
+        raise ValueError(f"Impedance name {_NPZ_FREQ_KEY!r} is reserved.")
+
+    path = Path(output_path)
+    if path.suffix != ".npz":
+        path = path.with_suffix(".npz")
+    arrays = {name: np.asarray(z).reshape(-1) for name, z in imped_dict.items()}
+    with open(path, "wb") as fh:
+        np.savez(fh, **{_NPZ_FREQ_KEY: np.asarray(freqs).reshape(-1)}, **arrays)
+    return path
+
+
+def load_impedances_npz(
+    filepath: str | Path,
+    names: Iterable[str] | None = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Read impedances written by :func:`save_impedances_npz`.
+
+    Args:
+        filepath: Input .npz file.
+        names: Optional subset of impedance names to read; by default all
+            stored impedances are returned.
+
+    Returns:
+        (freqs, imped_dict) with imped_dict mapping name -> array.
+
+    Raises:
+        KeyError: If a requested name is not stored in the file.
+    """
+    with np.load(Path(filepath)) as npz:
+        freqs = npz[_NPZ_FREQ_KEY]
+        if names is None:
+            names = [key for key in npz.files if key != _NPZ_FREQ_KEY]
+        return freqs, {name: npz[name] for name in names}
 
 
 def load_apertype(filepath: str | Path) -> List[str]:
     """Load a list of aperture type strings from a file (one per line)."""
-    types: List[str] = []
-    with open(Path(filepath), "r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if s:
-                types.append(s)
-    return types
+    text = Path(filepath).read_text(encoding="utf-8")
+    return [s for line in text.splitlines() if (s := line.strip())]
 
 
 def load_b_L(filepath: str | Path) -> Tuple[np.ndarray, np.ndarray]:
     """Load circular geometry as (b, L)."""
-    data = np.loadtxt(Path(filepath), ndmin=2)
-    return np.asarray(data[:, 0], dtype=float), np.asarray(data[:, 1], dtype=float)
+    data = _fast_loadtxt(filepath)
+    return data[:, 0], data[:, 1]
 
 
 def load_b_L_betax_betay(filepath: str | Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Load circular geometry with beta functions as (b, L, betax, betay)."""
-    data = np.loadtxt(Path(filepath), ndmin=2)
+    data = _fast_loadtxt(filepath)
     return (
-        np.asarray(data[:, 0], dtype=float),
-        np.asarray(data[:, 1], dtype=float),
-        np.asarray(data[:, 2], dtype=float),
-        np.asarray(data[:, 3], dtype=float),
+        data[:, 0],
+        data[:, 1],
+        data[:, 2],
+        data[:, 3],
     )
 
 
 def load_x_y_L_betax_betay(filepath: str | Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Load rectangular geometry with beta functions as (x, y, L, betax, betay)."""
-    data = np.loadtxt(Path(filepath), ndmin=2)
+    data = _fast_loadtxt(filepath)
     return (
-        np.asarray(data[:, 0], dtype=float),
-        np.asarray(data[:, 1], dtype=float),
-        np.asarray(data[:, 2], dtype=float),
-        np.asarray(data[:, 3], dtype=float),
-        np.asarray(data[:, 4], dtype=float),
+        data[:, 0],
+        data[:, 1],
+        data[:, 2],
+        data[:, 3],
+        data[:, 4],
     )
 
 
+def _savetxt_table(path: Path, data: np.ndarray, header_line: str) -> None:
+    """Write a tab-separated table with a single header line.
+
+    The file is opened once with a large buffer and handed to ``np.savetxt``,
+    so rows are flushed in big blocks.
+    """
+    with open(path, "w", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.write(header_line + "\n")
+        np.savetxt(fh, data, fmt=_TEXT_FORMAT, delimiter="\t")
+
+
+def _write_xlsx(path: Path, header: List[str], data: np.ndarray) -> None:
+    """Write a table to a single-sheet .xlsx file.
+
+    Uses openpyxl's write-only mode, which streams rows to disk instead of
+    keeping the whole workbook (or a pandas DataFrame) in memory.
+    """
+    _write_xlsx_sheets(path, [("Sheet1", header, data)])
+
+
+def _write_xlsx_sheets(
+    path: Path,
+    sheets: Iterable[Tuple[str, List[str], np.ndarray]],
+) -> None:
+    """Write (title, header, data) tables to one .xlsx file, one sheet each.
+
+    Sheets are consumed one at a time in write-only mode, so a generator
+    keeps at most one table in memory.
+    """
+    wb = Workbook(write_only=True)  # type: ignore[misc]
+    for title, header, data in sheets:
+        ws = wb.create_sheet(title=title)
+        ws.append(header)
+        for row in data.tolist():
+            ws.append(row)
+    wb.save(path)
+
+
 def _validate_export_inputs(freqs: np.ndarray, imped_dict: Mapping[str, np.ndarray]) -> None:
     """Validate export inputs for impedance output functions."""
-    freqs = np.asarray(freqs).reshape(-1)
-    if freqs.size == 0:
+    # Only sizes are checked, and size does not depend on shape: no reshape
+    n = np.size(freqs)
+    if n == 0:
         raise ValueError("freqs is empty.")
 
     if not imped_dict:
         raise ValueError("imped_dict is empty.")
 
-    n = freqs.size
     for key, arr in imped_dict.items():
-        arr = np.asarray(arr).reshape(-1)
-        if arr.size != n:
-            raise ValueError(f"Length mismatch for '{key}': freqs={n}, Z={arr.size}")
+        size = np.size(arr)
+        if size != n:
+            raise ValueError(f"Length mismatch for '{key}': freqs={n}, Z={size}")
 
 
 def _build_table(
@@ -224,19 +514,24 @@ def _build_table(
     use_standard_labels: bool = False,
 ) -> Tuple[List[str], np.ndarray]:
     """Build header and 2D numeric table for export."""
+    freqs = np.asarray(freqs).reshape(-1)
     header: List[str] = ["f [Hz]"]
-    cols: List[np.ndarray] = [np.asarray(freqs).reshape(-1)]
 
-    for key in imped_dict.keys():
-        label = get_standard_label(key) if use_standard_labels else key
-        header.append(f"Re({label})")
-        header.append(f"Im({label})")
+    # One allocation for the whole table; columns are filled in place.
+    # .real/.imag are views of a complex array, so no temporaries are made.
+    data = np.empty((freqs.size, 1 + 2 * len(imped_dict)), dtype=np.float64)
+    data[:, 0] = freqs
+
+    for i, (key, z) in enumerate(imped_dict.items()):
+        columns = _STANDARD_HEADERS.get(key) if use_standard_labels else None
+        if columns is None:
+            columns = (f"Re({key})", f"Im({key})")
+        header.extend(columns)
 
-        z = np.asarray(imped_dict[key]).reshape(-1)
-        cols.append(np.real(z))
-        cols.append(np.imag(z))
+        z = np.asarray(z).reshape(-1)
+        data[:, 1 + 2 * i] = z.real
+        data[:, 2 + 2 * i] = z.imag
 
-    data = np.column_stack(cols)
     return header, data
 
 
@@ -283,15 +578,11 @@ def print_impedance_output(
     header, data = _build_table(freqs, imped_dict, use_standard_labels=use_standard_labels)
 
     if ext == ".xlsx":
-        if not PANDAS_AVAILABLE:
-            raise ValueError("pandas is required for .xlsx export.")
-        df = pd.DataFrame(data, columns=header)  # type: ignore[name-defined]
-        df.to_excel(out_path, index=False)
+        _write_xlsx(out_path, header, data)
         return out_path
 
     # Text-like exports: tab-separated, single header line.
-    header_line = "\t".join(header)
-    np.savetxt(out_path, data, delimiter="\t", header=header_line, comments="")
+    _savetxt_table(out_path, data, "\t".join(header))
     return out_path
 
 
@@ -379,7 +670,9 @@ def save_chamber_impedance(
     bases = _collect_impedance_bases(impedance_results)
     _validate_mandatory_impedances(impedance_results, bases)
 
-    written: List[Path] = []
+    # Collect and validate every component first, so that a size mismatch
+    # is reported before any file is (re)written.
+    jobs: List[Tuple[str, np.ndarray, np.ndarray]] = []
     for base in sorted(bases):
         re_key = f"{base}Re"
         im_key = f"{base}Im"
@@ -392,15 +685,21 @@ def save_chamber_impedance(
         im_arr = np.asarray(impedance_results[im_key]).reshape(-1)
 
         _validate_sizes(freq, re_arr, im_arr, base)
+        jobs.append((base, re_arr, im_arr))
 
+    # The frequency column is the same in every file: format it only once.
+    freq_text = _format_column(freq)
+
+    written: List[Path] = []
+    for base, re_arr, im_arr in jobs:
         file_path = out_path / f"{base}.txt"
         _write_impedance_file(
             file_path=file_path,
-            freq=freq,
+            freq_text=freq_text,
             re_arr=re_arr,
             im_arr=im_arr,
-            re_name=re_key,
-            im_name=im_key,
+            re_name=f"{base}Re",
+            im_name=f"{base}Im",
         )
         written.append(file_path)
 
@@ -474,15 +773,26 @@ def _validate_sizes(freq: np.ndarray, re_arr: np.ndarray, im_arr: np.ndarray, ba
         )
 
 
+def _format_column(values: np.ndarray) -> List[str]:
+    """Format a 1D array with the text export number format."""
+    return [_TEXT_FORMAT % v for v in values.tolist()]
+
+
 def _write_impedance_file(
     file_path: Path,
-    freq: np.ndarray,
+    freq_text: List[str],
     re_arr: np.ndarray,
     im_arr: np.ndarray,
     re_name: str,
     im_name: str,
 ) -> None:
-    """Write a single impedance file with a header and tab-separated columns."""
-    data = np.column_stack((freq, re_arr, im_arr))
-    header = f"f\t{re_name}\t{im_name}"
-    np.savetxt(file_path, data, header=header, comments="", delimiter="\t")
+    """Write a single impedance file with a header and tab-separated columns.
+
+    ``freq_text`` is the frequency column already formatted by
+    :func:`_format_column`, so it can be shared between files.
+    """
+    rows = map("\t".join, zip(freq_text, _format_column(re_arr), _format_column(im_arr)))
+    with open(file_path, "w", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.write(f"f\t{re_name}\t{im_name}\n")
+        for row in rows:
+            fh.write(row + "\n")
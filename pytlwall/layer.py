@@ -20,9 +20,12 @@ Updated: December 2025
 
 from __future__ import annotations
 
+import cmath
+import functools
+import math
 import numpy as np
 import scipy.constants as const
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple, Union
 import warnings
 
 # Default values for layer parameters
@@ -36,12 +39,155 @@ DEFAULT_K_HZ = float("inf")
 DEFAULT_TAU = 0.0
 DEFAULT_RQ = 0.0
 
+# Characteristic impedance of vacuum (Ohm), the surface impedance of 'V'.
+_Z0 = const.physical_constants["characteristic impedance of vacuum"][0]
+
+_VALID_TYPES = frozenset({"CW", "V", "PEC"})
+
+# Hammerstad roughness model: RS_rough = RS * (1 + 2/pi arctan(1.4 pi ...)).
+_TWO_OVER_PI = 2.0 / np.pi
+_ROUGHNESS_SCALE = 0.7 * 2.0 * np.pi
+
+# Rows of the fused frequency-domain buffer, in evaluation order.
+_FREQUENCY_ARRAYS = (
+    "mur", "RS", "sigmaDC_R", "sigmaAC", "sigmaPM", "delta", "deltaM",
+)
+
+# Entries kept by make_layer(). Each holds the frequency grid, the
+# frequency-domain arrays and KZ, about 100 MB for a 10**6 point grid.
+_MAKE_LAYER_CACHE_MAXSIZE = 8
+
 
 class LayerValidationError(Exception):
     """Exception raised for invalid layer parameters."""
     pass
 
 
+def _layer_type_error(newtype: object) -> LayerValidationError:
+    """Build the error raised for a layer type outside ``_VALID_TYPES``."""
+    return LayerValidationError(
+        f"'{newtype}' is not a valid layer type. "
+        f"Must be 'CW', 'V', or 'PEC'."
+    )
+
+
+def _readonly_array(values: Sequence, dtype: type) -> np.ndarray:
+    """
+    Return ``values`` as a read-only array of ``dtype``, copying only if needed.
+
+    An input that is already a read-only array of the right dtype (e.g.
+    :attr:`pytlwall.Frequencies.freq`) is shared as-is, so one grid can feed
+    many layers. A writable array owned by the caller is copied first, so
+    that later in-place edits on the caller's side cannot silently change
+    the layer behind its cache.
+    """
+    arr = np.asarray(values, dtype=dtype)
+    if arr.flags.writeable:
+        if isinstance(values, np.ndarray) and np.may_share_memory(arr, values):
+            arr = arr.copy()
+        arr.setflags(write=False)
+    return arr
+
+
+def _fill_frequency_arrays(
+    buf: np.ndarray,
+    f: np.ndarray,
+    omega: np.ndarray,
+    omega_sq: np.ndarray,
+    eps: Union[float, np.ndarray],
+    muinf_Hz: Union[float, np.ndarray],
+    k_Hz: Union[float, np.ndarray],
+    sigmaDC: Union[float, np.ndarray],
+    tau: Union[float, np.ndarray],
+    RQ: Union[float, np.ndarray],
+) -> None:
+    """
+    Fill ``buf`` with the frequency-domain material arrays.
+
+    ``buf`` has one leading entry per name in ``_FREQUENCY_ARRAYS``. The
+    material parameters are either scalars (one :class:`Layer`, ``buf`` of
+    shape ``(7, N_freq)``) or column vectors of shape ``(N_layer, 1)`` (a
+    :class:`LayerArray`, ``buf`` of shape ``(7, N_layer, N_freq)``); the
+    same in-place ufunc sequence broadcasts over both, so every
+    intermediate is computed once and no per-expression temporaries are
+    allocated beyond two scratch arrays.
+    """
+    mur, RS, sigmaDC_R, sigmaAC, sigmaPM, delta, deltaM = buf
+    mu = np.empty_like(mur)
+    tmp = np.empty_like(mur)
+
+    # mur = 1 + muinf / (1 + j f/k);  mu = mu0 * mur.
+    # A non-magnetic layer (muinf == 0) or one without relaxation
+    # (k == inf, the default) has a constant mur: skip the divide.
+    if not np.any(muinf_Hz):
+        mur.fill(1.0)
+    elif np.all(np.isinf(k_Hz)):
+        mur[...] = 1.0 + muinf_Hz
+    else:
+        np.multiply(1.0j, f / k_Hz, out=mur)
+        mur += 1.0
+        np.divide(muinf_Hz, mur, out=mur)
+        mur += 1.0
+    np.multiply(const.mu_0, mur, out=mu)
+
+    # RS = sqrt(mu pi f / sigmaDC) * (1 + 2/pi arctan(0.7 mu 2 pi f sigmaDC RQ^2))
+    np.multiply(mu, np.pi, out=RS)
+    RS *= f
+    RS /= sigmaDC
+    np.sqrt(RS, out=RS)
+    # A smooth surface (RQ == 0, the default) has arctan(0) == 0, i.e.
+    # a unit roughness factor: skip the transcendental pass entirely.
+    if np.any(RQ):
+        np.multiply(mu, f, out=tmp)
+        tmp *= _ROUGHNESS_SCALE * sigmaDC * RQ * RQ
+        np.arctan(tmp, out=tmp)
+        tmp *= _TWO_OVER_PI
+        tmp += 1.0
+        RS *= tmp
+
+    # sigmaDC_R = pi f mu / RS^2 where RS != 0, else sigmaDC + j.
+    # The sigmaAC row is not filled yet, so it holds RS^2 meanwhile.
+    sigmaDC_R[...] = sigmaDC + 1.0j
+    np.multiply(np.pi, f, out=tmp)
+    tmp *= mu
+    np.multiply(RS, RS, out=sigmaAC)
+    np.divide(tmp, sigmaAC, out=sigmaDC_R, where=RS != 0)
+
+    # sigmaAC = sigmaDC_R / (1 + j 2 pi tau f)
+    np.multiply(2.0j * const.pi * tau, f, out=tmp)
+    tmp += 1.0
+    np.divide(sigmaDC_R, tmp, out=sigmaAC)
+
+    # sigmaPM = sqrt((2 pi f eps)^2 + sigmaAC^2)
+    np.square(sigmaAC, out=sigmaPM)
+    omega_eps = omega * eps
+    omega_eps *= omega_eps
+    sigmaPM += omega_eps
+    np.sqrt(sigmaPM, out=sigmaPM)
+
+    # delta, deltaM = sqrt(2 / (2 pi f mu sigmaAC +/- j mu eps (2 pi f)^2))
+    np.multiply(omega, mu, out=delta)
+    delta *= sigmaAC
+    np.multiply(1.0j, mu, out=tmp)
+    tmp *= eps
+    tmp *= omega_sq
+    # With real mu and sigmaAC (no magnetic or conductivity relaxation)
+    # the two denominators are complex conjugates, and so are their
+    # square roots: deltaM then costs one conjugate instead of a
+    # divide + sqrt pass.
+    real_terms = not (np.any(mu.imag) or np.any(sigmaAC.imag))
+    if not real_terms:
+        np.subtract(delta, tmp, out=deltaM)
+    delta += tmp
+    np.divide(2.0, delta, out=delta)
+    np.sqrt(delta, out=delta)
+    if real_terms:
+        np.conjugate(delta, out=deltaM)
+    else:
+        np.divide(2.0, deltaM, out=deltaM)
+        np.sqrt(deltaM, out=deltaM)
+
+
 class Layer:
     """
     Material layer with electromagnetic properties.
@@ -99,6 +245,9 @@ class Layer:
     a future revision.
     """
 
+    # Set on the shared instances built by make_layer().
+    _frozen = False
+
     def __init__(
         self,
         layer_type: str = DEFAULT_TYPE,
@@ -124,9 +273,12 @@ class Layer:
         longer silently overrides it with 'V'.
         """
  
-        # Save the boundary flag as a public attribute so other parts of
-        # the code (and diagnostics) can introspect it.
-        self.boundary = bool(boundary)
+        # Boundary flag, public through the ``boundary`` property so other
+        # parts of the code (and diagnostics) can introspect it.
+        self._boundary = bool(boundary)
+
+        # Memoized frequency-domain results, cleared by every setter.
+        self._cache: Dict[str, np.ndarray] = {}
  
         # Initialize private attributes with defaults
         self._thick_m = DEFAULT_THICK_M
@@ -137,21 +289,21 @@ class Layer:
         self._tau = DEFAULT_TAU
         self._RQ = DEFAULT_RQ
         self._freq_Hz = np.array([], dtype=float)
+        self._omega = np.array([], dtype=float)
+        self._omega_sq = np.array([], dtype=float)
         self._time_s = np.array([], dtype=float)
  
         # Layer type — always honour what the caller passed.
         # (Previously a boundary layer was forced to 'V', which silently
         # discarded 'PEC' / 'CW' boundaries set via cfg_io.)
-        self._layer_type = (
-            layer_type.upper() if isinstance(layer_type, str) else DEFAULT_TYPE
-        )
+        upper = layer_type.upper() if isinstance(layer_type, str) else DEFAULT_TYPE
+        if upper not in _VALID_TYPES:
+            raise _layer_type_error(layer_type)
+        self._layer_type = upper
  
         # Optional: surface impedance can be set directly
         self._KZ: Optional[np.ndarray] = None
  
-        # Re-apply through the public setter for validation
-        self.layer_type = self._layer_type
- 
         if freq_Hz is not None:
             self.freq_Hz = freq_Hz
         if time_s is not None:
@@ -184,13 +336,27 @@ class Layer:
     @layer_type.setter
     def layer_type(self, newtype: str) -> None:
         upper = str(newtype).upper()
-        if upper in ("CW", "V", "PEC"):
-            self._layer_type = upper
-        else:
-            raise LayerValidationError(
-                f"'{newtype}' is not a valid layer type. "
-                f"Must be 'CW', 'V', or 'PEC'."
-            )
+        if upper == self._layer_type:
+            return
+        self._ensure_mutable()
+        if upper not in _VALID_TYPES:
+            raise _layer_type_error(newtype)
+        self._layer_type = upper
+        self._invalidate()
+
+    @property
+    def boundary(self) -> bool:
+        """Whether this is the outermost (boundary) layer."""
+        return self._boundary
+
+    @boundary.setter
+    def boundary(self, newboundary: bool) -> None:
+        tmp_boundary = bool(newboundary)
+        if tmp_boundary == self._boundary:
+            return
+        self._ensure_mutable()
+        self._boundary = tmp_boundary
+        self._invalidate()
 
     @property
     def thick_m(self) -> float:
@@ -201,11 +367,15 @@ class Layer:
     def thick_m(self, newthick: float) -> None:
         try:
             tmp_thick = float(newthick)
+            if tmp_thick == self._thick_m:
+                return
+            self._ensure_mutable()
             if tmp_thick <= 0:
                 raise LayerValidationError(
                     f"Thickness must be positive, got {tmp_thick} m"
                 )
             self._thick_m = tmp_thick
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid thickness value '{newthick}': {e}"
@@ -220,11 +390,15 @@ class Layer:
     def epsr(self, newepsr: float) -> None:
         try:
             tmp_epsr = float(newepsr)
+            if tmp_epsr == self._epsr:
+                return
+            self._ensure_mutable()
             if tmp_epsr <= 0:
                 raise LayerValidationError(
                     f"Relative permittivity must be positive, got {tmp_epsr}"
                 )
             self._epsr = tmp_epsr
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid relative permittivity '{newepsr}': {e}"
@@ -238,7 +412,12 @@ class Layer:
     @muinf_Hz.setter
     def muinf_Hz(self, newmuinf_Hz: float) -> None:
         try:
-            self._muinf_Hz = float(newmuinf_Hz)
+            tmp_muinf_Hz = float(newmuinf_Hz)
+            if tmp_muinf_Hz == self._muinf_Hz:
+                return
+            self._ensure_mutable()
+            self._muinf_Hz = tmp_muinf_Hz
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid permeability parameter '{newmuinf_Hz}': {e}"
@@ -253,11 +432,15 @@ class Layer:
     def k_Hz(self, newk_Hz: float) -> None:
         try:
             tmp_k_Hz = float(newk_Hz)
+            if tmp_k_Hz == self._k_Hz:
+                return
+            self._ensure_mutable()
             if tmp_k_Hz <= 0 and not np.isinf(tmp_k_Hz):
                 raise LayerValidationError(
                     f"Relaxation frequency must be positive or inf, got {tmp_k_Hz}"
                 )
             self._k_Hz = tmp_k_Hz
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid relaxation frequency '{newk_Hz}': {e}"
@@ -272,11 +455,15 @@ class Layer:
     def sigmaDC(self, newsigmaDC: float) -> None:
         try:
             tmp_sigmaDC = float(newsigmaDC)
+            if tmp_sigmaDC == self._sigmaDC:
+                return
+            self._ensure_mutable()
             if tmp_sigmaDC < 0:
                 raise LayerValidationError(
                     f"DC conductivity must be non-negative, got {tmp_sigmaDC}"
                 )
             self._sigmaDC = tmp_sigmaDC
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid DC conductivity '{newsigmaDC}': {e}"
@@ -291,11 +478,15 @@ class Layer:
     def tau(self, newtau: float) -> None:
         try:
             tmp_tau = float(newtau)
+            if tmp_tau == self._tau:
+                return
+            self._ensure_mutable()
             if tmp_tau < 0:
                 raise LayerValidationError(
                     f"Relaxation time must be non-negative, got {tmp_tau}"
                 )
             self._tau = tmp_tau
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid relaxation time '{newtau}': {e}"
@@ -310,11 +501,15 @@ class Layer:
     def RQ(self, newRQ: float) -> None:
         try:
             tmp_RQ = float(newRQ)
+            if tmp_RQ == self._RQ:
+                return
+            self._ensure_mutable()
             if tmp_RQ < 0:
                 raise LayerValidationError(
                     f"Surface roughness must be non-negative, got {tmp_RQ}"
                 )
             self._RQ = tmp_RQ
+            self._invalidate()
         except (ValueError, TypeError) as e:
             raise LayerValidationError(
                 f"Invalid surface roughness '{newRQ}': {e}"
@@ -327,11 +522,20 @@ class Layer:
 
     @freq_Hz.setter
     def freq_Hz(self, newfreq_Hz: Sequence[float]) -> None:
+        if newfreq_Hz is self._freq_Hz:
+            return
         try:
-            tmp_freq_Hz = np.array(newfreq_Hz, dtype=float)
-            if np.any(tmp_freq_Hz <= 0):
+            tmp_freq_Hz = _readonly_array(newfreq_Hz, float)
+            if tmp_freq_Hz.size and tmp_freq_Hz.min() <= 0:
                 raise LayerValidationError("All frequencies must be positive")
+            if np.array_equal(tmp_freq_Hz, self._freq_Hz):
+                return
+            self._ensure_mutable()
             self._freq_Hz = tmp_freq_Hz
+            # Angular frequency and its square feed every _calc_* formula.
+            self._omega = 2.0 * const.pi * tmp_freq_Hz
+            self._omega_sq = self._omega * self._omega
+            self._invalidate()
         except (TypeError, ValueError) as e:
             raise LayerValidationError(f"Invalid frequency array: {e}")
 
@@ -348,9 +552,10 @@ class Layer:
 
     @time_s.setter
     def time_s(self, newtime_s: Sequence[float]) -> None:
+        self._ensure_mutable()
         try:
-            tmp_time_s = np.array(newtime_s, dtype=float)
-            if tmp_time_s.size > 0 and np.any(tmp_time_s <= 0):
+            tmp_time_s = _readonly_array(newtime_s, float)
+            if tmp_time_s.size and tmp_time_s.min() <= 0:
                 raise LayerValidationError("All time samples must be positive")
             self._time_s = tmp_time_s
         except (TypeError, ValueError) as e:
@@ -373,28 +578,33 @@ class Layer:
         Notes
         -----
         If not explicitly set, calculates default surface impedance as
-        ``KZ = (1 + j) / (sigmaPM * deltaM)``.
+        ``KZ = (1 + j) / (sigmaPM * deltaM)``. Vacuum (``'V'``) and
+        perfect-conductor (``'PEC'``) layers skip the material pipeline and
+        return the constants used by :class:`pytlwall.TLWall`: ``Z0`` and
+        ``0`` respectively.
         """
         if self._KZ is not None:
             return self._KZ
-
-        omega = 2.0 * const.pi * self.freq_Hz
-        eps_complex = self.eps - 1.0j * self.sigmaAC / omega
-        KZ = (1.0 + 1.0j) / (self.sigmaPM * self.deltaM)
+        if self._layer_type == "PEC":
+            return np.zeros(self._freq_Hz.shape, dtype=complex)
+        if self._layer_type == "V":
+            return np.full(self._freq_Hz.shape, _Z0, dtype=complex)
+
+        KZ = self._cache.get("KZ")
+        if KZ is None:
+            KZ = np.multiply(self._calc_sigmaPM(), self._calc_deltaM())
+            np.divide(1.0 + 1.0j, KZ, out=KZ)
+            KZ.setflags(write=False)
+            self._cache["KZ"] = KZ
         return KZ
 
     @KZ.setter
     def KZ(self, newKZ: np.ndarray) -> None:
-        is_complex = np.iscomplex(newKZ)
-        if isinstance(is_complex, np.ndarray):
-            valid = is_complex.all()
-        else:
-            valid = bool(is_complex)
-
-        if not valid:
+        self._ensure_mutable()
+        if not np.iscomplexobj(newKZ):
             raise LayerValidationError("Surface impedance must be complex-valued")
 
-        self._KZ = np.array(newKZ, dtype=complex)
+        self._KZ = _readonly_array(newKZ, complex)
 
     def set_surf_imped(
         self,
@@ -404,13 +614,8 @@ class Layer:
         """
         Set surface impedance with interpolation to layer frequencies.
         """
-        is_complex = np.iscomplex(newKZ)
-        if isinstance(is_complex, np.ndarray):
-            valid = is_complex.all()
-        else:
-            valid = bool(is_complex)
-
-        if not valid:
+        self._ensure_mutable()
+        if not np.iscomplexobj(newKZ):
             raise LayerValidationError("Surface impedance must be complex-valued")
 
         try:
@@ -418,11 +623,11 @@ class Layer:
         except (TypeError, ValueError) as e:
             raise LayerValidationError(f"Invalid frequency array: {e}")
 
-        tmp_KZ = np.array(newKZ, dtype=complex)
+        tmp_KZ = np.asarray(newKZ, dtype=complex)
 
-        real_part = np.interp(self._freq_Hz, freq, tmp_KZ.real)
-        imag_part = np.interp(self._freq_Hz, freq, tmp_KZ.imag)
-        self._KZ = real_part + 1j * imag_part
+        # np.interp accepts complex ordinates directly: one search per
+        # target frequency instead of separate real/imaginary passes.
+        self._KZ = np.interp(self._freq_Hz, freq, tmp_KZ)
 
     # ========================================================================
     # Calculated Properties — Frequency Domain (unchanged)
@@ -475,77 +680,84 @@ class Layer:
 
     @property
     def kprop(self) -> np.ndarray:
-        """Propagation constant ``(1 - j) / δ`` (frequency domain)."""
+        """
+        Propagation constant ``(1 - j) / δ`` (frequency domain).
+
+        For a vacuum (``'V'``) layer this is the free-space wavenumber
+        ``2πf / c``.
+        """
+        if self._layer_type == "V":
+            return (self._omega / const.c).astype(complex)
         return (1.0 - 1.0j) / self.delta
 
     # ========================================================================
-    # Calculation Methods — Frequency Domain (unchanged)
+    # Calculation Methods — Frequency Domain
     # ========================================================================
 
+    def _invalidate(self) -> None:
+        """Drop every memoized frequency-domain result."""
+        self._cache.clear()
+
+    def _ensure_mutable(self) -> None:
+        """Reject changes to a shared instance returned by :func:`make_layer`."""
+        if self._frozen:
+            raise LayerValidationError(
+                "This Layer is shared by make_layer() and cannot be modified; "
+                "build a new Layer instead"
+            )
+
+    def _frequency_array(self, name: str) -> np.ndarray:
+        """Return one read-only row of :meth:`_compute_frequency_arrays`."""
+        if name not in self._cache:
+            self._compute_frequency_arrays()
+        return self._cache[name]
+
+    def _compute_frequency_arrays(self) -> None:
+        """
+        Evaluate the whole frequency-domain pipeline in one sweep.
+
+        All results live in a single ``(len(_FREQUENCY_ARRAYS), N_freq)``
+        complex buffer filled by :func:`_fill_frequency_arrays`. The rows
+        are stored read-only in ``self._cache`` under the names listed in
+        ``_FREQUENCY_ARRAYS``.
+        """
+        buf = np.empty(
+            (len(_FREQUENCY_ARRAYS), self._freq_Hz.size), dtype=np.complex128
+        )
+        _fill_frequency_arrays(
+            buf, self._freq_Hz, self._omega, self._omega_sq, self.eps,
+            self._muinf_Hz, self._k_Hz, self._sigmaDC, self._tau, self._RQ,
+        )
+        buf.setflags(write=False)
+        self._cache.update(zip(_FREQUENCY_ARRAYS, buf))
+
     def _calc_sigmaAC(self) -> np.ndarray:
         """``σ_AC = σ_DC_R / (1 + j·2π·τ·f)``."""
-        return self.sigmaDC_R / (
-            1.0 + 2.0j * const.pi * self.tau * self.freq_Hz
-        )
+        return self._frequency_array("sigmaAC")
 
     def _calc_mur(self) -> np.ndarray:
         """``μᵣ = 1 + μ_inf / (1 + j·f/k)``."""
-        return 1.0 + self.muinf_Hz / (1.0 + 1.0j * (self.freq_Hz / self.k_Hz))
+        return self._frequency_array("mur")
 
     def _calc_sigmaPM(self) -> np.ndarray:
         """``σ_PM = √[(2πfε)² + |σ_AC|²]``."""
-        return np.sqrt(
-            (2.0 * const.pi * self.freq_Hz * self.eps) ** 2
-            + self.sigmaAC ** 2
-        )
+        return self._frequency_array("sigmaPM")
 
     def _calc_delta(self) -> np.ndarray:
         """``δ = √[2 / (2πfμσ_AC + j·με(2πf)²)]``."""
-        return np.sqrt(
-            2.0
-            / (
-                2.0 * const.pi * self.freq_Hz * self.mu * self.sigmaAC
-                + 1.0j * self.mu * self.eps * (2.0 * const.pi * self.freq_Hz) ** 2
-            )
-        )
+        return self._frequency_array("delta")
 
     def _calc_deltaM(self) -> np.ndarray:
         """``δ_M = √[2 / (2πfμσ_AC - j·με(2πf)²)]``."""
-        return np.sqrt(
-            2.0
-            / (
-                2.0 * const.pi * self.freq_Hz * self.mu * self.sigmaAC
-                - 1.0j * self.mu * self.eps * (2.0 * const.pi * self.freq_Hz) ** 2
-            )
-        )
+        return self._frequency_array("deltaM")
 
     def _calc_RS(self) -> np.ndarray:
         """Surface resistance with Hammerstad roughness model."""
-        return (
-            np.sqrt(self.mu * np.pi * self.freq_Hz / self.sigmaDC)
-            * (
-                1.0
-                + (2.0 / np.pi)
-                * np.arctan(
-                    0.7 * self.mu * 2.0 * np.pi * self.freq_Hz
-                    * self.sigmaDC * self.RQ ** 2
-                )
-            )
-        )
+        return self._frequency_array("RS")
 
     def _calc_sigmaDC_R(self) -> np.ndarray:
         """DC conductivity with roughness correction."""
-        sigmaDC = (
-            np.ones(len(self.freq_Hz)) * self.sigmaDC
-            + 1.0j * np.ones(len(self.freq_Hz))
-        )
-        RS_calc = self._calc_RS()
-        mask = RS_calc != 0
-
-        sigmaDC[mask] = (
-            np.pi * self.freq_Hz[mask] * self.mu / RS_calc[mask] ** 2
-        )
-        return sigmaDC
+        return self._frequency_array("sigmaDC_R")
 
     # ========================================================================
     # Calculated Properties — Time Domain (new in this revision)
@@ -642,10 +854,9 @@ class Layer:
         correction applied in the frequency domain — see the roughness
         note at the top of the time-domain section.
         """
-        return np.sqrt(
-            (2.0 * const.pi * self.eps / self._time_s) ** 2
-            + self._sigma_dc_effective ** 2
-        )
+        omega_eps = 2.0 * const.pi * self.eps / self._time_s
+        sigma = self._sigma_dc_effective
+        return np.sqrt(omega_eps * omega_eps + sigma * sigma)
 
     @property
     def deltaM_time(self) -> np.ndarray:
@@ -666,7 +877,7 @@ class Layer:
         — i.e. ``4π²/t²`` — matching the MATLAB ``4*pi*pi./t./t``.
         """
         omega_t = 2.0 * const.pi / self._time_s
-        omega_t_sq = omega_t ** 2
+        omega_t_sq = omega_t * omega_t
         return np.sqrt(
             2.0
             / (
@@ -698,7 +909,7 @@ class Layer:
         prefactor of ``Zita_bound``).
         """
         omega_t = 2.0 * const.pi / self._time_s
-        omega_t_sq = omega_t ** 2
+        omega_t_sq = omega_t * omega_t
         return np.sqrt(
             4.0 * const.pi
             / (
@@ -725,6 +936,104 @@ class Layer:
         """
         return (1.0 - 1.0j) / self.deltaM_time
 
+    # ========================================================================
+    # Single-frequency evaluation
+    # ========================================================================
+
+    def eval_at(self, f: float) -> Dict[str, complex]:
+        """
+        Evaluate the frequency-domain quantities at a single frequency.
+
+        Uses plain Python ``complex``/``cmath`` arithmetic, so no NumPy
+        array is built; intended for root-finding and other callers that
+        probe one frequency at a time. ``freq_Hz`` and the array cache are
+        left untouched.
+
+        Parameters
+        ----------
+        f : float
+            Frequency in Hz (must be positive).
+
+        Returns
+        -------
+        dict
+            ``mur``, ``RS``, ``sigmaDC_R``, ``sigmaAC``, ``sigmaPM``,
+            ``delta``, ``deltaM``, ``KZ`` and ``kprop`` as Python complex
+            numbers, matching the corresponding array properties. A surface
+            impedance set explicitly through ``KZ`` or
+            :meth:`set_surf_imped` is not used: ``KZ`` is always the value
+            of the material model (or the V/PEC constant).
+        """
+        try:
+            f = float(f)
+        except (TypeError, ValueError) as e:
+            raise LayerValidationError(f"Invalid frequency '{f}': {e}")
+        if not f > 0:
+            raise LayerValidationError("Frequency must be positive")
+
+        omega = 2.0 * const.pi * f
+        eps = self.eps
+        sigmaDC = self._sigmaDC
+
+        mur = 1.0 + self._muinf_Hz / (1.0 + 1.0j * (f / self._k_Hz))
+        mu = const.mu_0 * mur
+
+        if sigmaDC:
+            RS = cmath.sqrt(mu * np.pi * f / sigmaDC)
+        else:
+            RS = complex(math.inf, math.nan)
+        if self._RQ:
+            RS *= 1.0 + _TWO_OVER_PI * cmath.atan(
+                mu * f * (_ROUGHNESS_SCALE * sigmaDC * self._RQ * self._RQ)
+            )
+
+        sigmaDC_R = np.pi * f * mu / (RS * RS) if RS != 0 else sigmaDC + 1.0j
+        sigmaAC = sigmaDC_R / (1.0 + 2.0j * const.pi * self._tau * f)
+        omega_eps = omega * eps
+        sigmaPM = cmath.sqrt(omega_eps * omega_eps + sigmaAC * sigmaAC)
+
+        a = omega * mu * sigmaAC
+        b = 1.0j * mu * eps * omega * omega
+        delta = cmath.sqrt(2.0 / (a + b))
+        deltaM = cmath.sqrt(2.0 / (a - b))
+
+        if self._layer_type == "PEC":
+            KZ, kprop = 0j, (1.0 - 1.0j) / delta
+        elif self._layer_type == "V":
+            KZ, kprop = complex(_Z0), complex(omega / const.c)
+        else:
+            KZ, kprop = (1.0 + 1.0j) / (sigmaPM * deltaM), (1.0 - 1.0j) / delta
+
+        return {
+            "mur": mur,
+            "RS": RS,
+            "sigmaDC_R": sigmaDC_R,
+            "sigmaAC": sigmaAC,
+            "sigmaPM": sigmaPM,
+            "delta": delta,
+            "deltaM": deltaM,
+            "KZ": KZ,
+            "kprop": kprop,
+        }
+
+    # ========================================================================
+    # Batched evaluation
+    # ========================================================================
+
+    def to_array_row(self) -> Tuple:
+        """
+        Return this layer's parameters as one :class:`LayerArray` row.
+
+        Returns
+        -------
+        tuple
+            ``(layer_type, boundary)`` followed by the scalar parameters in
+            ``LayerArray.PARAMETERS`` order.
+        """
+        return (self._layer_type, self._boundary) + tuple(
+            getattr(self, "_" + name) for name in LayerArray.PARAMETERS
+        )
+
     # ========================================================================
     # Dunder methods
     # ========================================================================
@@ -741,3 +1050,169 @@ class Layer:
 
     def __str__(self) -> str:
         return repr(self)
+
+
+@functools.lru_cache(maxsize=_MAKE_LAYER_CACHE_MAXSIZE)
+def _make_layer_cached(
+    layer_type: str,
+    boundary: bool,
+    params: Tuple[float, ...],
+    freq_bytes: bytes,
+) -> Layer:
+    """Build, precompute and freeze one shared :class:`Layer`."""
+    layer = Layer(
+        layer_type=layer_type,
+        freq_Hz=np.frombuffer(freq_bytes, dtype=np.float64),
+        boundary=boundary,
+        **dict(zip(LayerArray.PARAMETERS, params)),
+    )
+    layer.KZ  # fills the cache before the instance is shared
+    layer._frozen = True
+    return layer
+
+
+def make_layer(
+    layer_type: str = DEFAULT_TYPE,
+    thick_m: float = DEFAULT_THICK_M,
+    muinf_Hz: float = DEFAULT_MUINF_HZ,
+    epsr: float = DEFAULT_EPSR,
+    sigmaDC: float = DEFAULT_SIGMADC,
+    k_Hz: float = DEFAULT_K_HZ,
+    tau: float = DEFAULT_TAU,
+    RQ: float = DEFAULT_RQ,
+    freq_Hz: Optional[Sequence[float]] = None,
+    boundary: bool = False,
+) -> Layer:
+    """
+    Return a shared, read-only :class:`Layer` for the given parameters.
+
+    Parameter sweeps often rebuild identical layers; this factory keys a
+    small LRU cache on the scalar parameters and the bytes of the
+    frequency grid, so repeated calls return the same instance with its
+    frequency-domain arrays and ``KZ`` already computed. Call
+    :func:`clear_layer_cache` to release the cached layers.
+
+    Parameters
+    ----------
+    Same as :class:`Layer` (``time_s`` is not supported).
+
+    Returns
+    -------
+    Layer
+        A frozen instance: setters that would change a value raise
+        :class:`LayerValidationError`. Re-assigning the current value (as
+        :class:`pytlwall.TlWall` does with an identical frequency grid) is
+        accepted.
+    """
+    upper = layer_type.upper() if isinstance(layer_type, str) else DEFAULT_TYPE
+    try:
+        params = tuple(
+            float(value)
+            for value in (thick_m, muinf_Hz, epsr, sigmaDC, k_Hz, tau, RQ)
+        )
+        freq = np.ascontiguousarray(
+            [] if freq_Hz is None else freq_Hz, dtype=np.float64
+        )
+    except (TypeError, ValueError) as e:
+        raise LayerValidationError(f"Invalid layer parameters: {e}")
+    return _make_layer_cached(upper, bool(boundary), params, freq.tobytes())
+
+
+def clear_layer_cache() -> None:
+    """Release the shared layers cached by :func:`make_layer`."""
+    _make_layer_cached.cache_clear()
+
+
+class LayerArray:
+    """
+    Structure-of-arrays companion of :class:`Layer` for batched evaluation.
+
+    Stores the scalar parameters of ``N_layer`` layers as arrays of shape
+    ``(N_layer,)`` sharing one frequency grid, so that the frequency-domain
+    pipeline can be evaluated for every layer in a single broadcast pass
+    instead of once per :class:`Layer` object.
+
+    Parameters
+    ----------
+    layers : sequence of Layer
+        Layers to batch, in order.
+    freq_Hz : array-like, optional
+        Shared frequency grid in Hz. Default is the grid of the first layer.
+
+    Notes
+    -----
+    Only the material parameters are batched: a surface impedance set
+    explicitly on a :class:`Layer` (``KZ`` or :meth:`Layer.set_surf_imped`)
+    is not carried over.
+    """
+
+    PARAMETERS = ("thick_m", "muinf_Hz", "epsr", "sigmaDC", "k_Hz", "tau", "RQ")
+
+    def __init__(
+        self,
+        layers: Sequence[Layer],
+        freq_Hz: Optional[Sequence[float]] = None,
+    ) -> None:
+        if not layers:
+            raise LayerValidationError("LayerArray needs at least one layer")
+        rows = [layer.to_array_row() for layer in layers]
+        self.layer_type: Tuple[str, ...] = tuple(row[0] for row in rows)
+        self.boundary: Tuple[bool, ...] = tuple(row[1] for row in rows)
+        params = np.array([row[2:] for row in rows], dtype=float).T
+        params.setflags(write=False)
+        for name, column in zip(self.PARAMETERS, params):
+            setattr(self, name, column)
+
+        # Validate the shared grid through a scratch Layer.
+        grid = Layer(freq_Hz=layers[0].freq_Hz if freq_Hz is None else freq_Hz)
+        self.freq_Hz: np.ndarray = grid.freq_Hz
+        self._omega = grid._omega
+        self._omega_sq = grid._omega_sq
+
+    def __len__(self) -> int:
+        return len(self.layer_type)
+
+    def __getitem__(self, index: int) -> Layer:
+        """Rebuild row ``index`` as a standalone :class:`Layer`."""
+        return Layer(
+            layer_type=self.layer_type[index],
+            freq_Hz=self.freq_Hz,
+            boundary=self.boundary[index],
+            **{name: getattr(self, name)[index] for name in self.PARAMETERS},
+        )
+
+    def compute_all(self) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the frequency-domain pipeline for every layer at once.
+
+        Returns
+        -------
+        dict
+            ``sigmaAC``, ``sigmaPM``, ``mur``, ``delta``, ``deltaM``,
+            ``RS``, ``sigmaDC_R``, ``KZ`` and ``kprop``, each a complex array
+            of shape ``(N_layer, N_freq)``. Row ``i`` matches the
+            corresponding property of ``self[i]``, including the constant
+            ``KZ``/``kprop`` of vacuum and PEC layers.
+        """
+        buf = np.empty(
+            (len(_FREQUENCY_ARRAYS), len(self), self.freq_Hz.size),
+            dtype=np.complex128,
+        )
+        column = (slice(None), None)
+        _fill_frequency_arrays(
+            buf, self.freq_Hz, self._omega, self._omega_sq,
+            const.epsilon_0 * self.epsr[column],
+            self.muinf_Hz[column], self.k_Hz[column], self.sigmaDC[column],
+            self.tau[column], self.RQ[column],
+        )
+        result = dict(zip(_FREQUENCY_ARRAYS, buf))
+
+        result["KZ"] = (1.0 + 1.0j) / (result["sigmaPM"] * result["deltaM"])
+        result["kprop"] = (1.0 - 1.0j) / result["delta"]
+        for row, layer_type in enumerate(self.layer_type):
+            if layer_type == "PEC":
+                result["KZ"][row] = 0.0
+            elif layer_type == "V":
+                result["KZ"][row] = _Z0
+                result["kprop"][row] = self._omega / const.c
+        return result
@@ -12,17 +12,136 @@ Features:
 - Configurable verbosity levels
 - Both file and console output
 - Consistent formatting across all modules
+- Asynchronous output: records are queued and written by a listener thread
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# Default section separator
+_SEP_80 = "=" * 80
+
+_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Buffer size of the log file (64 KiB) and interval of its periodic flush
+_LOG_BUFFER_SIZE = 1 << 16
+_LOG_FLUSH_INTERVAL_S = 1.0
+
+# Listener thread owning the real output handlers (set by setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter reusing the formatted asctime within the same second."""
+    
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        self._last_second: Optional[int] = None
+        self._last_asctime = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        # datefmt has a resolution of one second
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_asctime
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers writes and flushes periodically.
+    
+    ``logging.FileHandler`` flushes after every record; this handler writes
+    INFO and DEBUG records through a large buffer instead and a background
+    thread flushes it every ``flush_interval`` seconds. Records at
+    ``flush_level`` or above are flushed immediately, so warnings and errors
+    reach the file even if the process dies. The buffer is always flushed
+    on close.
+    
+    Parameters
+    ----------
+    filename : str or Path
+        Log file path
+    mode : str
+        File open mode
+    encoding : str, optional
+        File encoding
+    buffer_size : int
+        Size in bytes of the file buffer
+    flush_interval : float
+        Seconds between periodic flushes
+    flush_level : int
+        Records at this level or above are flushed immediately
+    """
+    
+    def __init__(
+        self,
+        filename: str | Path,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        buffer_size: int = _LOG_BUFFER_SIZE,
+        flush_interval: float = _LOG_FLUSH_INTERVAL_S,
+        flush_level: int = logging.WARNING,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="pytlwall-log-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, flushing it for severe records."""
+        if self.stream is None:
+            if self.mode != "w" or not getattr(self, "_closed", False):
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Stop the periodic flush, then flush and close the file."""
+        self._stop_flusher.set()
+        super().close()
+    
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+
 class LogConfig:
     """
     Configuration class for logging setup.
@@ -99,7 +218,9 @@ def setup_logging(config: Optional[LogConfig] = None) -> Path:
     Configure logging for PyTLWall.
     
     This function sets up the root logger with appropriate handlers
-    for both file and console output (if enabled).
+    for both file and console output (if enabled). The root logger only
+    enqueues records; a listener thread writes them to the handlers
+    (see :func:`shutdown_logging`).
     
     Parameters
     ----------
@@ -134,31 +255,61 @@ def setup_logging(config: Optional[LogConfig] = None) -> Path:
     log_path = config.get_log_path()
     log_level = config.get_log_level()
     
-    # Clear any existing handlers to avoid duplicates
+    # Stop a previous listener (flushing its records) and clear any
+    # existing handlers to avoid duplicates
+    shutdown_logging()
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Create handlers list
     handlers = [
-        logging.FileHandler(log_path, mode='w', encoding='utf-8'),
+        BufferedFileHandler(log_path, mode='w', encoding='utf-8'),
     ]
     
     if config.console_output:
         handlers.append(logging.StreamHandler(sys.stdout))
     
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=handlers,
-        force=True,  # Override any existing configuration
+    formatter = _SecondCachedFormatter(_LOG_FORMAT, _LOG_DATEFMT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # The root logger only enqueues records; the listener thread does the
+    # formatting and I/O, so logging calls never block on write/flush
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+    
+    global _listener
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    _listener.start()
     
     return log_path
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the logging listener thread started by :func:`setup_logging`.
+    
+    Queued records are written and the output handlers are closed.
+    Called automatically at interpreter exit; call it explicitly to make
+    sure the log file is complete before reading it.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -201,9 +352,12 @@ def log_section_header(logger: logging.Logger, title: str, char: str = "=", widt
     >>> logger = get_logger(__name__)
     >>> log_section_header(logger, "TEST RESULTS")
     """
-    logger.info(char * width)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    sep = _SEP_80 if char == "=" and width == 80 else char * width
+    logger.info(sep)
     logger.info(title)
-    logger.info(char * width)
+    logger.info(sep)
 
 
 def log_test_summary(
@@ -235,9 +389,9 @@ def log_test_summary(
     >>> log_test_summary(logger, tests_run=10, failures=0, errors=0, success=True)
     """
     log_section_header(logger, "TEST SUMMARY")
-    logger.info(f"Tests run: {tests_run}")
-    logger.info(f"Failures: {failures}")
-    logger.info(f"Errors: {errors}")
+    logger.info("Tests run: %s", tests_run)
+    logger.info("Failures: %s", failures)
+    logger.info("Errors: %s", errors)
     logger.info("")
     
     if success:
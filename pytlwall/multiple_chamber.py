@@ -8,7 +8,8 @@ total impedances.
 
 Memory-efficient architecture:
 - load(): Only loads apertype + geometry (lightweight)
-- calculate_all(): Processes one element at a time, writes to file, keeps only totals
+- calculate_all(): Processes one element at a time, writes to a binary .npz
+  file, keeps only totals (written to total/total_impedances.xlsx)
 - get_element_data(i): Reads from file on-demand
 - plot_element(i): Reads from file and plots on-demand
 
@@ -17,7 +18,14 @@ This prevents memory issues with large lattices (100+ elements).
 
 from __future__ import annotations
 
-import gc
+import copy
+import functools
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
@@ -31,6 +39,9 @@ from .tlwall import TlWall
 from . import plot_util
 
 
+logger = logging.getLogger(__name__)
+
+
 # Default mapping from aperture type name to cfg filename
 # Users can define custom mappings (e.g., "Oblong2" -> "Oblong2.cfg")
 DEFAULT_APERTYPE_TO_CFG: Dict[str, str] = {
@@ -41,6 +52,95 @@ DEFAULT_APERTYPE_TO_CFG: Dict[str, str] = {
 }
 
 
+# Resolution of saved plots: per-element plots are many and for screen use
+_ELEMENT_PLOT_DPI = 150
+_TOTAL_PLOT_DPI = 300
+
+
+# Background writers of element files in serial calculate_all(), and the
+# number of calculated elements allowed to wait for their write
+_WRITER_THREADS = 2
+_MAX_PENDING_WRITES = 4
+
+# Block length of the early-exit scan in _is_non_trivial_impedance
+_SCAN_BLOCK = 4096
+
+
+# Per-process calculator used by calculate_all() worker processes
+_worker_mc: Optional["MultipleChamber"] = None
+
+
+def _chamber_name(index: int) -> str:
+    """Directory and file stem of one element's output."""
+    return f"chamber_{index:03d}"
+
+
+def _element_file(chambers_dir: str, index: int) -> str:
+    """Impedance file of one element under the chambers directory."""
+    name = _chamber_name(index)
+    return os.path.join(chambers_dir, name, name + "_impedances.npz")
+
+
+def _init_worker(
+    apertype_file: str,
+    geom_file: str,
+    input_dir: str,
+    out_dir: str,
+    apertype_to_cfg: Dict[str, str],
+    lattice: Tuple[List[str], List[float], List[float], List[float], List[float]],
+    freq_obj: Optional[Frequencies],
+    freqs: Optional[np.ndarray],
+    log_queue: Any,
+    log_level: int,
+) -> None:
+    """Set up the calculator once per worker process from the parent's state."""
+    global _worker_mc
+    # Send all records to the parent, which writes them with its handlers
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+    _worker_mc = MultipleChamber(
+        apertype_file=apertype_file,
+        geom_file=geom_file,
+        input_dir=input_dir,
+        out_dir=out_dir,
+        apertype_to_cfg=apertype_to_cfg,
+    )
+    (
+        _worker_mc.apertypes,
+        _worker_mc.b_list,
+        _worker_mc.L_list,
+        _worker_mc.betax_list,
+        _worker_mc.betay_list,
+    ) = lattice
+    _worker_mc._freq_obj_ref = freq_obj
+    _worker_mc._freqs_array = freqs
+    _worker_mc._loaded = True
+
+
+class _WorkerLogForwarder(logging.Handler):
+    """Pass records from worker processes to the parent's loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        target = logging.getLogger(record.name)
+        if target.isEnabledFor(record.levelno):
+            target.handle(record)
+
+
+def _worker_element(
+    index: int, chambers_dir: str
+) -> Tuple[int, Optional[Dict[str, np.ndarray]], Optional[str]]:
+    """Calculate and save one element in a worker process."""
+    try:
+        impedances = _worker_mc._calculate_and_save(index, chambers_dir)
+    except Exception as e:
+        return index, None, str(e)
+    return index, impedances, None
+
+
 class MultipleChamber:
     """
     Memory-efficient multiple-chamber impedance calculator.
@@ -101,6 +201,8 @@ class MultipleChamber:
 
         # Cache of CfgIo objects
         self._cfg_cache: Dict[str, CfgIo] = {}
+        # Parsed (Chamber, Beam) per aperture type, copied for each element
+        self._template_cache: Dict[str, Tuple[Chamber, Beam]] = {}
 
         # Input data (populated by load())
         self.apertypes: List[str] = []
@@ -113,7 +215,10 @@ class MultipleChamber:
         self._freq_obj_ref: Optional[Frequencies] = None
         self._freqs_array: Optional[np.ndarray] = None
 
-        # Accumulated totals (kept in memory)
+        # Accumulated totals (kept in memory): one (n_channels, n_freq)
+        # buffer, with _total_impedances holding per-channel row views
+        self._channel_names: List[str] = []
+        self._totals_soa: Optional[np.ndarray] = None
         self._total_impedances: Dict[str, np.ndarray] = {}
         
         # State flags
@@ -148,56 +253,76 @@ class MultipleChamber:
         """
         self._load_input_data()
         self._loaded = True
-        print(f"[MultipleChamber] Loaded {self.n_elements} elements")
+        logger.info("Loaded %d elements", self.n_elements)
 
     def calculate_all(
         self,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 1,
+        export_excel: bool = False,
     ) -> None:
         """
         Calculate impedances for all elements.
         
-        Memory-efficient: processes one element at a time, writes to file,
-        accumulates totals, then frees memory.
+        Memory-efficient: each element is calculated and written to file
+        independently, and only the accumulated totals are kept. With
+        max_workers > 1, elements are distributed over a process pool and
+        results are reduced in the parent in element order, so totals do
+        not depend on the number of workers.
         
         Args:
             progress_callback: Optional callback(current, total, message) for progress updates
+            max_workers: Number of worker processes. The default of 1
+                processes all elements serially in this process; larger
+                values need the calling script to guard its entry point
+                with ``if __name__ == "__main__":``.
+            export_excel: Also write all elements to a single workbook
+                (see export_elements_excel())
         """
         if not self._loaded:
             self.load()
 
-        # Create output directories
-        self.out_dir.mkdir(parents=True, exist_ok=True)
-        chambers_dir = self.out_dir / "chambers"
-        chambers_dir.mkdir(exist_ok=True)
+        # Create output directories, including all per-element ones, up
+        # front so the element loop does no directory handling
+        chambers_dir = os.path.join(str(self.out_dir), "chambers")
+        os.makedirs(chambers_dir, exist_ok=True)
+        for idx in range(self.n_elements):
+            os.makedirs(
+                os.path.join(chambers_dir, _chamber_name(idx)), exist_ok=True
+            )
 
-        # Initialize totals
+        # Initialize totals (allocated on the first successful element)
+        self._channel_names = []
+        self._totals_soa = None
         self._total_impedances = {}
         
         n_total = self.n_elements
-        
-        for idx in range(n_total):
-            if progress_callback:
-                progress_callback(idx, n_total, f"Processing element {idx+1}/{n_total}")
-            
-            try:
-                self._process_single_element(idx, chambers_dir)
-            except Exception as e:
-                print(f"[MultipleChamber] Error processing element {idx}: {e}")
-                continue
-            
-            # Force garbage collection periodically
-            if idx % 20 == 0:
-                gc.collect()
+        max_workers = max(1, min(max_workers, n_total))
+
+        # Elements identical to an earlier one reuse its output file
+        sources = self._duplicate_sources()
+        written: set = set()
+
+        if max_workers == 1:
+            self._calculate_all_serial(
+                chambers_dir, sources, written, progress_callback
+            )
+        else:
+            self._calculate_all_parallel(
+                chambers_dir, max_workers, sources, written, progress_callback
+            )
 
         # Save total impedances
         self._save_totals()
         self._calculated = True
         
+        if export_excel:
+            self.export_elements_excel()
+        
         if progress_callback:
             progress_callback(n_total, n_total, "Complete")
         
-        print(f"[MultipleChamber] Calculation complete. Output in {self.out_dir}")
+        logger.info("Calculation complete. Output in %s", self.out_dir)
 
     def calculate_element(self, index: int) -> Dict[str, np.ndarray]:
         """
@@ -215,56 +340,93 @@ class MultipleChamber:
         if index < 0 or index >= self.n_elements:
             raise IndexError(f"Element index {index} out of range [0, {self.n_elements})")
 
-        wall = self._build_wall_for_element(index)
-        impedances = wall.get_all_impedances()
-        
-        return impedances
+        return self._calculate_element_impedances(index)
 
     def get_totals(self) -> Dict[str, np.ndarray]:
         """
         Get accumulated total impedances.
         
         Returns:
-            Dictionary with total impedance arrays
+            Dictionary with total impedance arrays (views onto the rows of
+            the internal totals buffer)
         """
         if not self._calculated:
             raise RuntimeError("Call calculate_all() first")
-        return self._total_impedances.copy()
+        return dict(zip(self._channel_names, self._totals_soa))
 
     def get_frequencies(self) -> np.ndarray:
-        """Get the frequency array."""
+        """Get the frequency array (a read-only view, not a copy)."""
         if self._freqs_array is None:
             raise RuntimeError("Call load() or calculate_all() first")
-        return self._freqs_array.copy()
+        freqs = self._freqs_array.view()
+        freqs.flags.writeable = False
+        return freqs
 
-    def get_element_data(self, index: int) -> Optional[Dict[str, Any]]:
+    def get_element_data(
+        self,
+        index: int,
+        channel: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         Get data for a specific element by reading from file.
         
         Args:
             index: Element index (0-based)
+            channel: Optional impedance name (e.g. 'ZLong'); if given, only
+                that impedance is read from the file
             
         Returns:
-            Dictionary with element data, or None if not found
+            Dictionary with keys "index", "apertype", "freqs" and "data"
+            (impedance name -> complex array), or None if not found
         """
-        chamber_dir = self.out_dir / "chambers" / f"chamber_{index:03d}"
-        excel_file = chamber_dir / f"chamber_{index:03d}_impedances.xlsx"
+        data_file = self._element_data_file(index)
         
-        if not excel_file.exists():
+        if not data_file.exists():
             return None
         
         try:
-            import pandas as pd
-            data = pd.read_excel(excel_file, sheet_name=None)
+            names = None if channel is None else [channel]
+            freqs, data = io_util.load_impedances_npz(data_file, names=names)
             return {
                 "index": index,
                 "apertype": self.apertypes[index] if index < len(self.apertypes) else "unknown",
+                "freqs": freqs,
                 "data": data
             }
         except Exception as e:
-            print(f"[MultipleChamber] Error reading element {index}: {e}")
+            logger.error("Error reading element %d: %s", index, e)
             return None
 
+    def export_elements_excel(
+        self, output_path: Optional[str | Path] = None
+    ) -> Path:
+        """
+        Export the impedances of all calculated elements to one workbook.
+        
+        One sheet per element (named like its chamber directory) is
+        written from the element files, reading one element at a time.
+        
+        Args:
+            output_path: Output .xlsx file (default: out_dir/chambers/chambers.xlsx)
+            
+        Returns:
+            Path to the written workbook
+        """
+        if output_path is None:
+            output_path = self.out_dir / "chambers" / "chambers.xlsx"
+        
+        def sheets():
+            for index in range(self.n_elements):
+                data_file = self._element_data_file(index)
+                if not data_file.exists():
+                    continue
+                freqs, data = io_util.load_impedances_npz(data_file)
+                yield _chamber_name(index), freqs, data
+        
+        path = io_util.save_impedance_sheets_xlsx(output_path, sheets())
+        logger.info("Saved element impedances to %s", path)
+        return path
+
     def plot_element(
         self,
         index: int,
@@ -281,50 +443,24 @@ class MultipleChamber:
         """
         data = self.get_element_data(index)
         if data is None:
-            print(f"[MultipleChamber] No data found for element {index}")
+            logger.warning("No data found for element %d", index)
             return
         
         if save_dir is None:
-            save_dir = self.out_dir / "chambers" / f"chamber_{index:03d}"
+            save_dir = self.out_dir / "chambers" / _chamber_name(index)
         else:
             save_dir = Path(save_dir)
         save_dir.mkdir(parents=True, exist_ok=True)
         
-        freqs = self.get_frequencies()
-        
-        for sheet_name, df in data["data"].items():
-            if sheet_name == "frequencies":
-                continue
-            
-            # Extract impedance values
-            if "Real" in df.columns and "Imag" in df.columns:
-                Z = df["Real"].values + 1j * df["Imag"].values
-            elif "Magnitude" in df.columns:
-                Z = df["Magnitude"].values
-            else:
-                continue
-            
-            if not self._is_non_trivial_impedance(Z):
-                continue
-            
-            imped_type = self._guess_imped_type(sheet_name)
-            title = f"Chamber {index:03d} - {sheet_name}"
-            savename = f"{sheet_name}.png"
-            
-            plot_util.plot_Z_vs_f_simple(
-                f=freqs,
-                Z=Z,
-                imped_type=imped_type,
-                title=title,
-                savedir=str(save_dir),
-                savename=savename,
-                xscale="log",
-                yscale="log",
-            )
-        
-        if not show:
-            import matplotlib.pyplot as plt
-            plt.close('all')
+        self._plot_impedances(
+            data["freqs"],
+            data["data"],
+            save_dir,
+            title_prefix=f"Chamber {index:03d}",
+            name_suffix="",
+            dpi=_ELEMENT_PLOT_DPI,
+            show=show,
+        )
 
     def plot_totals(
         self,
@@ -347,30 +483,65 @@ class MultipleChamber:
             save_dir = Path(save_dir)
         save_dir.mkdir(parents=True, exist_ok=True)
         
-        freqs = self.get_frequencies()
+        self._plot_impedances(
+            self.get_frequencies(),
+            self._total_impedances,
+            save_dir,
+            title_prefix="Total",
+            name_suffix="_tot",
+            dpi=_TOTAL_PLOT_DPI,
+            show=show,
+        )
+
+    def _plot_impedances(
+        self,
+        freqs: np.ndarray,
+        impedances: Dict[str, np.ndarray],
+        save_dir: Path,
+        title_prefix: str,
+        name_suffix: str,
+        dpi: int,
+        show: bool,
+    ) -> None:
+        """
+        Save one plot per non-trivial impedance channel.
         
-        for name, Z in self._total_impedances.items():
-            if not self._is_non_trivial_impedance(Z):
-                continue
-            
-            imped_type = self._guess_imped_type(name)
-            title = f"Total - {name}"
-            savename = f"{name}_tot.png"
-            
-            plot_util.plot_Z_vs_f_simple(
-                f=freqs,
-                Z=Z,
-                imped_type=imped_type,
-                title=title,
-                savedir=str(save_dir),
-                savename=savename,
-                xscale="log",
-                yscale="log",
-            )
+        With show=False all channels are drawn on a single reused figure,
+        which is closed at the end; with show=True each channel gets its own
+        figure, left open for display.
+        """
+        channels = [
+            (name, Z) for name, Z in impedances.items()
+            if self._is_non_trivial_impedance(Z)
+        ]
+        
+        if show:
+            for name, Z in channels:
+                plot_util.plot_Z_vs_f_simple(
+                    f=freqs,
+                    Z=Z,
+                    imped_type=self._guess_imped_type(name),
+                    title=f"{title_prefix} - {name}",
+                    savedir=str(save_dir),
+                    savename=f"{name}{name_suffix}.png",
+                    xscale="log",
+                    yscale="log",
+                )
+            return
         
-        if not show:
-            import matplotlib.pyplot as plt
-            plt.close('all')
+        with plot_util.PlotSession(dpi=dpi) as session:
+            for name, Z in channels:
+                drawn = plot_util.draw_Z_vs_f(
+                    session.ax,
+                    freqs,
+                    Z,
+                    imped_type=self._guess_imped_type(name),
+                    title=f"{title_prefix} - {name}",
+                    xscale="log",
+                    yscale="log",
+                )
+                if drawn:
+                    session.save(str(save_dir), f"{name}{name_suffix}.png")
 
     # ------------------------------------------------------------------
     # Internal methods
@@ -407,7 +578,9 @@ class MultipleChamber:
         cfg = self._get_cfg_handler(apertype)
         self._freq_obj_ref = cfg.read_freq()
         if self._freq_obj_ref is not None:
-            self._freqs_array = self._freq_obj_ref.freq
+            self._freqs_array = np.ascontiguousarray(
+                self._freq_obj_ref.freq, dtype=np.float64
+            )
 
     def _get_cfg_handler(self, apertype: str) -> CfgIo:
         """Get or create a CfgIo handler for the given aperture type."""
@@ -427,6 +600,24 @@ class MultipleChamber:
         
         return self._cfg_cache[key]
 
+    def _get_templates(self, apertype: str) -> Tuple[Chamber, Beam]:
+        """Get the (Chamber, Beam) parsed once from the aperture type cfg."""
+        key = apertype.lower()
+        
+        if key not in self._template_cache:
+            cfg = self._get_cfg_handler(apertype)
+            chamber = cfg.read_chamber()
+            beam = cfg.read_beam()
+            
+            if chamber is None or beam is None:
+                raise RuntimeError(
+                    f"Incomplete configuration for aperture type '{apertype}'"
+                )
+            
+            self._template_cache[key] = (chamber, beam)
+        
+        return self._template_cache[key]
+
     def _resolve_cfg_filename(self, apertype: str) -> str:
         """
         Resolve the cfg filename for an aperture type.
@@ -449,14 +640,11 @@ class MultipleChamber:
         betax = self.betax_list[index]
         betay = self.betay_list[index]
 
-        cfg = self._get_cfg_handler(apertype)
-        chamber = cfg.read_chamber()
-        beam = cfg.read_beam()
-
-        if chamber is None or beam is None:
-            raise RuntimeError(
-                f"Incomplete configuration for aperture type '{apertype}'"
-            )
+        chamber_tmpl, beam_tmpl = self._get_templates(apertype)
+        # Shallow copies: only scalar geometry is overridden below, and the
+        # layers (list and Layer objects) are shared read-only by TlWall
+        chamber = copy.copy(chamber_tmpl)
+        beam = copy.copy(beam_tmpl)
 
         # Override geometry with per-element values
         chamber.pipe_len_m = L
@@ -470,48 +658,231 @@ class MultipleChamber:
         if hasattr(chamber, "pipe_ver_m"):
             chamber.pipe_ver_m = b
 
-        # Apply Yokoya factors for rectangular chambers
-        # Since we only have b (not separate hor/ver), we use theoretical factors
-        if apertype.lower() == "rectangular":
-            pi_sq = np.pi ** 2
-            chamber.yokoya_drivx = pi_sq / 24.0
-            chamber.yokoya_drivy = pi_sq / 12.0
-            chamber.yokoya_detx = -pi_sq / 24.0
-            chamber.yokoya_dety = pi_sq / 24.0
+        # Yokoya factors follow from chamber_shape and the (hor, ver)
+        # aperture set above, through the Chamber factor tables.
 
         wall = TlWall(chamber=chamber, beam=beam, frequencies=self._freq_obj_ref)
         return wall
 
-    def _process_single_element(self, index: int, chambers_dir: Path) -> None:
-        """Process a single element: calculate, save, accumulate, free."""
-        # Build and calculate
+    def _calculate_all_serial(
+        self,
+        chambers_dir: str,
+        sources: List[int],
+        written: set,
+        progress_callback: Optional[callable] = None,
+    ) -> None:
+        """
+        Calculate elements in this process, writing files in the background.
+        
+        Element files are written by a small thread pool while the next
+        elements are calculated; at most _MAX_PENDING_WRITES results are
+        held in memory waiting for their write.
+        """
+        n_total = self.n_elements
+        pending: Dict[int, Future] = {}
+
+        def finish_write(idx: int) -> None:
+            try:
+                pending.pop(idx).result()
+            except Exception as e:
+                logger.error("Error writing element %d: %s", idx, e)
+            else:
+                written.add(idx)
+
+        with ThreadPoolExecutor(
+            max_workers=_WRITER_THREADS, thread_name_prefix="pytlwall-writer"
+        ) as writer:
+            for idx in range(n_total):
+                if progress_callback:
+                    progress_callback(idx, n_total, f"Processing element {idx+1}/{n_total}")
+                
+                source = sources[idx]
+                try:
+                    if source in pending:
+                        finish_write(source)
+                    if source != idx and source in written:
+                        self._reuse_element(idx, source, chambers_dir, written)
+                        written.add(idx)
+                    else:
+                        impedances = self._calculate_element_impedances(idx)
+                        pending[idx] = writer.submit(
+                            io_util.save_impedances_npz,
+                            _element_file(chambers_dir, idx),
+                            self._freqs_array,
+                            impedances,
+                        )
+                        self._accumulate_impedances(impedances)
+                except Exception as e:
+                    logger.error("Error processing element %d: %s", idx, e)
+                
+                while len(pending) > _MAX_PENDING_WRITES:
+                    finish_write(next(iter(pending)))
+            
+            while pending:
+                finish_write(next(iter(pending)))
+
+    def _calculate_all_parallel(
+        self,
+        chambers_dir: str,
+        max_workers: int,
+        sources: List[int],
+        written: set,
+        progress_callback: Optional[callable] = None,
+    ) -> None:
+        """Calculate and save elements in worker processes, reduce totals here."""
+        n_total = self.n_elements
+        unique = [idx for idx in range(n_total) if sources[idx] == idx]
+        # Records logged in the workers come back through this queue
+        log_queue = multiprocessing.Queue()
+        log_listener = logging.handlers.QueueListener(
+            log_queue, _WorkerLogForwarder()
+        )
+        init_args = (
+            str(self.apertype_file),
+            str(self.geom_file),
+            str(self.input_dir),
+            str(self.out_dir),
+            dict(self.apertype_to_cfg),
+            (
+                self.apertypes,
+                self.b_list,
+                self.L_list,
+                self.betax_list,
+                self.betay_list,
+            ),
+            self._freq_obj_ref,
+            self._freqs_array,
+            log_queue,
+            logging.getLogger().getEffectiveLevel(),
+        )
+        chunksize = max(1, min(4, len(unique) // (4 * max_workers)))
+
+        log_listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=init_args,
+            ) as ex:
+                results = ex.map(
+                    _worker_element,
+                    unique,
+                    [chambers_dir] * len(unique),
+                    chunksize=chunksize,
+                )
+                # Results come in element order and a duplicate always follows
+                # its source, whose file is written by then
+                for idx in range(n_total):
+                    if progress_callback:
+                        progress_callback(idx, n_total, f"Processing element {idx+1}/{n_total}")
+                    try:
+                        if sources[idx] == idx:
+                            _, impedances, error = next(results)
+                            if error is not None:
+                                raise RuntimeError(error)
+                            self._accumulate_impedances(impedances)
+                        else:
+                            self._reuse_element(idx, sources[idx], chambers_dir, written)
+                        written.add(idx)
+                    except Exception as e:
+                        logger.error("Error processing element %d: %s", idx, e)
+        finally:
+            # The workers have exited, so all their records are queued
+            log_listener.stop()
+            log_queue.close()
+
+    def _duplicate_sources(self) -> List[int]:
+        """
+        Map each element to the first element with identical inputs.
+        
+        Elements with the same aperture type, b, L, betax and betay have
+        identical impedances; unique elements map to themselves.
+        """
+        first: Dict[Tuple[Any, ...], int] = {}
+        sources = []
+        for idx, key in enumerate(zip(
+            (a.lower() for a in self.apertypes),
+            self.b_list,
+            self.L_list,
+            self.betax_list,
+            self.betay_list,
+        )):
+            sources.append(first.setdefault(key, idx))
+        return sources
+
+    def _reuse_element(
+        self, index: int, source: int, chambers_dir: str, written: set
+    ) -> None:
+        """
+        Process an element identical to an earlier one.
+        
+        The source element's file is copied and its impedances are read
+        back for accumulation; if the source was not written in this run,
+        the element is calculated instead.
+        """
+        if source not in written:
+            self._process_single_element(index, chambers_dir)
+            return
+        output_path = _element_file(chambers_dir, index)
+        shutil.copyfile(_element_file(chambers_dir, source), output_path)
+        _, impedances = io_util.load_impedances_npz(output_path)
+        self._accumulate_impedances(impedances)
+
+    def _calculate_element_impedances(self, index: int) -> Dict[str, np.ndarray]:
+        """Build the TlWall of one element and calculate its impedances."""
         wall = self._build_wall_for_element(index)
-        impedances = wall.get_all_impedances()
+        return wall.get_all_impedances()
+
+    def _calculate_and_save(
+        self, index: int, chambers_dir: str
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate one element and write its impedances to file.
         
-        # Save to file
-        chamber_dir = chambers_dir / f"chamber_{index:03d}"
-        chamber_dir.mkdir(exist_ok=True)
+        The element directory under chambers_dir must already exist
+        (calculate_all() creates them all before processing).
+        """
+        impedances = self._calculate_element_impedances(index)
         
-        output_path = chamber_dir / f"chamber_{index:03d}_impedances.xlsx"
-        io_util.save_impedances_to_excel(
-            freqs=self._freqs_array,
-            imped_dict=impedances,
-            output_path=output_path,
-        )
+        # Save to file
+        output_path = _element_file(chambers_dir, index)
+        io_util.save_impedances_npz(output_path, self._freqs_array, impedances)
+        return impedances
+
+    def _element_data_file(self, index: int) -> Path:
+        """Path of the per-element impedance file."""
+        name = _chamber_name(index)
+        return self.out_dir / "chambers" / name / f"{name}_impedances.npz"
+
+    def _process_single_element(self, index: int, chambers_dir: str) -> None:
+        """Process a single element: calculate, save, accumulate, free."""
+        impedances = self._calculate_and_save(index, chambers_dir)
         
         # Accumulate totals
         self._accumulate_impedances(impedances)
         
         # Free memory - don't keep the wall object
-        del wall
         del impedances
 
     def _accumulate_impedances(self, impedances: Dict[str, np.ndarray]) -> None:
-        """Add impedances to running totals."""
-        for name, Z in impedances.items():
-            if name not in self._total_impedances:
-                self._total_impedances[name] = np.zeros_like(Z)
-            self._total_impedances[name] += Z
+        """
+        Add impedances to running totals.
+
+        The channel list is fixed by the first element; totals live in a
+        single (n_channels, n_freq) buffer updated with one in-place add.
+        """
+        if self._totals_soa is None:
+            self._channel_names = list(impedances.keys())
+            n_freq = len(next(iter(impedances.values()))) if impedances else 0
+            self._totals_soa = np.zeros(
+                (len(self._channel_names), n_freq), dtype=np.complex128
+            )
+            self._total_impedances = dict(
+                zip(self._channel_names, self._totals_soa)
+            )
+
+        block = np.stack([impedances[name] for name in self._channel_names])
+        np.add(self._totals_soa, block, out=self._totals_soa)
 
     def _save_totals(self) -> None:
         """Save total impedances to file."""
@@ -524,21 +895,26 @@ class MultipleChamber:
             imped_dict=self._total_impedances,
             output_path=output_path,
         )
-        print(f"[MultipleChamber] Saved total impedances to {output_path}")
+        logger.info("Saved total impedances to %s", output_path)
 
     @staticmethod
     def _is_non_trivial_impedance(Z: np.ndarray) -> bool:
         """Check if impedance is not all zeros or NaN."""
-        if np.iscomplexobj(Z):
-            mag = np.abs(Z)
-        else:
-            mag = np.asarray(Z)
-        mask = ~np.isnan(mag)
-        return mask.any() and np.any(mag[mask] != 0)
+        # NaN counts as non-zero, so a block has a value that is neither
+        # zero nor NaN exactly when it has more non-zeros than NaNs. Blocks
+        # are scanned in order and the scan stops at the first hit.
+        Z = np.asarray(Z).reshape(-1)
+        for start in range(0, Z.size, _SCAN_BLOCK):
+            block = Z[start:start + _SCAN_BLOCK]
+            n_nonzero = np.count_nonzero(block)
+            if n_nonzero and n_nonzero > np.count_nonzero(np.isnan(block)):
+                return True
+        return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _guess_imped_type(name: str) -> str:
-        """Guess impedance type from name."""
+        """Guess impedance type from name (memoized: names are few)."""
         name_lower = name.lower()
         if "long" in name_lower:
             return "long"
@@ -88,7 +88,8 @@ def _ensure_output_directory(savedir: Union[str, Path]) -> Path:
 def _save_figure(
     fig: Figure,
     savedir: Optional[str],
-    savename: Optional[str]
+    savename: Optional[str],
+    dpi: int = 300
 ) -> None:
     """
     Save figure to file if savename is provided.
@@ -97,6 +98,7 @@ def _save_figure(
         fig: Matplotlib figure to save
         savedir: Output directory path
         savename: Output filename
+        dpi: Output resolution
     """
     if savename is None:
         return
@@ -107,7 +109,7 @@ def _save_figure(
     output_path = _ensure_output_directory(savedir) / savename
     
     try:
-        fig.savefig(output_path, dpi=300, bbox_inches='tight')
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
         logger.info(f"Figure saved to {output_path}")
     except Exception as e:
         logger.error(f"Error saving figure: {e}")
@@ -191,6 +193,51 @@ def plot_Z_vs_f_simple(
         >>> fig = plot_Z_vs_f_simple(f, Z, imped_type='L', xscale='log')
         >>> plt.show()
     """
+    if savename:
+        logger.info(f"Creating plot: {savename}")
+    
+    # Create figure
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    if not draw_Z_vs_f(ax, f, Z, imped_type, title, xscale, yscale):
+        plt.close(fig)
+        return None
+    
+    # Save if requested
+    _save_figure(fig, savedir, savename)
+    
+    return fig
+
+
+def draw_Z_vs_f(
+    ax: plt.Axes,
+    f: np.ndarray,
+    Z: np.ndarray,
+    imped_type: str = 'L',
+    title: Optional[str] = None,
+    xscale: str = 'lin',
+    yscale: str = 'lin'
+) -> bool:
+    """
+    Draw impedance vs frequency (real and imaginary parts) on existing axes.
+    
+    The axes are cleared first, so the same axes can be reused for a
+    series of plots (see :class:`PlotSession`).
+    
+    Args:
+        ax: Matplotlib axes to draw on
+        f: Frequency array [Hz]
+        Z: Complex impedance array
+        imped_type: Impedance type ('L'=longitudinal, 'T'=transverse, 'S'=surface)
+        title: Plot title
+        xscale: X-axis scale ('lin', 'log', 'symlog')
+        yscale: Y-axis scale ('lin', 'log', 'symlog')
+    
+    Returns:
+        False if there is no valid data to plot (the axes are left cleared)
+    """
+    ax.clear()
+    
     # Filter NaN values separately for real and imaginary parts
     mask_real = np.logical_not(np.isnan(Z.real))
     fRe = f[mask_real]
@@ -203,17 +250,11 @@ def plot_Z_vs_f_simple(
     # Check if we have data to plot
     if len(fRe) == 0 and len(fIm) == 0:
         logger.warning("No valid data to plot")
-        return None
-    
-    if savename:
-        logger.info(f"Creating plot: {savename}")
+        return False
     
     # Get impedance unit
     Z_unit = _get_impedance_unit(imped_type)
     
-    # Create figure
-    fig, ax = plt.subplots(figsize=figsize)
-    
     # Set title
     if title is not None:
         ax.set_title(title, fontsize=DEFAULT_PLOT_STYLE['title_fontsize'])
@@ -245,12 +286,58 @@ def plot_Z_vs_f_simple(
     ax.legend(loc='best', fontsize=DEFAULT_PLOT_STYLE['legend_fontsize'])
     
     # Layout
-    fig.tight_layout()
+    ax.figure.tight_layout()
     
-    # Save if requested
-    _save_figure(fig, savedir, savename)
+    return True
+
+
+class PlotSession:
+    """
+    Context manager reusing one figure for a series of saved plots.
     
-    return fig
+    Creating a figure is much more expensive than redrawing one; a session
+    creates a single Figure/Axes, which :func:`draw_Z_vs_f` clears and
+    redraws for each plot, and closes it on exit.
+    
+    Args:
+        figsize: Figure size (width, height) in inches
+        dpi: Resolution used by :meth:`save`
+    
+    Example:
+        >>> with PlotSession(dpi=150) as session:
+        ...     for name, Z in impedances.items():
+        ...         if draw_Z_vs_f(session.ax, f, Z, 'L', title=name):
+        ...             session.save('img', f'{name}.png')
+    """
+    
+    def __init__(
+        self,
+        figsize: Tuple[float, float] = (10, 6),
+        dpi: int = 300
+    ) -> None:
+        self.figsize = figsize
+        self.dpi = dpi
+        self.fig: Optional[Figure] = None
+        self.ax: Optional[plt.Axes] = None
+    
+    def __enter__(self) -> "PlotSession":
+        self.fig, self.ax = plt.subplots(figsize=self.figsize)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        plt.close(self.fig)
+        self.fig = None
+        self.ax = None
+    
+    def save(self, savedir: Optional[str], savename: str) -> None:
+        """
+        Save the current state of the session figure.
+        
+        Args:
+            savedir: Output directory path
+            savename: Output filename
+        """
+        _save_figure(self.fig, savedir, savename, dpi=self.dpi)
 
 
 def plot_Z_vs_f_simple_single(
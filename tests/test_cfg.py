@@ -125,6 +125,45 @@ type = PEC
         finally:
             os.unlink(temp_file)
     
+    def test_percent_in_unrelated_option(self):
+        """Test that only the options being read are interpolated."""
+        config_text = """
+[base_info]
+pipe_len_m = 1.0
+pipe_radius_m = 0.02
+chamber_shape = CIRCULAR
+betax = 1.0
+betay = 1.0
+note = 50% done
+prefix = ring
+component_name = %(prefix)s_chamber
+
+[layers_info]
+nbr_layers = 0
+
+[boundary]
+type = PEC
+
+[beam_info]
+test_beam_shift = 0.001
+gammarel = 7460.52
+comment = 100% relativistic
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write(config_text)
+            temp_file = f.name
+        
+        try:
+            cfg = CfgIo(temp_file)
+            chamber = cfg.read_chamber()
+            beam = cfg.read_beam()
+            
+            self.assertEqual(chamber.pipe_rad_m, 0.02)
+            self.assertEqual(chamber.component_name, 'ring_chamber')
+            self.assertAlmostEqual(beam.gammarel, 7460.52, places=2)
+        finally:
+            os.unlink(temp_file)
+    
     def test_read_elliptical_chamber(self):
         """Test reading elliptical chamber configuration."""
         config_text = """
@@ -357,6 +396,86 @@ ZDipX = True
         finally:
             os.unlink(temp_file)
     
+    def test_read_file_and_image_outputs(self):
+        """Test reading numbered [outputN] and [img_outputN] sections."""
+        config_text = """
+[base_info]
+component_name = kicker
+
+[output2]
+output_name = second.txt
+output_list = ZLong
+use_name_flag = False
+
+[output1]
+output_name = first.txt
+output_list = ZLong, ZTrans,
+              ZDipX
+use_name_flag = True
+
+[output4]
+output_name = unreachable.txt
+output_list = ZLong
+
+[img_output1]
+img_name = long.png
+imped_list = ZLong
+re_im_flag = REAL
+xscale = log
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write(config_text)
+            temp_file = f.name
+        
+        try:
+            cfg = CfgIo(temp_file)
+            cfg.read_output()
+            
+            # Numbering stops at the first missing index (output3)
+            self.assertEqual(list(cfg.file_output), ['first.txt', 'second.txt'])
+            self.assertEqual(cfg.file_output['first.txt']['prefix'], 'kicker')
+            self.assertEqual(cfg.file_output['first.txt']['imped'],
+                             ['ZLong', 'ZTrans', 'ZDipX'])
+            self.assertEqual(cfg.file_output['second.txt']['prefix'], '')
+            
+            img = cfg.img_output['long.png']
+            self.assertEqual(img['imped'], ['ZLong'])
+            self.assertEqual(img['real_imag'], 'real')
+            self.assertEqual(img['xscale'], 'log')
+            self.assertEqual(img['yscale'], 'lin')
+            self.assertIsNone(img['title'])
+        finally:
+            os.unlink(temp_file)
+    
+    def test_name_prefix_requires_component_name(self):
+        """Test that use_name_flag without component_name is an error."""
+        config_text = """
+[base_info]
+pipe_len_m = 1.0
+
+[output1]
+output_name = first.txt
+output_list = ZLong,,ZTrans
+use_name_flag = True
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
+            f.write(config_text)
+            temp_file = f.name
+        
+        try:
+            cfg = CfgIo(temp_file)
+            with self.assertRaises(configparser.NoOptionError):
+                cfg.read_output()
+            
+            # Without the prefix the section reads, keeping the empty item
+            cfg.config.set('output1', 'use_name_flag', 'False')
+            cfg.read_output()
+            self.assertEqual(cfg.file_output['first.txt']['prefix'], '')
+            self.assertEqual(cfg.file_output['first.txt']['imped'],
+                             ['ZLong', '', 'ZTrans'])
+        finally:
+            os.unlink(temp_file)
+    
     def test_save_calc(self):
         """Test saving calculation configuration."""
         list_calc = {
@@ -487,6 +606,51 @@ fstep = 3
             os.unlink(temp_file)
 
 
+class TestCfgIoResolvePath(unittest.TestCase):
+    """Test resolve_path method."""
+    
+    def test_resolve_against_main_path(self):
+        """Test relative filenames are resolved against main_path."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cfg = CfgIo()
+            cfg.config.add_section('path_info')
+            cfg.config.set('path_info', 'main_path', tmp_dir)
+            
+            # Not existing yet: returned unchanged
+            self.assertEqual(cfg.resolve_path('freq_data.txt'), Path('freq_data.txt'))
+            
+            # Created after the first lookup: found without invalidation
+            Path(tmp_dir, 'freq_data.txt').write_text("1.0\n")
+            self.assertEqual(cfg.resolve_path('freq_data.txt'),
+                             Path(tmp_dir) / 'freq_data.txt')
+    
+    def test_resolve_after_chdir(self):
+        """Test a relative hit in one working directory is not reused in another."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as dir_a, \
+                tempfile.TemporaryDirectory() as dir_b, \
+                tempfile.TemporaryDirectory() as main_dir:
+            Path(dir_a, 'f.txt').write_text("1.0\n")
+            Path(main_dir, 'f.txt').write_text("1.0\n")
+            cfg = CfgIo()
+            cfg.config.add_section('path_info')
+            cfg.config.set('path_info', 'main_path', main_dir)
+            try:
+                os.chdir(dir_a)
+                self.assertEqual(cfg.resolve_path('f.txt'), Path('f.txt'))
+                os.chdir(dir_b)
+                self.assertEqual(cfg.resolve_path('f.txt'),
+                                 Path(main_dir) / 'f.txt')
+            finally:
+                os.chdir(cwd)
+    
+    def test_resolve_absolute_path(self):
+        """Test absolute filenames are returned as-is."""
+        cfg = CfgIo()
+        abs_path = os.path.abspath('some_file.txt')
+        self.assertEqual(cfg.resolve_path(abs_path), Path(abs_path))
+
+
 class TestCfgIoStringRepresentation(unittest.TestCase):
     """Test string representation methods."""
     
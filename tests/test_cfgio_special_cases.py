@@ -83,6 +83,40 @@ gammarel = 10000
         finally:
             os.unlink(temp_file)
     
+    def test_missing_layer_section(self):
+        """Test nbr_layers larger than the number of layer sections."""
+        config_text = """
+[base_info]
+component_name = test_missing_layer
+chamber_shape = CIRCULAR
+pipe_radius_m = 0.02
+pipe_len_m = 1.0
+betax = 1.0
+betay = 1.0
+
+[layers_info]
+nbr_layers = 2
+
+[layer0]
+type = V
+thick_m = 1e-3
+
+[boundary]
+type = PEC
+"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write(config_text)
+            temp_file = f.name
+        
+        try:
+            cfg = CfgIo(temp_file)
+            with self.assertRaises(ConfigurationError):
+                cfg.read_chamber()
+        
+        finally:
+            os.unlink(temp_file)
+    
     def test_frequency_file_section(self):
         """Test configuration with frequency_file section."""
         # Create frequency file
@@ -139,6 +173,43 @@ gammarel = 7460.52
             os.unlink(freq_file)
             os.unlink(cfg_file)
     
+    def test_frequency_file_reload(self):
+        """Test repeated frequency_file reads return fresh, up-to-date data."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.dat', delete=False) as f:
+            f.write("1.0e3 5.0\n")
+            f.write("1.0e4 6.0\n")
+            freq_file = f.name
+        
+        config_text = f"""
+[frequency_file]
+filename = {freq_file}
+freq_col = 1
+"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write(config_text)
+            cfg_file = f.name
+        
+        try:
+            cfg = CfgIo(cfg_file)
+            freq = cfg.read_freq()
+            self.assertEqual(list(freq.freq), [5.0, 6.0])
+            
+            # The returned array is read-only, so cached data cannot leak
+            with self.assertRaises(ValueError):
+                freq.freq[0] = -1.0
+            
+            # Rewriting the file must be picked up
+            with open(freq_file, 'w') as f:
+                f.write("1.0e3 7.0\n")
+                f.write("1.0e4 8.0\n")
+                f.write("1.0e5 9.0\n")
+            self.assertEqual(list(cfg.read_freq().freq), [7.0, 8.0, 9.0])
+        
+        finally:
+            os.unlink(freq_file)
+            os.unlink(cfg_file)
+    
     def test_test_config_section(self):
         """Test reading test_config section."""
         config_text = """
@@ -54,6 +54,25 @@ class TestChamberInitialization(unittest.TestCase):
         self.assertEqual(chamber.chamber_shape, 'CIRCULAR')
         self.assertAlmostEqual(chamber.yokoya_q, 0.0, places=10)
     
+    def test_circular_constructor(self):
+        """Test Chamber.circular matches the generic constructor."""
+        fast = Chamber.circular(0.025, pipe_len_m=2.0, betax=10.0,
+                                betay=20.0, component_name='drift')
+        slow = Chamber(pipe_len_m=2.0, pipe_rad_m=0.025, betax=10.0,
+                       betay=20.0, component_name='drift')
+        
+        self.assertEqual(repr(fast), repr(slow))
+        self.assertEqual(fast.get_yokoya_factors(), slow.get_yokoya_factors())
+        self.assertEqual(fast.layers, [])
+        
+        # Resizing still goes through the normal setters
+        fast.pipe_rad_m = 0.030
+        self.assertEqual(fast.pipe_hor_m, 0.030)
+        self.assertEqual(fast.pipe_ver_m, 0.030)
+        
+        with self.assertRaises(ChamberDimensionError):
+            Chamber.circular(-0.01)
+    
     def test_elliptical_chamber(self):
         """Test elliptical chamber initialization."""
         hor = 0.030  # 30 mm
@@ -339,6 +358,61 @@ class TestYokoyaFactors(unittest.TestCase):
         self.assertIsInstance(factors['q'], float)
         self.assertIsInstance(factors['longitudinal'], float)
     
+    def test_get_yokoya_factors_matches_properties(self):
+        """Test the factor dict agrees with the properties, x/y swapped or not."""
+        for hor, ver in ((0.030, 0.020), (0.020, 0.030)):
+            chamber = Chamber(pipe_hor_m=hor, pipe_ver_m=ver,
+                              chamber_shape='RECTANGULAR')
+            factors = chamber.get_yokoya_factors()
+            self.assertEqual(factors['longitudinal'], chamber.long_yokoya_factor)
+            self.assertEqual(factors['drivx'], chamber.drivx_yokoya_factor)
+            self.assertEqual(factors['drivy'], chamber.drivy_yokoya_factor)
+            self.assertEqual(factors['detx'], chamber.detx_yokoya_factor)
+            self.assertEqual(factors['dety'], chamber.dety_yokoya_factor)
+    
+    def test_yokoya_snapshot(self):
+        """Test the snapshot returns q, index and the table column."""
+        chamber = Chamber(pipe_hor_m=0.030, pipe_ver_m=0.020,
+                          chamber_shape='ELLIPTICAL')
+        q, idx, column = chamber.yokoya_snapshot()
+        
+        self.assertEqual(q, chamber.yokoya_q)
+        self.assertEqual(idx, chamber.yokoya_q_idx)
+        self.assertEqual(column.shape, (5,))
+        self.assertEqual(column[0], chamber.long_yokoya_factor)
+        self.assertEqual(column[1], chamber.drivx_yokoya_factor)
+        self.assertFalse(column.flags['WRITEABLE'])
+    
+    def test_yokoya_q_updates_after_resize(self):
+        """Test Yokoya q and factors follow aperture changes."""
+        chamber = Chamber(
+            pipe_hor_m=0.030,
+            pipe_ver_m=0.020,
+            chamber_shape='ELLIPTICAL'
+        )
+        first_idx = chamber.yokoya_q_idx
+        first_long = chamber.long_yokoya_factor
+        
+        chamber.pipe_hor_m = 0.060
+        self.assertAlmostEqual(chamber.yokoya_q, 0.04 / 0.08, places=10)
+        self.assertNotEqual(chamber.yokoya_q_idx, first_idx)
+        self.assertNotAlmostEqual(chamber.long_yokoya_factor, first_long, places=4)
+        
+        chamber.pipe_ver_m = 0.060
+        self.assertAlmostEqual(chamber.yokoya_q, 0.0, places=10)
+        self.assertEqual(chamber.yokoya_q_idx, 0)
+    
+    def test_yokoya_tables_contiguous_float64(self):
+        """Test the shared Yokoya tables are read-only C-contiguous float64."""
+        from pytlwall import chamber as chamber_module
+        for shape in ('CIRCULAR', 'ELLIPTICAL', 'RECTANGULAR'):
+            table = chamber_module._get_yoko_table(shape)
+            self.assertEqual(table.dtype, np.float64)
+            self.assertTrue(table.flags['C_CONTIGUOUS'])
+            self.assertFalse(table.flags['WRITEABLE'])
+        self.assertEqual(chamber_module.yoko_q.dtype, np.float64)
+        self.assertTrue(chamber_module.yoko_q.flags['C_CONTIGUOUS'])
+    
     def test_yokoya_factors_positive(self):
         """Test that driving Yokoya factors are positive."""
         chamber = Chamber(
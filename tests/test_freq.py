@@ -203,6 +203,14 @@ class TestFrequenciesProperties(unittest.TestCase):
         with self.assertRaises(AttributeError):
             freq.freq = np.array([1, 2, 3])
     
+    def test_freq_array_is_write_protected(self):
+        """Test the freq array cannot be modified in place."""
+        for freq in (Frequencies(fmin=0, fmax=6, fstep=2),
+                     Frequencies(freq_list=[1e3, 1e4])):
+            self.assertFalse(freq.freq.flags['WRITEABLE'])
+            with self.assertRaises(ValueError):
+                freq.freq[0] = 5.0
+    
     def test_fmin_setter(self):
         """Test fmin setter."""
         freq = Frequencies()
@@ -408,6 +416,29 @@ class TestFrequenciesNumericalStability(unittest.TestCase):
         # Should be identical
         np.testing.assert_array_equal(freq1.freq, original_freq)
     
+    def test_matches_per_decade_arange(self):
+        """Test the generated array equals a decade-by-decade np.arange."""
+        for fmin, fmax, fstep in ((0, 8, 2), (0.5, 4.5, 2), (-2, 3, 2),
+                                  (3, 5, 1.5), (0, 3, 2.3)):
+            expected = []
+            for p in np.arange(1, fmax - fmin + 1):
+                v1 = (1 + (10 ** (1 - fstep))) * 10.0 ** (fmin - 1 + p)
+                v2 = 10.0 ** (fmin + p)
+                v3 = 10.0 ** (fmin - 1 + p - (fstep - 1))
+                expected.append(np.arange(v1, v2 + v3, v3))
+            freq = Frequencies(fmin=fmin, fmax=fmax, fstep=fstep)
+            np.testing.assert_array_equal(freq.freq, np.concatenate(expected))
+    
+    def test_same_exponents_share_cached_array(self):
+        """Test equal exponents reuse one read-only cached array."""
+        freq1 = Frequencies(fmin=2, fmax=5, fstep=2)
+        freq2 = Frequencies(fmin=2.0, fmax=5.0, fstep=2.0)
+        
+        self.assertIs(freq1.freq, freq2.freq)
+        self.assertFalse(freq1.freq.flags['WRITEABLE'])
+        with self.assertRaises(ValueError):
+            freq1.freq[0] = 1.0
+    
     def test_precision_maintained(self):
         """Test that frequency values maintain precision."""
         freq = Frequencies(fmin=6, fmax=6, fstep=1)
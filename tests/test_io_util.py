@@ -89,6 +89,22 @@ class TestReadFrequencyTxt(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_read_frequency_column_is_standalone(self):
+        """Test that a column of a wider table does not keep the table alive."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            for i in range(10):
+                f.write(f"{i} {i}.5e3 {i * 100} 1 2\n")
+            temp_file = f.name
+        
+        try:
+            freqs = io_util.read_frequency_txt(temp_file, column=1, unit='kHz')
+            
+            self.assertIsNone(freqs.base)
+            self.assertTrue(freqs.flags.c_contiguous)
+            self.assertAlmostEqual(freqs[1], 1.5e6)
+        finally:
+            os.unlink(temp_file)
+    
     def test_read_frequency_with_unit_conversion(self):
         """Test reading frequency with unit conversion."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
@@ -184,6 +200,24 @@ class TestReadImpedanceFile(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_read_impedance_file_real_imag(self):
+        """Test return_complex=False returns separate Re/Im arrays."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.dat', delete=False) as f:
+            f.write("1.0\t1.5e-3\t2.5e-3\n")
+            f.write("2.0\t1.6e-3\t2.6e-3\n")
+            temp_file = f.name
+        
+        try:
+            freqs, re_, im_ = io_util.read_impedance_file(
+                temp_file, unit='kHz', return_complex=False
+            )
+            
+            np.testing.assert_array_equal(freqs, [1.0e3, 2.0e3])
+            np.testing.assert_array_equal(re_, [1.5e-3, 1.6e-3])
+            np.testing.assert_array_equal(im_, [2.5e-3, 2.6e-3])
+        finally:
+            os.unlink(temp_file)
+    
     def test_read_impedance_file_with_header(self):
         """Test reading impedance file with header."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.dat', delete=False) as f:
@@ -201,6 +235,36 @@ class TestReadImpedanceFile(unittest.TestCase):
             os.unlink(temp_file)
 
 
+class TestFastLoadtxt(unittest.TestCase):
+    """Test the _fast_loadtxt table reader."""
+    
+    def _write(self, text):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+    
+    def test_matches_numpy_loadtxt(self):
+        """Test the result equals np.loadtxt(..., ndmin=2)."""
+        temp_file = self._write("f Re Im\n  1.0e3\t1.5e-3  2.5e-3\n# note\n1.0e4 1.6e-3 2.6e-3\n")
+        
+        data = io_util._fast_loadtxt(temp_file, None, 1)
+        expected = np.loadtxt(temp_file, skiprows=1, ndmin=2)
+        
+        self.assertEqual(data.dtype, np.float64)
+        np.testing.assert_array_equal(data, expected)
+    
+    def test_without_pandas(self):
+        """Test the numpy fallback gives the same 2D table."""
+        from unittest import mock
+        temp_file = self._write("1.0,2.0\n3.0,4.0\n")
+        
+        with mock.patch.object(io_util, "PANDAS_AVAILABLE", False):
+            data = io_util._fast_loadtxt(temp_file, ",")
+        
+        np.testing.assert_array_equal(data, [[1.0, 2.0], [3.0, 4.0]])
+
+
 class TestLoadGeometryFunctions(unittest.TestCase):
     """Test geometry loading functions."""
     
@@ -529,6 +593,44 @@ class TestFallbackBehavior(unittest.TestCase):
                     lines = f.readlines()
                 self.assertGreater(len(lines), 0)
     
+    @unittest.skipUnless(io_util.OPENPYXL_AVAILABLE, "openpyxl is not installed")
+    def test_xlsx_round_trip(self):
+        """Test xlsx export writes the header and values without pandas."""
+        from openpyxl import load_workbook
+        freqs = np.array([1e3, 1e4])
+        Z = np.array([1+2j, 3+4j])
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = io_util.print_impedance_output(
+                freqs=freqs,
+                imped_dict={'ZLong': Z},
+                savedir=tmpdir,
+                savename='test.xlsx',
+            )
+            rows = list(load_workbook(output_path).active.values)
+        
+        self.assertEqual(rows[0], ('f [Hz]', 'Re(ZLong)', 'Im(ZLong)'))
+        self.assertEqual(rows[1:], [(1e3, 1.0, 2.0), (1e4, 3.0, 4.0)])
+    
+    @unittest.skipUnless(io_util.OPENPYXL_AVAILABLE, "openpyxl is not installed")
+    def test_xlsx_sheets_from_generator(self):
+        """Test one workbook with one sheet per impedance table."""
+        from openpyxl import load_workbook
+        freqs = np.array([1e3, 1e4])
+        tables = (
+            (f'el_{i}', freqs, {'ZLong': np.array([i + 1j, i + 2j])})
+            for i in range(3)
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = io_util.save_impedance_sheets_xlsx(Path(tmpdir) / 'all.xlsx', tables)
+            wb = load_workbook(path)
+            self.assertEqual(wb.sheetnames, ['el_0', 'el_1', 'el_2'])
+            rows = list(wb['el_2'].values)
+        
+        self.assertEqual(rows[0], ('f [Hz]', 'Re(ZLong)', 'Im(ZLong)'))
+        self.assertEqual(rows[1:], [(1e3, 2.0, 1.0), (1e4, 2.0, 2.0)])
+    
     def test_pandas_available_flag(self):
         """Test that PANDAS_AVAILABLE flag is set correctly."""
         # This just verifies the flag exists and is boolean
@@ -611,3 +713,91 @@ class TestSaveChamberImpedance(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
+
+
+class TestSaveChamberImpedanceValidation(unittest.TestCase):
+    """Test save_chamber_impedance input validation."""
+
+    def test_size_mismatch_writes_no_files(self):
+        """Test a bad component is reported before any file is written."""
+        freqs = np.array([1e3, 1e4, 1e5])
+        impedance_results = {
+            'ZLongRe': np.array([1.0, 2.0, 3.0]),
+            'ZLongIm': np.array([0.1, 0.2, 0.3]),
+            'ZTransRe': np.array([4.0, 5.0, 6.0]),
+            'ZTransIm': np.array([0.4, 0.5]),
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                io_util.save_chamber_impedance(
+                    output_dir=tmpdir,
+                    impedance_freq=freqs,
+                    impedance_results=impedance_results,
+                )
+            self.assertEqual(list(Path(tmpdir).iterdir()), [])
+
+
+class TestImpedanceNpy(unittest.TestCase):
+    """Test the binary .npy impedance reader/writer."""
+
+    def test_round_trip_is_exact(self):
+        """Test values survive a write/read cycle bit for bit."""
+        freqs = np.logspace(3, 9, 7)
+        Z = np.exp(1j * np.linspace(0.0, 3.0, 7)) / 3.0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = io_util.write_impedance_file_npy(Path(tmpdir) / 'ZLong.bin', freqs, Z)
+            self.assertEqual(path.name, 'ZLong.bin')
+            freqs_read, Z_read = io_util.read_impedance_file_npy(path)
+
+        np.testing.assert_array_equal(freqs_read, freqs)
+        np.testing.assert_array_equal(Z_read, Z)
+
+    def test_length_mismatch_raises(self):
+        """Test mismatched inputs are rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                io_util.write_impedance_file_npy(
+                    Path(tmpdir) / 'Z.npy', np.array([1.0, 2.0]), np.array([1j])
+                )
+
+
+class TestImpedanceNpz(unittest.TestCase):
+    """Test the multi-impedance .npz reader/writer."""
+
+    def setUp(self):
+        self.freqs = np.logspace(3, 9, 5)
+        self.imped = {
+            'ZLong': np.exp(1j * np.linspace(0.0, 3.0, 5)) / 3.0,
+            'ZTrans': np.linspace(1.0, 2.0, 5) - 1j,
+        }
+
+    def test_round_trip_is_exact(self):
+        """Test all impedances survive a write/read cycle bit for bit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = io_util.save_impedances_npz(Path(tmpdir) / 'Z', self.freqs, self.imped)
+            self.assertEqual(path.suffix, '.npz')
+            freqs_read, imped_read = io_util.load_impedances_npz(path)
+
+        np.testing.assert_array_equal(freqs_read, self.freqs)
+        self.assertEqual(list(imped_read), list(self.imped))
+        for name, Z in self.imped.items():
+            np.testing.assert_array_equal(imped_read[name], Z)
+
+    def test_load_subset(self):
+        """Test reading only the requested impedances."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = io_util.save_impedances_npz(Path(tmpdir) / 'Z.npz', self.freqs, self.imped)
+            _, imped_read = io_util.load_impedances_npz(path, names=['ZTrans'])
+
+        self.assertEqual(list(imped_read), ['ZTrans'])
+
+    def test_reserved_name_raises(self):
+        """Test an impedance cannot shadow the frequency vector."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                io_util.save_impedances_npz(
+                    Path(tmpdir) / 'Z.npz', self.freqs, {'freqs': self.imped['ZLong']}
+                )
+
@@ -17,8 +17,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import unittest
 import numpy as np
 import warnings
-from pytlwall import Layer
-from pytlwall.layer import LayerValidationError
+from pytlwall import Layer, LayerArray
+from pytlwall.layer import LayerValidationError, clear_layer_cache, make_layer
 
 
 class TestLayerInitialization(unittest.TestCase):
@@ -249,6 +249,19 @@ class TestFrequencyArray(unittest.TestCase):
         
         np.testing.assert_array_equal(layer.freq_Hz, freq)
 
+    def test_frequency_array_sharing(self):
+        """Test that read-only grids are shared and writable ones copied."""
+        shared = np.logspace(6, 9, 10)
+        shared.setflags(write=False)
+        self.assertIs(Layer(freq_Hz=shared).freq_Hz, shared)
+
+        owned = np.logspace(6, 9, 10)
+        layer = Layer(freq_Hz=owned)
+        self.assertFalse(layer.freq_Hz.flags.writeable)
+        owned[0] = 1.0
+        self.assertEqual(layer.freq_Hz[0], 1e6)
+        self.assertTrue(owned.flags.writeable)
+
 
 class TestCalculatedProperties(unittest.TestCase):
     """Test frequency-dependent calculated properties."""
@@ -361,6 +374,10 @@ class TestSurfaceImpedance(unittest.TestCase):
         
         self.assertEqual(len(KZ), len(freq))
         self.assertTrue(np.iscomplexobj(KZ))
+        self.assertIs(layer.KZ, KZ)
+        np.testing.assert_allclose(
+            KZ, (1 + 1j) / (layer.sigmaPM * layer.deltaM), rtol=1e-15
+        )
     
     def test_set_surface_impedance_directly(self):
         """Test setting surface impedance directly."""
@@ -471,9 +488,22 @@ class TestMaterialExamples(unittest.TestCase):
     def test_perfect_conductor(self):
         """Test perfect electrical conductor."""
         pec = Layer(layer_type='PEC')
-        
+
         self.assertEqual(pec.layer_type, 'PEC')
 
+    def test_vacuum_and_pec_surface_impedance(self):
+        """Test that V and PEC layers return constant surface impedances."""
+        import scipy.constants as const
+        freq = np.array([1e6, 1e7, 1e8])
+        Z0 = const.physical_constants['characteristic impedance of vacuum'][0]
+
+        vacuum = Layer(layer_type='V', freq_Hz=freq)
+        np.testing.assert_array_equal(vacuum.KZ, np.full(3, Z0 + 0j))
+        np.testing.assert_allclose(vacuum.kprop, 2 * np.pi * freq / const.c)
+
+        pec = Layer(layer_type='PEC', freq_Hz=freq)
+        np.testing.assert_array_equal(pec.KZ, np.zeros(3, dtype=complex))
+
 
 class TestLayerValidation(unittest.TestCase):
     """Test comprehensive validation."""
@@ -549,6 +579,28 @@ class TestLayerConsistency(unittest.TestCase):
         self.assertEqual(len(delta2), 1)
         self.assertNotEqual(len(delta1), len(delta2))
 
+    def test_calculated_arrays_cached_until_setter(self):
+        """Test that calculated arrays are reused until a parameter changes."""
+        layer = Layer(sigmaDC=5.96e7, freq_Hz=np.logspace(6, 9, 10))
+
+        sigmaAC = layer.sigmaAC
+        self.assertIs(layer.sigmaAC, sigmaAC)
+        self.assertFalse(sigmaAC.flags.writeable)
+
+        layer.tau = 1e-12
+        self.assertIsNot(layer.sigmaAC, sigmaAC)
+        self.assertFalse(np.allclose(layer.sigmaAC, sigmaAC))
+
+    def test_unchanged_value_keeps_cache(self):
+        """Test that re-assigning the current value does not recompute."""
+        layer = Layer(sigmaDC=5.96e7, freq_Hz=np.logspace(6, 9, 10))
+
+        delta = layer.delta
+        layer.sigmaDC = 5.96e7
+        layer.layer_type = 'cw'
+        layer.freq_Hz = layer.freq_Hz
+        self.assertIs(layer.delta, delta)
+
 
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and extreme values."""
@@ -586,6 +638,118 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(len(layer.delta), 10000)
 
 
+class TestEvalAt(unittest.TestCase):
+    """Test single-frequency scalar evaluation."""
+
+    def test_matches_array_properties(self):
+        """Test that eval_at agrees with the array properties."""
+        freq = np.logspace(3, 11, 9)
+        for kwargs in ({'sigmaDC': 5.96e7, 'RQ': 1e-6},
+                       {'muinf_Hz': 3.0, 'k_Hz': 1e7, 'tau': 1e-12, 'epsr': 4.0},
+                       {'layer_type': 'V'},
+                       {'layer_type': 'PEC'}):
+            layer = Layer(freq_Hz=freq, **kwargs)
+            for i, f in enumerate(freq):
+                values = layer.eval_at(f)
+                for name, value in values.items():
+                    self.assertIsInstance(value, complex)
+                    np.testing.assert_allclose(
+                        value, getattr(layer, name)[i], rtol=1e-14
+                    )
+
+    def test_invalid_frequency(self):
+        """Test that non-positive frequencies are rejected."""
+        layer = Layer()
+        with self.assertRaises(LayerValidationError):
+            layer.eval_at(0.0)
+        with self.assertRaises(LayerValidationError):
+            layer.eval_at("abc")
+
+
+class TestMakeLayer(unittest.TestCase):
+    """Test the memoizing layer factory."""
+
+    def test_identical_parameters_share_instance(self):
+        """Test that equal parameters return one frozen instance."""
+        freq = np.logspace(6, 9, 10)
+        first = make_layer(sigmaDC=5.96e7, thick_m=1e-3, freq_Hz=freq)
+        second = make_layer(sigmaDC='5.96e7', thick_m=0.001, freq_Hz=list(freq))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, make_layer(sigmaDC=1e6, freq_Hz=freq))
+        np.testing.assert_array_equal(
+            first.KZ, Layer(sigmaDC=5.96e7, thick_m=1e-3, freq_Hz=freq).KZ
+        )
+
+    def test_shared_instance_is_frozen(self):
+        """Test that a shared instance rejects changes but not no-ops."""
+        freq = np.logspace(6, 9, 10)
+        layer = make_layer(sigmaDC=5.96e7, freq_Hz=freq)
+
+        layer.sigmaDC = 5.96e7
+        layer.freq_Hz = freq.copy()
+        with self.assertRaises(LayerValidationError):
+            layer.sigmaDC = 1e6
+        with self.assertRaises(LayerValidationError):
+            layer.freq_Hz = freq[:5]
+        with self.assertRaises(LayerValidationError):
+            layer.KZ = np.ones(10, dtype=complex)
+        layer.boundary = False
+        with self.assertRaises(LayerValidationError):
+            layer.boundary = True
+        self.assertFalse(make_layer(sigmaDC=5.96e7, freq_Hz=freq).boundary)
+
+
+    def test_clear_layer_cache_releases_instances(self):
+        """Test that clear_layer_cache drops the shared instances."""
+        freq = np.logspace(6, 9, 10)
+        first = make_layer(sigmaDC=5.96e7, freq_Hz=freq)
+        clear_layer_cache()
+        second = make_layer(sigmaDC=5.96e7, freq_Hz=freq)
+
+        self.assertIsNot(first, second)
+        np.testing.assert_array_equal(first.KZ, second.KZ)
+
+class TestLayerArray(unittest.TestCase):
+    """Test batched evaluation across layers."""
+
+    def setUp(self):
+        self.freq = np.logspace(3, 11, 50)
+        self.layers = [
+            Layer(sigmaDC=5.96e7, RQ=1e-6, freq_Hz=self.freq),
+            Layer(sigmaDC=1.45e6, muinf_Hz=3.0, k_Hz=1e7, tau=1e-12,
+                  epsr=4.0, freq_Hz=self.freq),
+            Layer(layer_type='V', boundary=True, freq_Hz=self.freq),
+        ]
+
+    def test_compute_all_matches_layers(self):
+        """Test that every batched row matches the per-layer properties."""
+        result = LayerArray(self.layers).compute_all()
+
+        for row, layer in enumerate(self.layers):
+            for name in ('sigmaAC', 'sigmaPM', 'mur', 'delta', 'deltaM',
+                         'RS', 'sigmaDC_R', 'KZ', 'kprop'):
+                self.assertEqual(result[name].shape, (3, len(self.freq)))
+                np.testing.assert_allclose(
+                    result[name][row], getattr(layer, name), rtol=1e-14
+                )
+
+    def test_round_trip_through_rows(self):
+        """Test that indexing rebuilds an equivalent Layer."""
+        batch = LayerArray(self.layers)
+        self.assertEqual(len(batch), 3)
+        np.testing.assert_array_equal(batch.sigmaDC, [5.96e7, 1.45e6, 1.0e6])
+
+        rebuilt = batch[1]
+        self.assertEqual(rebuilt.to_array_row(), self.layers[1].to_array_row())
+        self.assertTrue(batch[2].boundary)
+
+    def test_empty_layers(self):
+        """Test that an empty batch is rejected."""
+        with self.assertRaises(LayerValidationError):
+            LayerArray([])
+
+
 if __name__ == "__main__":
     print("\n" + "="*10 + " Testing layer module " + "="*10)
     unittest.main(verbosity=2)
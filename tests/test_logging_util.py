@@ -0,0 +1,170 @@
+"""
+Unit tests for the logging_util module.
+
+These tests verify:
+1. Log file naming
+2. Records reaching the log file through the queue listener
+3. Reconfiguration and shutdown
+"""
+
+# Add parent directory to path to allow imports when running standalone
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import logging
+import logging.handlers
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from pytlwall import logging_util
+
+
+class TestBufferedFileHandler(unittest.TestCase):
+    """Test the buffered log file handler."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.tmp_dir.name) / "buffered.log"
+        self.logger = logging.getLogger("test_logging_util.buffered")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.tmp_dir.cleanup()
+
+    def _add_handler(self, **kwargs):
+        handler = logging_util.BufferedFileHandler(
+            self.log_path, mode="w", encoding="utf-8", **kwargs
+        )
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_records_buffered_until_close(self):
+        """Test that records are held in the buffer, then written on close."""
+        handler = self._add_handler(flush_interval=3600.0)
+        self.logger.info("buffered line")
+        self.assertEqual(self.log_path.read_text(encoding="utf-8"), "")
+
+        self.logger.removeHandler(handler)
+        handler.close()
+        self.assertEqual(self.log_path.read_text(encoding="utf-8"), "buffered line\n")
+
+    def test_warning_flushed_immediately(self):
+        """Test that WARNING and above do not wait for the periodic flush."""
+        self._add_handler(flush_interval=3600.0)
+        self.logger.info("buffered line")
+        self.logger.error("error line")
+        self.assertEqual(
+            self.log_path.read_text(encoding="utf-8"), "buffered line\nerror line\n"
+        )
+
+    def test_periodic_flush(self):
+        """Test that the background thread flushes the buffer."""
+        self._add_handler(flush_interval=0.01)
+        self.logger.info("flushed line")
+
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if self.log_path.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.log_path.read_text(encoding="utf-8"), "flushed line\n")
+
+
+class TestLoggingSetup(unittest.TestCase):
+    """Test setup_logging / shutdown_logging."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+
+    def tearDown(self):
+        logging_util.shutdown_logging()
+        for handler in self.root.handlers[:]:
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+        self.tmp_dir.cleanup()
+
+    def _setup(self, **kwargs):
+        config = logging_util.LogConfig(
+            log_dir=self.tmp_dir.name, console_output=False, **kwargs
+        )
+        return logging_util.setup_logging(config)
+
+    def test_log_path_without_timestamp(self):
+        """Test the log filename when no timestamp is requested."""
+        log_path = self._setup(log_basename="run", add_timestamp=False)
+        self.assertEqual(log_path, Path(self.tmp_dir.name) / "run.log")
+
+    def test_log_path_uses_call_timestamp(self):
+        """Test that the timestamp is taken when the path is generated."""
+        before = datetime.now().replace(microsecond=0)
+        log_path = self._setup(log_basename="run")
+        after = datetime.now()
+        stamp = datetime.strptime(log_path.stem[len("run_"):], "%Y%m%d_%H%M%S")
+        self.assertTrue(before <= stamp <= after)
+        self.assertEqual(log_path.suffix, ".log")
+
+    def test_section_header_skipped_below_info(self):
+        """Test that section headers are not emitted at WARNING verbosity."""
+        log_path = self._setup(verbosity=1)
+        logger = logging_util.get_logger("test_logging_util")
+        logging_util.log_section_header(logger, "TITLE")
+        logger.warning("done")
+        logging_util.shutdown_logging()
+
+        text = log_path.read_text(encoding="utf-8")
+        self.assertNotIn("TITLE", text)
+        self.assertIn("done", text)
+
+    def test_root_logger_only_enqueues(self):
+        """Test that the root logger carries a single QueueHandler."""
+        self._setup()
+        self.assertEqual(len(self.root.handlers), 1)
+        self.assertIsInstance(self.root.handlers[0], logging.handlers.QueueHandler)
+
+    def test_records_written_after_shutdown(self):
+        """Test that queued records are in the file once logging is shut down."""
+        log_path = self._setup(verbosity=2)
+        logger = logging_util.get_logger("test_logging_util")
+        logger.info("value %s", 42)
+        logger.debug("hidden")
+        logging_util.shutdown_logging()
+
+        text = log_path.read_text(encoding="utf-8")
+        self.assertIn("[INFO] value 42", text)
+        self.assertNotIn("hidden", text)
+
+    def test_record_attributes_left_enabled(self):
+        """Test that setup does not turn off the global record attributes."""
+        saved = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+        self._setup()
+        self.assertEqual(
+            (logging.logThreads, logging.logProcesses, logging.logMultiprocessing),
+            saved,
+        )
+
+    def test_reconfigure_replaces_listener(self):
+        """Test that a second setup flushes the first log file."""
+        first = self._setup(log_basename="first", add_timestamp=False)
+        logging_util.get_logger("test_logging_util").warning("first run")
+        second = self._setup(log_basename="second", add_timestamp=False)
+
+        self.assertIn("first run", first.read_text(encoding="utf-8"))
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.root.handlers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
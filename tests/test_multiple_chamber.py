@@ -151,6 +151,15 @@ class TestMultipleChamberDataLoading(unittest.TestCase):
         self.assertIsInstance(freqs, np.ndarray)
         self.assertGreater(len(freqs), 0)
 
+    def test_frequencies_read_only_float64(self):
+        """Test that frequencies keep full precision and cannot be modified."""
+        self.mc.load()
+        freqs = self.mc.get_frequencies()
+        self.assertEqual(freqs.dtype, np.float64)
+        self.assertFalse(freqs.flags.writeable)
+        with self.assertRaises(ValueError):
+            freqs[0] = 0.0
+
 
 class TestMultipleChamberCfgHandling(unittest.TestCase):
     """Test configuration file handling."""
@@ -231,6 +240,28 @@ class TestMultipleChamberCalculation(unittest.TestCase):
         self.assertIsInstance(impedances, dict)
         self.assertGreater(len(impedances), 0)
     
+    def test_elements_copy_parsed_templates(self):
+        """Test that elements share the parsed cfg but not the geometry."""
+        mc = MultipleChamber(
+            apertype_file="apertype2.txt",
+            geom_file="b_L_betax_betay.txt",
+            input_dir=self.input_dir,
+            out_dir=self.output_dir,
+        )
+        mc.load()
+        same = [i for i, a in enumerate(mc.apertypes) if a == mc.apertypes[0]][:2]
+        self.assertEqual(len(same), 2)
+
+        wall_a = mc._build_wall_for_element(same[0])
+        wall_b = mc._build_wall_for_element(same[1])
+        template, _ = mc._get_templates(mc.apertypes[0])
+
+        self.assertIsNot(wall_a.chamber, wall_b.chamber)
+        self.assertIsNot(wall_a.chamber, template)
+        self.assertEqual(wall_a.chamber.pipe_len_m, mc.L_list[same[0]])
+        self.assertEqual(wall_b.chamber.pipe_len_m, mc.L_list[same[1]])
+        self.assertIs(wall_a.chamber.layers, template.layers)
+
     def test_calculate_element_returns_arrays(self):
         """Test that calculate_element returns numpy arrays."""
         mc = MultipleChamber(
@@ -302,6 +333,299 @@ class TestMultipleChamberIntegration(unittest.TestCase):
         self.assertEqual(mc.out_dir, out_dir.resolve())
 
 
+class TestMultipleChamberCalculateAll(unittest.TestCase):
+    """Test calculate_all on a short lattice."""
+
+    N_ELEMENTS = 2
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a short lattice from the first elements of the test input."""
+        src = Path(__file__).parent / "input" / "multiple"
+        if not src.exists():
+            raise unittest.SkipTest(f"Test input directory not found: {src}")
+        cls.tmp_dir = Path(tempfile.mkdtemp())
+        cls.input_dir = cls.tmp_dir / "input"
+        cls.input_dir.mkdir()
+        for cfg in src.glob("*.cfg"):
+            shutil.copy(cfg, cls.input_dir)
+        for name in ("apertype2.txt", "b_L_betax_betay.txt"):
+            lines = (src / name).read_text().splitlines()[: cls.N_ELEMENTS]
+            (cls.input_dir / name).write_text("\n".join(lines) + "\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up."""
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def _serial(self):
+        """Serial run shared by the tests of this class."""
+        cls = type(self)
+        if getattr(cls, "_serial_mc", None) is None:
+            cls._serial_mc = self._run("serial", 1)
+        return cls._serial_mc
+
+    def _run(self, tag, max_workers):
+        mc = MultipleChamber(
+            apertype_file="apertype2.txt",
+            geom_file="b_L_betax_betay.txt",
+            input_dir=self.input_dir,
+            out_dir=self.tmp_dir / tag,
+        )
+        mc.calculate_all(max_workers=max_workers)
+        return mc
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes give the same totals and files."""
+        serial = self._serial()
+        parallel = self._run("parallel", 2)
+
+        tot_s = serial.get_totals()
+        tot_p = parallel.get_totals()
+        self.assertEqual(list(tot_s), list(tot_p))
+        for name in tot_s:
+            np.testing.assert_array_equal(tot_s[name], tot_p[name])
+        for idx in range(self.N_ELEMENTS):
+            self.assertIsNotNone(parallel.get_element_data(idx))
+
+    def test_workers_use_loaded_state(self):
+        """Test that workers calculate from the parent's in-memory lattice."""
+        totals = []
+        for tag, max_workers in (("edited_serial", 1), ("edited_parallel", 2)):
+            mc = MultipleChamber(
+                apertype_file="apertype2.txt",
+                geom_file="b_L_betax_betay.txt",
+                input_dir=self.input_dir,
+                out_dir=self.tmp_dir / tag,
+            )
+            mc.load()
+            mc.b_list[1] *= 2.0
+            mc.calculate_all(max_workers=max_workers)
+            totals.append(mc.get_totals())
+
+        for name, Z in totals[0].items():
+            np.testing.assert_array_equal(totals[1][name], Z)
+        self.assertFalse(
+            np.array_equal(totals[0]["ZLong"], self._serial().get_totals()["ZLong"])
+        )
+
+    @unittest.skipUnless(
+        __import__("multiprocessing").get_start_method() == "fork",
+        "patched method only reaches forked workers",
+    )
+    def test_worker_records_reach_parent_loggers(self):
+        """Test that records logged in worker processes are not lost."""
+        import logging
+        from unittest import mock
+
+        calculate = MultipleChamber._calculate_element_impedances
+
+        def logging_calculate(mc, index):
+            logging.getLogger("pytlwall.multiple_chamber").warning(
+                "worker element %d in pid %d", index, os.getpid()
+            )
+            return calculate(mc, index)
+
+        records = []
+        handler = logging.Handler(level=logging.WARNING)
+        handler.emit = records.append
+        mc_logger = logging.getLogger("pytlwall.multiple_chamber")
+        mc_logger.addHandler(handler)
+        try:
+            with mock.patch.object(
+                MultipleChamber, "_calculate_element_impedances", logging_calculate
+            ):
+                self._run("worker_logs", 2)
+        finally:
+            mc_logger.removeHandler(handler)
+
+        worker_lines = [
+            r.getMessage() for r in records if "worker element" in r.getMessage()
+        ]
+        self.assertEqual(len(worker_lines), self.N_ELEMENTS)
+        self.assertFalse(any(f"pid {os.getpid()}" in line for line in worker_lines))
+
+    def test_default_runs_without_worker_processes(self):
+        """Test that calculate_all() is serial unless workers are requested."""
+        from unittest import mock
+        from pytlwall import multiple_chamber
+
+        mc = MultipleChamber(
+            apertype_file="apertype2.txt",
+            geom_file="b_L_betax_betay.txt",
+            input_dir=self.input_dir,
+            out_dir=self.tmp_dir / "default",
+        )
+        with mock.patch.object(multiple_chamber, "ProcessPoolExecutor") as pool:
+            mc.calculate_all()
+        pool.assert_not_called()
+        for name, Z in self._serial().get_totals().items():
+            np.testing.assert_array_equal(mc.get_totals()[name], Z)
+
+    def test_write_error_logged_without_losing_totals(self):
+        """Test that a failed background write is reported per element."""
+        from unittest import mock
+        from pytlwall import io_util
+
+        save = io_util.save_impedances_npz
+
+        def failing_save(path, *args):
+            if "chamber_001" in str(path):
+                raise OSError("disk full")
+            return save(path, *args)
+
+        with mock.patch.object(io_util, "save_impedances_npz", side_effect=failing_save):
+            with self.assertLogs("pytlwall.multiple_chamber", level="ERROR") as logs:
+                mc = self._run("write_error", 1)
+
+        self.assertTrue(any("element 1" in line for line in logs.output))
+        self.assertIsNone(mc.get_element_data(1))
+        self.assertIsNotNone(mc.get_element_data(0))
+        tot = mc.get_totals()
+        for name, Z in self._serial().get_totals().items():
+            np.testing.assert_array_equal(tot[name], Z)
+
+    def test_element_data_round_trip(self):
+        """Test that element files hold the exact calculated impedances."""
+        mc = self._serial()
+        expected = mc.calculate_element(1)
+
+        data = mc.get_element_data(1)
+        self.assertEqual(data["index"], 1)
+        np.testing.assert_array_equal(data["freqs"], mc.get_frequencies())
+        self.assertEqual(list(data["data"]), list(expected))
+        for name, Z in expected.items():
+            np.testing.assert_array_equal(data["data"][name], Z)
+
+    def test_element_data_single_channel(self):
+        """Test reading a single impedance channel of an element."""
+        mc = self._serial()
+        full = mc.get_element_data(0)["data"]
+
+        data = mc.get_element_data(0, channel="ZLong")
+        self.assertEqual(list(data["data"]), ["ZLong"])
+        np.testing.assert_array_equal(data["data"]["ZLong"], full["ZLong"])
+        self.assertIsNone(mc.get_element_data(0, channel="NoSuchChannel"))
+
+    def test_plot_element_saves_pngs(self):
+        """Test that element plots are written and no figure is left open."""
+        import matplotlib.pyplot as plt
+
+        mc = self._serial()
+        n_figs = len(plt.get_fignums())
+        save_dir = self.tmp_dir / "plots_img"
+        mc.plot_element(0, save_dir=save_dir)
+
+        self.assertTrue((save_dir / "ZLong.png").exists())
+        self.assertEqual(len(plt.get_fignums()), n_figs)
+
+    def test_export_elements_excel(self):
+        """Test that all elements are exported to one workbook."""
+        from openpyxl import load_workbook
+
+        mc = self._serial()
+        path = mc.export_elements_excel(self.tmp_dir / "elements.xlsx")
+        wb = load_workbook(path, read_only=True)
+        self.assertEqual(wb.sheetnames, ["chamber_000", "chamber_001"])
+        header = next(wb["chamber_001"].iter_rows(max_row=1, values_only=True))
+        self.assertEqual(header[:3], ("f [Hz]", "Re(ZLong)", "Im(ZLong)"))
+        wb.close()
+
+    def test_missing_element_data(self):
+        """Test that an element without a file returns None."""
+        mc = self._serial()
+        self.assertIsNone(mc.get_element_data(self.N_ELEMENTS))
+
+
+class TestMultipleChamberDuplicates(unittest.TestCase):
+    """Test reuse of results for elements with identical inputs."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a lattice whose last element repeats the first one."""
+        src = Path(__file__).parent / "input" / "multiple"
+        if not src.exists():
+            raise unittest.SkipTest(f"Test input directory not found: {src}")
+        cls.tmp_dir = Path(tempfile.mkdtemp())
+        cls.input_dir = cls.tmp_dir / "input"
+        cls.input_dir.mkdir()
+        for cfg in src.glob("*.cfg"):
+            shutil.copy(cfg, cls.input_dir)
+        for name in ("apertype2.txt", "b_L_betax_betay.txt"):
+            lines = (src / name).read_text().splitlines()[:2]
+            (cls.input_dir / name).write_text("\n".join(lines + lines[:1]) + "\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up."""
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def _make(self, tag):
+        mc = MultipleChamber(
+            apertype_file="apertype2.txt",
+            geom_file="b_L_betax_betay.txt",
+            input_dir=self.input_dir,
+            out_dir=self.tmp_dir / tag,
+        )
+        mc.load()
+        return mc
+
+    def test_duplicate_sources(self):
+        """Test that the repeated element maps to its first occurrence."""
+        self.assertEqual(self._make("sources")._duplicate_sources(), [0, 1, 0])
+
+    def test_duplicates_reused_serial_and_parallel(self):
+        """Test totals and element files when a duplicate is reused."""
+        reference = self._make("reference")
+        expected = {}
+        for idx in range(reference.n_elements):
+            for name, Z in reference.calculate_element(idx).items():
+                expected[name] = expected.get(name, 0) + Z
+
+        for tag, max_workers in (("serial", 1), ("parallel", 2)):
+            mc = self._make(tag)
+            mc.calculate_all(max_workers=max_workers)
+            totals = mc.get_totals()
+            for name, Z in expected.items():
+                np.testing.assert_array_equal(totals[name], Z)
+            first = mc.get_element_data(0)["data"]
+            last = mc.get_element_data(2)["data"]
+            for name in first:
+                np.testing.assert_array_equal(last[name], first[name])
+
+
+class TestMultipleChamberAccumulation(unittest.TestCase):
+    """Test accumulation of total impedances."""
+
+    def setUp(self):
+        self.mc = MultipleChamber(
+            apertype_file="apertype2.txt",
+            geom_file="b_L_betax_betay.txt",
+        )
+
+    def test_accumulate_sums_channels(self):
+        """Test that totals are the element-wise sum per channel."""
+        a = {"ZLong": np.array([1 + 1j, 2 + 0j]), "ZTrans": np.array([0j, 3j])}
+        b = {"ZLong": np.array([1 + 0j, 1 + 1j]), "ZTrans": np.array([1 + 0j, 1j])}
+        self.mc._accumulate_impedances(a)
+        self.mc._accumulate_impedances(b)
+        self.mc._calculated = True
+
+        totals = self.mc.get_totals()
+        self.assertEqual(list(totals), ["ZLong", "ZTrans"])
+        np.testing.assert_array_equal(totals["ZLong"], [2 + 1j, 3 + 1j])
+        np.testing.assert_array_equal(totals["ZTrans"], [1 + 0j, 4j])
+
+    def test_totals_share_single_buffer(self):
+        """Test that per-channel totals are rows of one buffer."""
+        self.mc._accumulate_impedances(
+            {"ZLong": np.ones(4, dtype=complex), "ZTrans": np.ones(4, dtype=complex)}
+        )
+        self.mc._calculated = True
+        for Z in self.mc.get_totals().values():
+            self.assertTrue(np.shares_memory(Z, self.mc._totals_soa))
+
+
 class TestMultipleChamberHelpers(unittest.TestCase):
     """Test helper methods."""
     
@@ -324,7 +648,24 @@ class TestMultipleChamberHelpers(unittest.TestCase):
         """Test handling of NaN values."""
         Z = np.full(100, np.nan)
         self.assertFalse(MultipleChamber._is_non_trivial_impedance(Z))
+
+    def test_is_non_trivial_impedance_nan_and_zeros(self):
+        """Test that NaN mixed with zeros is trivial, with a value it is not."""
+        Z = np.array([np.nan, 0.0, 0.0])
+        self.assertFalse(MultipleChamber._is_non_trivial_impedance(Z))
+        self.assertFalse(MultipleChamber._is_non_trivial_impedance(Z + 0j))
+        Z[2] = 1e-3
+        self.assertTrue(MultipleChamber._is_non_trivial_impedance(Z))
+        self.assertTrue(MultipleChamber._is_non_trivial_impedance(Z * 1j))
     
+    def test_is_non_trivial_impedance_across_blocks(self):
+        """Test arrays longer than one scan block."""
+        Z = np.zeros(10000, dtype=complex)
+        Z[:5000] = np.nan
+        self.assertFalse(MultipleChamber._is_non_trivial_impedance(Z))
+        Z[-1] = 1j
+        self.assertTrue(MultipleChamber._is_non_trivial_impedance(Z))
+
     def test_guess_imped_type_long(self):
         """Test impedance type guessing for longitudinal."""
         self.assertEqual(MultipleChamber._guess_imped_type("ZLong"), "long")
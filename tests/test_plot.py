@@ -1,5 +1,7 @@
 import os
 import unittest
+import numpy as np
+import matplotlib.pyplot as plt
 import pytlwall
 import pytlwall.plot_util as plot
 
@@ -64,6 +66,32 @@ class TestPlot(unittest.TestCase):
         plot.plot_list_Z_vs_f(f, list_Z, list_label, 'T', title,
                               savedir, savename, 'log', 'symlog')
 
+    def test_plot_session_reuses_figure(self):
+        """Testing that a plot session saves several plots from one figure"""
+        read_cfg = pytlwall.CfgIo(self.cfg_file)
+        mywall = read_cfg.read_pytlwall()
+        mywall.calc_ZLong()
+        mywall.calc_ZTrans()
+
+        savedir = os.path.join(os.path.dirname(__file__), 'output', 'one_layer', 'img')
+        n_figs = len(plt.get_fignums())
+        with plot.PlotSession(dpi=50) as session:
+            fig = session.fig
+            for name in ('ZLong', 'ZTrans'):
+                Z = getattr(mywall, name)
+                self.assertTrue(plot.draw_Z_vs_f(session.ax, mywall.f, Z, 'L',
+                                                 name, 'log', 'log'))
+                session.save(savedir, f'{name}_session.png')
+                self.assertIs(session.fig, fig)
+                self.assertTrue(os.path.exists(os.path.join(savedir, f'{name}_session.png')))
+        self.assertEqual(len(plt.get_fignums()), n_figs)
+
+    def test_draw_without_data(self):
+        """Testing that drawing an all-NaN impedance reports no data"""
+        with plot.PlotSession() as session:
+            Z = np.full(5, complex(np.nan, np.nan))
+            self.assertFalse(plot.draw_Z_vs_f(session.ax, np.arange(5.0), Z))
+
 
 if __name__ == '__main__':
     unittest.main()